@@ -0,0 +1,247 @@
+"""
+Admission control for the waitress thread pool.
+
+Every request is put into an endpoint class (interactive writes, interactive
+reads, heavy reports, logins or SSE streams). Each class has its own concurrency
+limit, queue timeout and PostgreSQL statement_timeout. When a class is full,
+new requests wait up to the queue timeout. After that they fail fast with
+503 and Retry-After.
+
+The limits are derived from the size of the thread pool (ADMISSION_THREADS,
+default 16, set in start_server.bat; ``flask serve`` passes SERVE_THREADS).
+Streams hold a thread for as long as they are open, so they get their own
+share: ADMISSION_STREAM_LIMIT, default a quarter of the pool. The other
+classes split what is left. A browser holds one stream however many tabs it
+has open, so size the stream share to the number of stations and raise the
+pool with it. Logins wait on the password hashing pool, so their class is no
+wider than PASSWORD_HASH_WORKERS and a burst at shift change queues (and then
+gets 503) without taking the write slots. All the limits together stay below
+the pool size, so a burst of reports or streams can never hold every worker
+thread while unit scans and checklist saves wait behind it.
+Limits can be overridden with ADMISSION_<CLASS>_LIMIT,
+ADMISSION_<CLASS>_QUEUE_TIMEOUT (seconds) and
+ADMISSION_<CLASS>_STATEMENT_TIMEOUT_MS.
+
+Views wrapped in @cached_response or @coalesce_requests take their slot only
+when they actually compute (``slot()``), so cache hits and single-flight
+followers do not use up the report class.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+from flask import current_app, g, jsonify, request
+
+import passwords
+
+WRITE = 'write'
+READ = 'read'
+REPORT = 'report'
+STREAM = 'stream'
+LOGIN = 'login'
+
+THREADS = int(os.getenv('ADMISSION_THREADS', '16'))
+
+TIMEOUTS = {
+    # class: (queue timeout seconds, statement timeout ms)
+    WRITE: (10.0, 5000),
+    READ: (5.0, 10000),
+    REPORT: (2.0, 60000),
+    LOGIN: (passwords.QUEUE_TIMEOUT_SECONDS, 5000),
+    # A full stream class answers at once; streams run no SQL.
+    STREAM: (0.0, 0),
+}
+
+
+def default_limits(threads, streams=None):
+    """
+    Per-class limits for a pool of ``threads`` threads, leaving one for exempt
+    endpoints. ``streams`` defaults to a quarter of the pool.
+    """
+    if streams is None:
+        streams = max(1, threads // 4)
+    budget = max(3, threads - streams - 1)
+    report = max(1, budget // 4)
+    login = max(1, min(passwords.WORKERS, budget // 4))
+    write = max(1, (budget - report - login) // 2)
+    return {
+        WRITE: write,
+        READ: max(1, budget - report - login - write),
+        REPORT: report,
+        LOGIN: login,
+        STREAM: streams,
+    }
+
+REPORT_ENDPOINTS = {
+    'shipments.get_dashboard_stats',
+    'shipments.get_stats_over_time',
+    'shipments.get_weekly_fpy_stats',
+    'shipments.get_overall_fpy_stats',
+    'shipments.get_fpy_series',
+    'shipments.get_fpy_spc',
+    'shipments.get_manifest_data',
+    'shipments.get_weekly_shipments',
+    'dashboard.get_dashboard',
+    'cube.drill_down',
+}
+
+STREAM_ENDPOINTS = {'events.stream_events'}
+
+LOGIN_ENDPOINTS = {'auth.login'}
+
+# DB-free endpoints that must not hold a slot.
+EXEMPT_ENDPOINTS = {
+    # Its sub-requests are admitted one by one.
+    'batch.run_batch',
+    'metrics',
+    'serve',
+    'static',
+}
+
+
+class EndpointClass:
+    def __init__(self, name, limit, queue_timeout, statement_timeout_ms):
+        self.name = name
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self.statement_timeout_ms = statement_timeout_ms
+        self._slots = threading.BoundedSemaphore(limit)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    def acquire(self):
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self.rejected += 1
+            return False
+        with self._lock:
+            self.active += 1
+            self.admitted += 1
+        return True
+
+    def release(self):
+        with self._lock:
+            self.active -= 1
+        self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'limit': self.limit,
+                'active': self.active,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'queue_timeout_seconds': self.queue_timeout,
+                'statement_timeout_ms': self.statement_timeout_ms,
+            }
+
+
+class Busy(Exception):
+    """A deferred request could not get its slot in time."""
+
+    def __init__(self, endpoint_class):
+        super().__init__(endpoint_class.name)
+        self.endpoint_class = endpoint_class
+
+
+def _load_classes(threads):
+    classes = {}
+    streams = os.getenv('ADMISSION_STREAM_LIMIT')
+    for name, limit in default_limits(threads, int(streams) if streams else None).items():
+        queue_timeout, statement_timeout_ms = TIMEOUTS[name]
+        prefix = f"ADMISSION_{name.upper()}_"
+        classes[name] = EndpointClass(
+            name,
+            int(os.getenv(prefix + 'LIMIT', limit)),
+            float(os.getenv(prefix + 'QUEUE_TIMEOUT', queue_timeout)),
+            int(os.getenv(prefix + 'STATEMENT_TIMEOUT_MS', statement_timeout_ms)),
+        )
+    return classes
+
+
+endpoint_classes = _load_classes(THREADS)
+
+
+def configure(threads):
+    """Resize the classes for a pool of ``threads`` threads. Only call before serving requests."""
+    endpoint_classes.clear()
+    endpoint_classes.update(_load_classes(threads))
+
+
+def classify(endpoint, method):
+    if method == 'OPTIONS' or endpoint is None or endpoint in EXEMPT_ENDPOINTS:
+        return None
+    if endpoint in STREAM_ENDPOINTS:
+        return STREAM
+    if endpoint in REPORT_ENDPOINTS:
+        return REPORT
+    if endpoint in LOGIN_ENDPOINTS:
+        return LOGIN
+    if method in ('GET', 'HEAD'):
+        return READ
+    return WRITE
+
+
+@contextmanager
+def slot():
+    """
+    Take the slot a deferred view skipped in before_request, for the
+    duration of the request. A no-op if the request already holds one.
+    """
+    endpoint_class = g.pop('admission_deferred', None)
+    if endpoint_class is not None:
+        if not endpoint_class.acquire():
+            raise Busy(endpoint_class)
+        g.admission_class = endpoint_class
+    yield
+
+
+def defer_current_request():
+    """
+    Admit a request context that never ran before_request (a background cache
+    refresh) like a deferred view: set its statement_timeout and leave the
+    slot to ``slot()``.
+    """
+    class_name = classify(request.endpoint, request.method)
+    if class_name is None:
+        return
+    endpoint_class = endpoint_classes[class_name]
+    g.statement_timeout_ms = endpoint_class.statement_timeout_ms
+    g.admission_deferred = endpoint_class
+
+
+def _busy_response(endpoint_class):
+    response = jsonify({'error': 'Server is busy, please retry shortly.', 'class': endpoint_class.name})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(max(1, int(endpoint_class.queue_timeout)))
+    return response
+
+
+def init_app(app):
+    @app.before_request
+    def admit_request():
+        class_name = classify(request.endpoint, request.method)
+        if class_name is None:
+            return None
+        endpoint_class = endpoint_classes[class_name]
+        g.statement_timeout_ms = endpoint_class.statement_timeout_ms
+        if getattr(current_app.view_functions.get(request.endpoint), 'defers_admission', False):
+            g.admission_deferred = endpoint_class
+            return None
+        if not endpoint_class.acquire():
+            return _busy_response(endpoint_class)
+        g.admission_class = endpoint_class
+        return None
+
+    @app.errorhandler(Busy)
+    def deferred_request_busy(err):
+        return _busy_response(err.endpoint_class)
+
+    @app.teardown_request
+    def release_slot(_exc):
+        endpoint_class = g.pop('admission_class', None)
+        if endpoint_class is not None:
+            endpoint_class.release()
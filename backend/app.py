@@ -1,13 +1,23 @@
 import os
 import sys
+import click
 import psycopg
 from psycopg import errors, sql
-from flask import Flask, send_from_directory, request
+from flask import Flask, request
 from flask_cors import CORS
-from flask_jwt_extended import JWTManager
 from dotenv import load_dotenv
-from werkzeug.security import generate_password_hash
+import passwords
 from db import get_db_connection, get_dict_cursor
+import admission
+import app_logging
+import schema_migrations
+import backups
+import metrics
+import partitioning
+import prefork
+import profiling
+import static_assets
+import user_status
 
 # Import Blueprints
 from routes.shipments import shipments_bp
@@ -16,6 +26,12 @@ from routes.units import units_bp
 from routes.checklist import checklist_bp
 from routes.auth import auth_bp
 from routes.users import users_bp
+from routes.dashboard import dashboard_bp
+from routes.cube import cube_bp, refresh_failure_cube
+from routes.changes import TOMBSTONE_RETENTION_DAYS, changes_bp, prune_change_tombstones
+from routes.events import events_bp
+from routes.admin import admin_bp
+from routes.batch import SharedTokenJWTManager, batch_bp
 
 load_dotenv()
 
@@ -27,7 +43,8 @@ def get_base_path():
 BASE_PATH = get_base_path()
 static_folder_path = os.path.join(BASE_PATH, 'build')
 
-app = Flask(__name__, static_folder=static_folder_path, static_url_path='/')
+# The React build is served by static_assets (precompressed, cache headers), not Flask's static route.
+app = Flask(__name__, static_folder=None)
 
 # More specific CORS configuration
 client_origin_url = os.getenv("CLIENT_ORIGIN_URL", "*")
@@ -38,7 +55,18 @@ app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "default-secret-for-s
 app.config["JWT_TOKEN_LOCATION"] = ["headers"]
 app.config["JWT_COOKIE_CSRF_PROTECT"] = False
 app.config["JWT_CSRF_PROTECT"] = False
-jwt = JWTManager(app)
+jwt = SharedTokenJWTManager(app)
+# Reject tokens of deactivated or deleted users (cached, NOTIFY-refreshed)
+user_status.init_app(app)
+
+# Structured logging and request ids before anything else logs
+app_logging.init_app(app)
+# Request/DB metrics first so rejected requests are still timed and counted
+metrics.init_app(app)
+# Per-class concurrency limits and statement timeouts for /api requests
+admission.init_app(app)
+# Admin-triggered cProfile runs (X-Profile: 1 or ?__profile=1)
+profiling.init_app(app)
 
 # Register Blueprints
 app.register_blueprint(shipments_bp, url_prefix='/api/shipments')
@@ -47,6 +75,15 @@ app.register_blueprint(units_bp, url_prefix='/api/units')
 app.register_blueprint(checklist_bp, url_prefix='/api/checklist')
 app.register_blueprint(auth_bp, url_prefix='/api/auth')
 app.register_blueprint(users_bp, url_prefix='/api/users')
+app.register_blueprint(dashboard_bp, url_prefix='/api/dashboard')
+app.register_blueprint(cube_bp, url_prefix='/api/cube')
+app.register_blueprint(changes_bp, url_prefix='/api/changes')
+app.register_blueprint(events_bp, url_prefix='/api/events')
+app.register_blueprint(admin_bp, url_prefix='/api/admin')
+app.register_blueprint(batch_bp, url_prefix='/api/batch')
+
+# React build, with a catch-all to index.html for client-side routes
+static_assets.init_app(app, static_folder_path)
 
 
 @app.cli.command("db-init")
@@ -105,15 +142,25 @@ def db_init_command():
         print("Database tables initialized successfully.")
     except FileNotFoundError:
         print(f"ERROR: schema.sql not found at {schema_path}")
+        return
     except Exception as e:
         conn.rollback()
         print(f"An error occurred while running the schema: {e}")
+        return
     finally:
         if 'cursor' in locals() and cursor:
             cursor.close()
         if conn and not conn.closed:
             conn.close()
 
+    try:
+        applied = schema_migrations.upgrade()
+    except Exception as e:
+        print(f"The schema was created, but applying migrations failed: {e}")
+        print("Fix the cause and run 'flask db-upgrade' to finish.")
+        sys.exit(1)
+    print(f"Applied {len(applied)} migration(s).")
+
 @app.cli.command("create-admin")
 def create_admin_command():
     import getpass
@@ -129,7 +176,7 @@ def create_admin_command():
         print("Password cannot be empty. Aborting.")
         return
 
-    password_hash = generate_password_hash(password)
+    password_hash = passwords.hash_password(password)
     print(f"Attempting to create admin user '{username}'...")
     conn = get_db_connection()
     if conn is None:
@@ -154,14 +201,171 @@ def create_admin_command():
         if conn and not conn.closed:
             conn.close()
 
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
-def serve(path):
-    if path != "" and os.path.exists(os.path.join(app.static_folder, path)):
-        return send_from_directory(app.static_folder, path)
-    else:
-        return send_from_directory(app.static_folder, 'index.html')
-    
+@app.cli.command("db-upgrade")
+@click.option("--dry-run", is_flag=True, help="List pending migrations without applying them.")
+def db_upgrade_command(dry_run):
+    """Applies pending schema migrations from migrations/."""
+    try:
+        migrations = schema_migrations.upgrade(dry_run=dry_run)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        sys.exit(1)
+    if dry_run:
+        for migration in migrations:
+            print(f"Pending: {migration.version}_{migration.name}")
+    if not migrations:
+        print("Database schema is up to date.")
+    elif not dry_run:
+        print(f"Applied {len(migrations)} migration(s).")
+
+@app.cli.command("partition-tables")
+@click.option("--yes", is_flag=True, help="Do not ask for confirmation.")
+def partition_tables_command(yes):
+    """Converts shipments and shipped_units to yearly partitions (one-time, locks both tables)."""
+    if not yes and not click.confirm("This locks and rewrites shipments and shipped_units. Continue?"):
+        return
+    try:
+        first_year, last_year = partitioning.convert()
+    except Exception as e:
+        print(f"Partitioning failed: {e}")
+        sys.exit(1)
+    print(f"Partitioned shipments and shipped_units by year ({first_year}-{last_year} plus default).")
+
+@app.cli.command("partition-maintain")
+@click.option("--years-ahead", type=int, default=partitioning.YEARS_AHEAD, show_default=True,
+              help="Create partitions through this many years after the current one.")
+def partition_maintain_command(years_ahead):
+    """Creates upcoming yearly partitions and lists all partitions."""
+    try:
+        created = partitioning.maintain(years_ahead)
+        report = partitioning.partition_report()
+    except Exception as e:
+        print(f"Partition maintenance failed: {e}")
+        sys.exit(1)
+    for name in created:
+        print(f"Created {name}")
+    for _table, partition, bounds, size, tablespace, archived in report:
+        state = "archived" if archived else "hot"
+        print(f"{partition:<28} {size / 1048576:>10.1f} MB  {tablespace:<12} {state:<8} {bounds}")
+
+@app.cli.command("archive-year")
+@click.argument("year", type=int)
+@click.option("--tablespace", default=partitioning.ARCHIVE_TABLESPACE,
+              help="Tablespace to move the year to (default: ARCHIVE_TABLESPACE).")
+def archive_year_command(year, tablespace):
+    """Makes a closed year's partitions read-only, packed and frozen, optionally in a cold tablespace."""
+    try:
+        partitioning.archive_year(year, tablespace=tablespace)
+    except Exception as e:
+        print(f"Archiving {year} failed: {e}")
+        sys.exit(1)
+    print(f"Archived {year}.")
+
+def _print_timings(timings):
+    for phase, seconds in timings.items():
+        print(f"  {phase:<16} {seconds:>8.1f}s")
+
+@app.cli.command("backup")
+@click.option("--verify", is_flag=True, help="Restore into a scratch database and check row counts.")
+@click.option("--jobs", type=int, default=backups.BACKUP_JOBS, show_default=True, help="Parallel dump jobs.")
+@click.option("--dir", "directory", default=backups.BACKUP_DIR, show_default=True, help="Backup directory.")
+@click.option("--no-prune", is_flag=True, help="Keep old backups regardless of the retention policy.")
+def backup_command(verify, jobs, directory, no_prune):
+    """Dumps the database in parallel directory format and applies the retention policy."""
+    print(f"Backing up '{os.getenv('DB_NAME')}' to {directory}...")
+    try:
+        manifest = backups.backup(directory, jobs=jobs, verify=verify, prune_old=not no_prune)
+    except Exception as e:
+        print(f"Backup failed: {e}")
+        sys.exit(1)
+    print(f"Backup written to {manifest['path']}")
+    _print_timings(manifest['timings'])
+    if manifest['verified'] is False:
+        sys.exit(1)
+
+@app.cli.command("restore")
+@click.argument("backup", default="latest")
+@click.option("--dbname", default=None, help="Database to restore into (default: DB_NAME).")
+@click.option("--jobs", type=int, default=backups.BACKUP_JOBS, show_default=True, help="Parallel restore jobs.")
+@click.option("--clean", is_flag=True, help="Overwrite the objects of an existing database.")
+@click.option("--yes", is_flag=True, help="Do not ask for confirmation.")
+def restore_command(backup, dbname, jobs, clean, yes):
+    """Restores a backup (a path, a backup name or 'latest') and checks row counts."""
+    try:
+        path = backups.resolve_backup(backup)
+    except Exception as e:
+        print(e)
+        sys.exit(1)
+    target = dbname or os.getenv('DB_NAME')
+    if clean and not yes and not click.confirm(f"Overwrite database '{target}' with {path}? Stop the service first."):
+        return
+    try:
+        ok, problems, timings = backups.restore(path, target, jobs=jobs, clean=clean)
+    except Exception as e:
+        print(f"Restore failed: {e}")
+        sys.exit(1)
+    _print_timings(timings)
+    for problem in problems:
+        print(f"  {problem}")
+    print(f"Restored {path} into '{target}'." if ok else "Restore finished, but row counts do not match the backup.")
+    if not ok:
+        sys.exit(1)
+
+@app.cli.command("serve")
+@click.option("--host", default=os.getenv('SERVE_HOST', '0.0.0.0'), show_default=True)
+@click.option("--port", type=int, default=int(os.getenv('SERVE_PORT', '5000')), show_default=True)
+@click.option("--workers", type=int, default=prefork.WORKERS, show_default=True, help="Worker processes.")
+@click.option("--threads", type=int, default=prefork.THREADS, show_default=True, help="Request threads per worker.")
+@click.option("--status", is_flag=True, help="Print the running server's per-worker health and exit.")
+def serve_command(host, port, workers, threads, status):
+    """Runs the production server as pre-forked waitress worker processes (Linux)."""
+    if status:
+        report = prefork.read_status()
+        if report is None:
+            print("flask serve is not running.")
+            sys.exit(1)
+        print(f"Master {report['master_pid']} on {report['listen']}, {report['threads_per_worker']} threads per worker")
+        for worker in report['workers']:
+            print(f"  w{worker['slot']} pid {worker['pid']:<8} {worker.get('state', '?'):<9} "
+                  f"up {worker['uptime_seconds']:>6}s  requests {worker.get('requests', 0):>8}  "
+                  f"active {worker.get('active', 0):>3}  rss {worker.get('max_rss_kb', 0) / 1024:>7.1f} MB  "
+                  f"restarts {worker['restarts']}  heartbeat {worker['heartbeat_age_seconds']}s ago")
+        return
+    if not hasattr(os, 'fork'):
+        print("flask serve needs Linux. On Windows, run start_server.bat (single-process waitress).")
+        sys.exit(1)
+    prefork.serve(app, host, port, workers, threads)
+
+@app.cli.command("cube-refresh")
+@click.option("--full", is_flag=True, help="Rebuild every month instead of only the dirty ones.")
+def cube_refresh_command(full):
+    """Refreshes the failure-analysis cube and prunes old change-feed tombstones."""
+    conn = get_db_connection()
+    if conn is None:
+        print("Unable to connect to the database.")
+        return
+    try:
+        rebuilt = refresh_failure_cube(conn, full=full)
+        if rebuilt is None:
+            print("Failure cube fully rebuilt.")
+        else:
+            print(f"Failure cube refreshed ({rebuilt} month(s) rebuilt).")
+        pruned = prune_change_tombstones(conn)
+        print(f"Pruned {pruned} change-feed tombstone(s) older than {TOMBSTONE_RETENTION_DAYS} days.")
+    except Exception as e:
+        print(f"An error occurred while refreshing the cube: {e}")
+    finally:
+        if conn and not conn.closed:
+            conn.close()
+
+@app.cli.command("compress-static")
+def compress_static_command():
+    """Writes .gz (and .br, with the brotli package) next to the frontend build files."""
+    written = static_assets.compress(static_folder_path)
+    print(f"Wrote {len(written)} compressed file(s) in {static_folder_path}.")
+    if static_assets.brotli is None:
+        print("brotli is not installed (pip install brotli); only .gz files were written.")
+
 @app.cli.command("reset-password")
 def reset_password_command():
     """Resets a user's password."""
@@ -179,7 +383,7 @@ def reset_password_command():
         print("Password cannot be empty. Aborting.")
         return
 
-    password_hash = generate_password_hash(new_password)
+    password_hash = passwords.hash_password(new_password)
     
     conn = get_db_connection()
     if conn is None:
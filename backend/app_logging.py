@@ -0,0 +1,169 @@
+"""
+Structured, non-blocking application logging.
+
+Loggers under the ``quality`` namespace emit JSON lines. Request threads only
+put records on a queue. A single listener thread formats them and writes
+them to a rotating file (LOG_DIR/app.log) and, unless LOG_TO_CONSOLE=0,
+to stderr. Each record carries the current request id. Per-request debug
+output (connection details, inserted rows, login attempts) is logged at
+DEBUG, which is off unless LOG_LEVEL=DEBUG.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from flask import g, has_request_context, request
+
+LOG_DIR = os.getenv('LOG_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs'))
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_TO_CONSOLE = os.getenv('LOG_TO_CONSOLE', '1') == '1'
+ROOT_LOGGER = 'quality'
+
+_listeners = []
+# Set in pre-forked worker processes (see after_fork).
+_worker = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        request_id = getattr(record, 'request_id', None)
+        if request_id:
+            payload['request_id'] = request_id
+        payload.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the current request id. Runs on the request thread, before queueing."""
+
+    def filter(self, record):
+        if has_request_context():
+            record.request_id = g.get('request_id')
+        return True
+
+
+class _StructuredQueueHandler(QueueHandler):
+    def prepare(self, record):
+        # Keep exc_info as text but leave 'fields' and 'request_id' for the JSON formatter.
+        if record.exc_info:
+            record.fields = dict(getattr(record, 'fields', None) or {}, exc=logging.Formatter().formatException(record.exc_info))
+            record.exc_info = None
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def queued_handler(*handlers):
+    """
+    Return a handler that enqueues records for ``handlers``, which run on a
+    dedicated listener thread.
+    """
+    records = queue.SimpleQueue()
+    handler = _StructuredQueueHandler(records)
+    handler.addFilter(RequestIdFilter())
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append((handler, listener))
+    return handler
+
+
+def rotating_file_handler(path, formatter=None):
+    if _worker is not None:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{_worker}{ext}"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handler = RotatingFileHandler(path, maxBytes=10 * 1024 * 1024, backupCount=5, encoding='utf-8')
+    handler.setFormatter(formatter or JsonFormatter())
+    return handler
+
+
+def stop_listeners():
+    """Flush queued records and stop the listener threads."""
+    while _listeners:
+        _handler, listener = _listeners.pop()
+        listener.stop()
+
+
+atexit.register(stop_listeners)
+
+
+def after_fork(worker):
+    """
+    Restart the listener threads in a forked worker process. Threads do not
+    survive fork, and the queues are replaced because the parent's listener may
+    have held a queue's lock at fork time. From then on every log file of the
+    process gets ``worker`` before its extension (app.w0.log), so processes
+    never rotate the same file.
+    """
+    global _worker
+    _worker = worker
+    for queue_handler, listener in _listeners:
+        records = queue.SimpleQueue()
+        queue_handler.queue = records
+        listener.queue = records
+        handlers = []
+        for handler in listener.handlers:
+            if isinstance(handler, RotatingFileHandler):
+                handler.close()
+                handler = rotating_file_handler(handler.baseFilename, handler.formatter)
+            handlers.append(handler)
+        listener.handlers = tuple(handlers)
+        listener._thread = None
+        listener.start()
+
+
+def configure():
+    logger = logging.getLogger(ROOT_LOGGER)
+    if getattr(logger, '_quality_configured', False):
+        return logger
+    handlers = [rotating_file_handler(os.path.join(LOG_DIR, 'app.log'))]
+    if LOG_TO_CONSOLE:
+        console = logging.StreamHandler()
+        console.setFormatter(JsonFormatter())
+        handlers.append(console)
+    logger.setLevel(LOG_LEVEL)
+    logger.addHandler(queued_handler(*handlers))
+    logger.propagate = False
+    logger._quality_configured = True
+    return logger
+
+
+def init_app(app):
+    configure()
+    access_logger = logging.getLogger(f'{ROOT_LOGGER}.access')
+
+    @app.before_request
+    def assign_request_id():
+        g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+        g.log_started = time.perf_counter()
+
+    @app.after_request
+    def log_request(response):
+        response.headers['X-Request-ID'] = g.get('request_id', '')
+        started = g.get('log_started')
+        if started is not None and access_logger.isEnabledFor(logging.INFO):
+            db_stats = g.get('db_stats') or {}
+            access_logger.info('request', extra={'fields': {
+                'method': request.method,
+                'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+                'db_queries': db_stats.get('queries', 0),
+                'db_ms': round(db_stats.get('seconds', 0.0) * 1000, 1),
+            }})
+        return response
@@ -0,0 +1,364 @@
+"""
+Parallel database backups and verified restores (``flask backup`` /
+``flask restore``).
+
+Backups use pg_dump's directory format. Tables are dumped by BACKUP_JOBS
+parallel workers, and each is compressed with BACKUP_COMPRESSION (a gzip
+level, or e.g. ``zstd:3`` with PostgreSQL 16+ tools). A restore can then use
+parallel jobs too, which a plain SQL dump cannot.
+
+pg_dump reads a snapshot exported by a REPEATABLE READ transaction. The row
+count of every table is taken in that same transaction and stored in the
+backup's manifest.json, so the counts describe exactly what the dump
+contains. ``--verify`` restores the backup into a scratch database and
+compares the counts there. ``flask restore`` checks them after restoring.
+
+Backups are named <DB_NAME>_<YYYYmmdd-HHMMSS> inside BACKUP_DIR. After each
+backup, old ones are pruned by a daily/weekly/monthly policy
+(BACKUP_KEEP_DAILY, BACKUP_KEEP_WEEKLY, BACKUP_KEEP_MONTHLY).
+The pg_dump/pg_restore binaries are looked up in PG_BIN_DIR, then on PATH,
+then in the default Windows install location.
+"""
+
+import datetime
+import glob
+import json
+import os
+import shutil
+import subprocess
+import time
+
+import psycopg
+from psycopg import sql
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKUP_DIR = os.getenv('BACKUP_DIR', os.path.join(BACKEND_DIR, 'backups'))
+BACKUP_JOBS = int(os.getenv('BACKUP_JOBS', str(min(4, os.cpu_count() or 1))))
+BACKUP_COMPRESSION = os.getenv('BACKUP_COMPRESSION', '6')
+KEEP_DAILY = int(os.getenv('BACKUP_KEEP_DAILY', '7'))
+KEEP_WEEKLY = int(os.getenv('BACKUP_KEEP_WEEKLY', '4'))
+KEEP_MONTHLY = int(os.getenv('BACKUP_KEEP_MONTHLY', '6'))
+STAMP_FORMAT = '%Y%m%d-%H%M%S'
+PARTIAL_SUFFIX = '.partial'
+MANIFEST = 'manifest.json'
+
+
+def _major_version(bin_dir):
+    version = os.path.basename(os.path.dirname(bin_dir))
+    return int(version) if version.isdigit() else 0
+
+
+def _tool(name):
+    candidates = []
+    if os.getenv('PG_BIN_DIR'):
+        candidates.append(os.path.join(os.getenv('PG_BIN_DIR'), name))
+    found = shutil.which(name)
+    if found:
+        candidates.append(found)
+    # Default Windows installs, newest major version first.
+    installs = glob.glob(r'C:\Program Files\PostgreSQL\*\bin')
+    installs.sort(key=_major_version, reverse=True)
+    candidates.extend(os.path.join(path, name) for path in installs)
+    for candidate in candidates:
+        for path in (candidate, candidate + '.exe'):
+            if os.path.isfile(path):
+                return path
+    raise RuntimeError(f"{name} not found; set PG_BIN_DIR to the PostgreSQL bin directory.")
+
+
+def _settings(dbname=None):
+    return {
+        'host': os.getenv('DB_HOST'),
+        'port': int(os.getenv('DB_PORT', '5432')),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'dbname': dbname or os.getenv('DB_NAME'),
+    }
+
+
+def _connect(dbname=None):
+    return psycopg.connect(**_settings(dbname))
+
+
+def _run(args, log):
+    settings = _settings()
+    env = dict(os.environ, PGPASSWORD=settings['password'] or '')
+    args = args + ['--host', settings['host'] or 'localhost', '--port', str(settings['port']),
+                   '--username', settings['user'] or '']
+    result = subprocess.run(args, env=env, capture_output=True, text=True)
+    for line in result.stderr.splitlines():
+        log(f"    {line}")
+    return result
+
+
+def _tool_version(name):
+    return subprocess.run([_tool(name), '--version'], capture_output=True, text=True).stdout.strip()
+
+
+def _count_rows(conn):
+    """Exact row counts of every table in the public schema (partitions count under their parent)."""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p') AND NOT c.relispartition
+            ORDER BY c.relname
+            """
+        )
+        tables = [row[0] for row in cursor.fetchall()]
+        counts = {}
+        for table in tables:
+            cursor.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(table)))
+            counts[table] = cursor.fetchone()[0]
+    return counts
+
+
+def _compare_counts(expected, actual):
+    return [
+        f"{table}: expected {count}, found {actual.get(table, 'no table')}"
+        for table, count in expected.items() if actual.get(table) != count
+    ]
+
+
+def _dir_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _dirs, names in os.walk(path) for name in names)
+
+
+def _write_manifest(path, manifest):
+    with open(os.path.join(path, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, default=str)
+
+
+def read_manifest(path):
+    with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def list_backups(directory=BACKUP_DIR, dbname=None):
+    """Completed backups as [(name, created datetime)], newest first."""
+    prefix = f"{dbname or os.getenv('DB_NAME')}_"
+    backups = []
+    if not os.path.isdir(directory):
+        return backups
+    for name in os.listdir(directory):
+        if not name.startswith(prefix) or not os.path.isfile(os.path.join(directory, name, MANIFEST)):
+            continue
+        try:
+            backups.append((name, datetime.datetime.strptime(name[len(prefix):], STAMP_FORMAT)))
+        except ValueError:
+            continue
+    return sorted(backups, key=lambda item: item[1], reverse=True)
+
+
+def resolve_backup(name_or_path, directory=BACKUP_DIR):
+    """A backup directory from a path, a backup name in ``directory``, or 'latest'."""
+    if name_or_path == 'latest':
+        backups = list_backups(directory)
+        if not backups:
+            raise RuntimeError(f"No backups found in {directory}.")
+        return os.path.join(directory, backups[0][0])
+    for path in (name_or_path, os.path.join(directory, name_or_path)):
+        if os.path.isfile(os.path.join(path, MANIFEST)):
+            return path
+    raise RuntimeError(f"{name_or_path} is not a backup directory (no {MANIFEST}).")
+
+
+def retained(backups, daily=KEEP_DAILY, weekly=KEEP_WEEKLY, monthly=KEEP_MONTHLY):
+    """
+    Names to keep from ``backups`` (newest first): the newest backup of each
+    of the last ``daily`` days, ``weekly`` ISO weeks and ``monthly`` months
+    that have one.
+    """
+    by_day, by_week, by_month = {}, {}, {}
+    for name, created in backups:
+        by_day.setdefault(created.date(), name)
+        by_week.setdefault(created.isocalendar()[:2], name)
+        by_month.setdefault((created.year, created.month), name)
+    keep = set(list(by_day.values())[:daily])
+    keep.update(list(by_week.values())[:weekly])
+    keep.update(list(by_month.values())[:monthly])
+    return keep
+
+
+def prune(directory=BACKUP_DIR, log=print):
+    """Delete backups outside the retention policy and leftovers of failed runs. Returns the names deleted."""
+    backups = list_backups(directory)
+    keep = retained(backups)
+    deleted = [name for name, _created in backups if name not in keep]
+    prefix = f"{os.getenv('DB_NAME')}_"
+    deleted.extend(name for name in os.listdir(directory)
+                   if name.startswith(prefix) and name.endswith(PARTIAL_SUFFIX))
+    for name in deleted:
+        shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+        log(f"  deleted {name}")
+    return deleted
+
+
+def _restore_into(path, dbname, jobs, log, clean=False):
+    args = [_tool('pg_restore'), '--jobs', str(jobs), '--no-owner', '--no-privileges', '--dbname', dbname]
+    if clean:
+        args += ['--clean', '--if-exists']
+    result = _run(args + [path], log)
+    # pg_restore exits non-zero for ignorable errors too (e.g. an extension the
+    # role may not create); the row-count check decides whether the data is usable.
+    return result.returncode
+
+
+def _recreate_database(dbname):
+    admin = _connect('postgres')
+    admin.autocommit = True
+    try:
+        admin.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(dbname)))
+        admin.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(dbname)))
+    finally:
+        admin.close()
+
+
+def _drop_database(dbname):
+    admin = _connect('postgres')
+    admin.autocommit = True
+    try:
+        admin.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(dbname)))
+    finally:
+        admin.close()
+
+
+def verify_backup(path, jobs=BACKUP_JOBS, log=print, keep_scratch=False):
+    """Restore ``path`` into a scratch database and compare row counts. Returns (ok, problems, timings)."""
+    manifest = read_manifest(path)
+    scratch = f"{manifest['database']}_verify"
+    timings = {}
+    started = time.perf_counter()
+    _recreate_database(scratch)
+    returncode = _restore_into(path, scratch, jobs, log)
+    timings['verify_restore'] = time.perf_counter() - started
+    started = time.perf_counter()
+    try:
+        conn = _connect(scratch)
+        try:
+            problems = _compare_counts(manifest['row_counts'], _count_rows(conn))
+        finally:
+            conn.close()
+        if returncode and problems:
+            problems.insert(0, f"pg_restore exited with status {returncode}")
+    finally:
+        if not keep_scratch:
+            _drop_database(scratch)
+    timings['verify_counts'] = time.perf_counter() - started
+    return not problems, problems, timings
+
+
+def backup(directory=BACKUP_DIR, jobs=BACKUP_JOBS, compression=BACKUP_COMPRESSION, verify=False, prune_old=True, log=print):
+    """Dump the database into a new backup directory. Returns its manifest."""
+    dbname = os.getenv('DB_NAME')
+    os.makedirs(directory, exist_ok=True)
+    created = datetime.datetime.now()
+    name = f"{dbname}_{created.strftime(STAMP_FORMAT)}"
+    final_path = os.path.join(directory, name)
+    partial_path = final_path + PARTIAL_SUFFIX
+    timings = {}
+
+    # Hold the snapshot open until pg_dump has started all of its workers on it.
+    started = time.perf_counter()
+    conn = _connect()
+    conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+    conn.read_only = True
+    try:
+        snapshot = conn.execute("SELECT pg_export_snapshot()").fetchone()[0]
+        row_counts = _count_rows(conn)
+        timings['count_rows'] = time.perf_counter() - started
+        log(f"  counted rows in {timings['count_rows']:.1f}s")
+
+        started = time.perf_counter()
+        result = _run([
+            _tool('pg_dump'), '--format', 'directory', '--jobs', str(jobs), '--compress', compression,
+            '--snapshot', snapshot, '--no-owner', '--no-privileges', '--file', partial_path, '--dbname', dbname,
+        ], log)
+        timings['dump'] = time.perf_counter() - started
+        if result.returncode != 0:
+            raise RuntimeError(f"pg_dump failed with status {result.returncode}")
+        server_version = conn.info.server_version
+    finally:
+        conn.rollback()
+        conn.close()
+    os.rename(partial_path, final_path)
+    size = _dir_size(final_path)
+    log(f"  dumped {size / 1048576:.1f} MB with {jobs} job(s) in {timings['dump']:.1f}s")
+
+    manifest = {
+        'database': dbname,
+        'name': name,
+        'created_at': created.isoformat(timespec='seconds'),
+        'server_version': server_version,
+        'pg_dump': _tool_version('pg_dump'),
+        'jobs': jobs,
+        'compression': compression,
+        'size_bytes': size,
+        'row_counts': row_counts,
+        'verified': None,
+        'timings': timings,
+    }
+    _write_manifest(final_path, manifest)
+
+    if verify:
+        ok, problems, verify_timings = verify_backup(final_path, jobs, log)
+        timings.update(verify_timings)
+        manifest['verified'] = ok
+        manifest['verify_problems'] = problems
+        log(f"  restore check {'passed' if ok else 'FAILED'} in "
+            f"{verify_timings['verify_restore'] + verify_timings['verify_counts']:.1f}s")
+        for problem in problems:
+            log(f"    {problem}")
+        _write_manifest(final_path, manifest)
+
+    if prune_old:
+        started = time.perf_counter()
+        manifest['pruned'] = prune(directory, log)
+        timings['prune'] = time.perf_counter() - started
+        _write_manifest(final_path, manifest)
+    manifest['path'] = final_path
+    return manifest
+
+
+def restore(path, dbname=None, jobs=BACKUP_JOBS, clean=False, log=print):
+    """
+    Restore a backup into ``dbname`` (default DB_NAME), creating it if needed.
+    An existing database is only overwritten with ``clean``.
+    Returns (ok, problems, timings).
+    """
+    manifest = read_manifest(path)
+    dbname = dbname or os.getenv('DB_NAME')
+    timings = {}
+    admin = _connect('postgres')
+    admin.autocommit = True
+    try:
+        exists = admin.execute("SELECT 1 FROM pg_database WHERE datname = %s", (dbname,)).fetchone()
+        if exists and not clean:
+            raise RuntimeError(f"Database '{dbname}' exists; use --clean to overwrite it.")
+        if not exists:
+            admin.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(dbname)))
+    finally:
+        admin.close()
+
+    started = time.perf_counter()
+    returncode = _restore_into(path, dbname, jobs, log, clean=bool(exists))
+    timings['restore'] = time.perf_counter() - started
+    log(f"  restored with {jobs} job(s) in {timings['restore']:.1f}s")
+
+    conn = _connect(dbname)
+    conn.autocommit = True
+    try:
+        # pg_restore does not bring planner statistics along.
+        started = time.perf_counter()
+        conn.execute("ANALYZE")
+        timings['analyze'] = time.perf_counter() - started
+        started = time.perf_counter()
+        problems = _compare_counts(manifest['row_counts'], _count_rows(conn))
+        timings['verify_counts'] = time.perf_counter() - started
+    finally:
+        conn.close()
+    if returncode and problems:
+        problems.insert(0, f"pg_restore exited with status {returncode}")
+    return not problems, problems, timings
@@ -0,0 +1 @@
+"""Benchmark suite: synthetic data (bench.datagen), load driver (bench.run) and run comparison (bench.compare)."""
@@ -0,0 +1,53 @@
+"""
+Compare two benchmark result files written by bench.run.
+
+Usage (from the backend directory):
+    python -m bench.compare bench/results/<baseline>.json bench/results/<candidate>.json
+
+Prints p50/p95/p99 and throughput per scenario with the relative change.
+Negative latency deltas and positive throughput deltas are improvements.
+"""
+
+import json
+import sys
+
+METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'throughput_rps')
+
+
+def _load(path):
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    return report['meta'], {result['scenario']: result for result in report['results']}
+
+
+def _delta(old, new):
+    if not old or new is None:
+        return ''
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        raise SystemExit(__doc__)
+    old_meta, old = _load(argv[0])
+    new_meta, new = _load(argv[1])
+    if old_meta.get('dataset') != new_meta.get('dataset'):
+        print(f"warning: datasets differ: {old_meta.get('dataset')} vs {new_meta.get('dataset')}")
+    if old_meta.get('concurrency') != new_meta.get('concurrency'):
+        print(f"warning: concurrency differs: {old_meta.get('concurrency')} vs {new_meta.get('concurrency')}")
+
+    print(f"{'scenario':<28}" + ''.join(f"{metric:>24}" for metric in METRICS))
+    for name in sorted(set(old) | set(new)):
+        if name not in old or name not in new:
+            print(f"{name:<28}  (only in {'candidate' if name in new else 'baseline'})")
+            continue
+        cells = []
+        for metric in METRICS:
+            before, after = old[name].get(metric), new[name].get(metric)
+            cells.append(f"{before} -> {after} {_delta(before, after)}".rjust(24))
+        print(f"{name:<28}" + ''.join(cells))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+"""
+Synthetic dataset generator for the benchmark suite.
+
+Loads realistic shipments, units and checklist responses into the database
+named by the DB_* settings (.env), using COPY. Only run it against a local,
+disposable database.
+
+Usage (from the backend directory):
+    python -m bench.datagen --scale 100k --reset
+    python -m bench.datagen --units 250000 --seed 7
+
+Scales: 10k, 100k and 1m units. Shipments average about 20 units. Their sizes
+follow a long-tailed distribution, and they are spread over --years of
+weekdays. Customers and models have skewed popularity. About 6% of units fail
+first test; the failure rate varies by model, and failures have realistic ATE
+and reason mixes. Roughly 1.5% of units are re-serialized. Completed
+shipments get a full checklist.
+A 'bench' admin user (password BENCH_PASSWORD, default 'bench-password') is
+created for bench.run.
+"""
+
+import argparse
+import datetime
+import math
+import os
+import random
+import sys
+import time
+
+from psycopg import errors
+
+import partitioning
+import passwords
+from db import get_db_connection
+from routes.cube import refresh_failure_cube
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+BENCH_USER = 'bench'
+BENCH_PASSWORD = os.getenv('BENCH_PASSWORD', 'bench-password')
+PART_PREFIX = 'BM'
+
+MODEL_FAMILIES = ['Transceiver', 'Amplifier', 'Power Supply', 'Controller', 'Antenna', 'Converter']
+CUSTOMER_COUNT = 250
+QC_NAMES = ['A. Tran', 'B. Nguyen', 'C. Patel', 'D. Romero', 'E. Kim', 'F. Okafor']
+FAILED_EQUIPMENT = ['ATE1', 'ATE2', 'ATE3', 'ATE4', 'ATE5', 'Other']
+FAILED_EQUIPMENT_WEIGHTS = [30, 25, 15, 10, 5, 15]
+RETEST_REASONS = [
+    'Gain out of spec', 'Noise figure high', 'Power output low', 'Firmware load failed',
+    'Connector loose', 'Calibration drift', 'Leakage current high', 'Cosmetic defect',
+    'Gain out of spec, Calibration drift', 'Power output low, Connector loose',
+]
+RESET_TABLES = [
+    'shipment_checklist_responses', 'shipped_units', 'shipments', 'model_numbers',
+    'change_tombstones', 'failure_cube', 'failure_cube_dirty',
+]
+
+
+def _zipf_weights(count, skew=1.1):
+    return [1.0 / (rank + 1) ** skew for rank in range(count)]
+
+
+def _weekdays(years, today):
+    start = today - datetime.timedelta(days=int(365 * years))
+    days = []
+    day = start
+    while day <= today:
+        if day.weekday() < 5:
+            days.append(day)
+        day += datetime.timedelta(days=1)
+    return days
+
+
+def _shipment_sizes(units, rng):
+    sizes = []
+    remaining = units
+    while remaining > 0:
+        size = min(remaining, max(1, int(rng.lognormvariate(2.6, 0.8))))
+        sizes.append(size)
+        remaining -= size
+    return sizes
+
+
+def _models(rng, count=60):
+    models = []
+    for index in range(count):
+        family = MODEL_FAMILIES[index % len(MODEL_FAMILIES)]
+        model_type = f"{family} {chr(ord('A') + index // len(MODEL_FAMILIES))}{index % 7 + 1}"
+        part_number = f"{PART_PREFIX}-{1000 + index:05d}"
+        # Some products are much harder to get right first time than others.
+        failure_factor = rng.choice([0.3, 0.5, 0.8, 1.0, 1.0, 1.2, 1.5, 2.0, 3.0])
+        models.append((model_type, part_number, failure_factor))
+    return models
+
+
+def _next_id(cursor, table, column):
+    cursor.execute(f"SELECT COALESCE(MAX({column}), 0) + 1 FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def _reset_identity(cursor, table, column):
+    cursor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), COALESCE((SELECT MAX({column}) FROM {table}), 0) + 1, FALSE)"
+    )
+
+
+def _disable_triggers(conn):
+    """
+    Skip per-row triggers (row versioning, NOTIFY, cube dirtying) for the
+    bulk load when the role is allowed to. Column defaults still stamp
+    row_version, and the cube is rebuilt afterwards.
+    """
+    try:
+        # Savepoint, so a permission error leaves the load transaction usable.
+        with conn.transaction():
+            conn.execute("SET session_replication_role = replica")
+        return True
+    except errors.InsufficientPrivilege:
+        return False
+
+
+def generate(conn, units, seed=42, years=3.0, retest_rate=0.06, reset=False):
+    rng = random.Random(seed)
+    timings = {}
+    counts = {}
+    today = datetime.date.today()
+    cursor = conn.cursor()
+
+    if reset:
+        cursor.execute("TRUNCATE " + ", ".join(RESET_TABLES) + " RESTART IDENTITY CASCADE")
+    fast = _disable_triggers(conn)
+
+    started = time.perf_counter()
+    models = _models(rng)
+    cursor.execute("SELECT part_number FROM model_numbers")
+    existing_parts = {row[0] for row in cursor.fetchall()}
+    with cursor.copy("COPY model_numbers (model_type, description, part_number, is_active) FROM STDIN") as copy:
+        for model_type, part_number, _factor in models:
+            if part_number not in existing_parts:
+                copy.write_row((model_type, f"Synthetic {model_type}", part_number, True))
+    model_weights = _zipf_weights(len(models), 0.9)
+    timings['models'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    customers = [f"Customer {index:03d}" for index in range(CUSTOMER_COUNT)]
+    customer_weights = _zipf_weights(len(customers))
+    days = _weekdays(years, today)
+    sizes = _shipment_sizes(units, rng)
+    shipment_id = _next_id(cursor, 'shipments', 'id')
+    shipments = []
+    with cursor.copy(
+        "COPY shipments (id, customer_name, job_number, shipping_date, qc_name, status) FROM STDIN"
+    ) as copy:
+        for size in sizes:
+            shipping_date = rng.choice(days)
+            customer = rng.choices(customers, customer_weights)[0]
+            qc_name = rng.choice(QC_NAMES)
+            recent = (today - shipping_date).days < 14
+            status = 'In Progress' if recent and rng.random() < 0.6 else 'Completed'
+            job_number = f"J{shipping_date.year % 100:02d}-{seed % 100:02d}{shipment_id:07d}"
+            copy.write_row((shipment_id, customer, job_number, shipping_date, qc_name, status))
+            shipments.append((shipment_id, shipping_date, qc_name, status, size))
+            shipment_id += 1
+    counts['shipments'] = len(shipments)
+    timings['shipments'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    unit_seq = _next_id(cursor, 'shipped_units', 'unit_id')
+    failed = 0
+    with cursor.copy(
+        "COPY shipped_units (unit_id, shipment_id, shipping_date, model_type, part_number, serial_number, "
+        "original_serial_number, first_test_pass, failed_equipment, retest_reason) FROM STDIN"
+    ) as copy:
+        for shipment_id, shipping_date, _qc, _status, size in shipments:
+            # A shipment is usually one or two products.
+            lines = rng.choices(models, model_weights, k=1 if rng.random() < 0.7 else 2)
+            week = shipping_date.isocalendar()[1]
+            for index in range(size):
+                model_type, part_number, failure_factor = lines[index % len(lines)]
+                serial = f"{part_number[-3:]}{shipping_date.year % 100:02d}{week:02d}{unit_seq:08d}"
+                original = f"R{serial}" if rng.random() < 0.015 else None
+                passed = rng.random() >= min(0.9, retest_rate * failure_factor)
+                equipment = reason = None
+                if not passed:
+                    failed += 1
+                    equipment = rng.choices(FAILED_EQUIPMENT, FAILED_EQUIPMENT_WEIGHTS)[0]
+                    reason = rng.choice(RETEST_REASONS)
+                copy.write_row((unit_seq, shipment_id, shipping_date, model_type, part_number, serial,
+                                original, passed, equipment, reason))
+                unit_seq += 1
+    counts['units'] = units
+    counts['failed_units'] = failed
+    timings['units'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    cursor.execute("SELECT item_id FROM checklist_master_items WHERE is_active = TRUE ORDER BY item_order")
+    item_ids = [row[0] for row in cursor.fetchall()]
+    responses = 0
+    with cursor.copy(
+        "COPY shipment_checklist_responses (shipment_id, item_id, status, completed_by, completion_date, comments) FROM STDIN"
+    ) as copy:
+        for shipment_id, shipping_date, qc_name, status, _size in shipments:
+            if status != 'Completed':
+                continue
+            for item_id in item_ids:
+                copy.write_row((shipment_id, item_id, 'NA' if rng.random() < 0.1 else 'Passed',
+                                qc_name, shipping_date, None))
+                responses += 1
+    counts['checklist_responses'] = responses
+    timings['checklist'] = time.perf_counter() - started
+
+    for table, column in (('shipments', 'id'), ('shipped_units', 'unit_id'),
+                          ('shipment_checklist_responses', 'response_id'), ('model_numbers', 'model_id')):
+        _reset_identity(cursor, table, column)
+    cursor.execute(
+        """
+        INSERT INTO users (username, password_hash, role, is_active)
+        VALUES (%s, %s, 'admin', TRUE)
+        ON CONFLICT (username) DO UPDATE
+            SET password_hash = EXCLUDED.password_hash, role = 'admin', is_active = TRUE
+        """,
+        (BENCH_USER, passwords.hash_password(BENCH_PASSWORD))
+    )
+    if fast:
+        conn.execute("SET session_replication_role = DEFAULT")
+    if partitioning.is_partitioned(cursor, 'shipped_units'):
+        partitioning.rebuild_serial_registries(cursor)
+    conn.commit()
+
+    started = time.perf_counter()
+    refresh_failure_cube(conn, full=True)
+    timings['failure_cube'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    conn.autocommit = True
+    for table in ('model_numbers', 'shipments', 'shipped_units', 'shipment_checklist_responses', 'failure_cube'):
+        conn.execute(f"VACUUM ANALYZE {table}")
+    timings['vacuum_analyze'] = time.perf_counter() - started
+    cursor.close()
+    return {'counts': counts, 'timings': {key: round(value, 2) for key, value in timings.items()},
+            'triggers_skipped': fast}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument('--scale', choices=sorted(SCALES))
+    size.add_argument('--units', type=int)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--years', type=float, default=3.0)
+    parser.add_argument('--retest-rate', type=float, default=0.06)
+    parser.add_argument('--reset', action='store_true', help='TRUNCATE all shipment data first')
+    parser.add_argument('--yes', action='store_true', help='do not ask before --reset')
+    args = parser.parse_args(argv)
+
+    units = SCALES[args.scale] if args.scale else args.units
+    if units <= 0:
+        raise SystemExit("--units must be positive")
+    if args.reset and not args.yes:
+        answer = input(f"TRUNCATE all shipments, units and checklists in '{os.getenv('DB_NAME')}'? [y/N] ")
+        if answer.strip().lower() != 'y':
+            raise SystemExit("Aborted.")
+
+    conn = get_db_connection()
+    if conn is None:
+        raise SystemExit("Unable to connect to the database.")
+    try:
+        print(f"Generating {units:,} units (~{math.ceil(units / 20):,} shipments), seed {args.seed}...")
+        result = generate(conn, units, args.seed, args.years, args.retest_rate, args.reset)
+    finally:
+        conn.close()
+    for name, value in result['counts'].items():
+        print(f"  {name}: {value:,}")
+    for name, seconds in result['timings'].items():
+        print(f"  {name}: {seconds}s")
+    if not result['triggers_skipped']:
+        print("  (row triggers ran during the load; use a superuser role for faster loads)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Login throughput benchmark.
+
+Password hashing makes login the most CPU-bound request, and logins arrive
+in bursts at shift change. This sweeps POST /api/auth/login over several
+concurrency levels against a running server and reports p50/p95/p99
+latency, logins per second and status codes (503 means the password
+hashing queue was full; see passwords.py). With --local it also measures
+the cost of one hash in this process for each --iterations value, which
+helps pick PASSWORD_HASH_ITERATIONS for the server's CPU.
+
+Usage (from the backend directory, server already running):
+    python -m bench.login --levels 1,4,16,32 --requests 200
+    python -m bench.login --local --iterations 100000,260000,600000
+    python -m bench.login --local-only
+
+Logs in as the 'bench' user created by bench.datagen. Results are written
+to bench/results/<timestamp>-<label>.json and .csv like bench.run.
+"""
+
+import argparse
+import datetime
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+import passwords
+from bench.datagen import BENCH_PASSWORD, BENCH_USER
+from bench.run import RESULTS_DIR, Client, _git_commit, login, run_scenario, write_results
+from bench.scenarios import SCENARIOS, Pools
+
+LOCAL_SAMPLES = 5
+
+
+def measure_hash(iterations, threads, verifications):
+    """Single-hash latency and multi-threaded verification rate at ``iterations``."""
+    method = f"pbkdf2:{passwords.DIGEST}:{iterations}"
+    stored = generate_password_hash(BENCH_PASSWORD, method, passwords.SALT_LENGTH)
+    samples = []
+    for _ in range(LOCAL_SAMPLES):
+        started = time.perf_counter()
+        check_password_hash(stored, BENCH_PASSWORD)
+        samples.append(time.perf_counter() - started)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _i: check_password_hash(stored, BENCH_PASSWORD), range(verifications)))
+    wall = time.perf_counter() - started
+    return {
+        'method': method,
+        'verify_ms': round(statistics.median(samples) * 1000, 2),
+        'threads': threads,
+        'verifications_per_second': round(verifications / wall, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default=os.getenv('BENCH_BASE_URL', 'http://127.0.0.1:5000'))
+    parser.add_argument('--username', default=BENCH_USER)
+    parser.add_argument('--password', default=BENCH_PASSWORD)
+    parser.add_argument('--levels', default='1,4,16,32', help='comma-separated client concurrency levels')
+    parser.add_argument('--requests', type=int, default=200, help='measured logins per level')
+    parser.add_argument('--local', action='store_true', help='also measure hash cost in this process')
+    parser.add_argument('--local-only', action='store_true', help='only measure hash cost in this process')
+    parser.add_argument('--iterations', default=str(passwords.ITERATIONS),
+                        help='comma-separated PBKDF2 iteration counts for --local')
+    parser.add_argument('--threads', type=int, default=passwords.WORKERS, help='hashing threads for --local')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--label', default='login')
+    parser.add_argument('--out', default=RESULTS_DIR)
+    args = parser.parse_args(argv)
+    try:
+        levels = [int(level) for level in args.levels.split(',') if level.strip()]
+        iteration_counts = [int(count) for count in args.iterations.split(',') if count.strip()]
+    except ValueError:
+        raise SystemExit("--levels and --iterations must be comma-separated integers")
+    if args.requests < 1 or args.threads < 1 or not levels or min(levels) < 1 or min(iteration_counts, default=0) < 1:
+        raise SystemExit("--levels, --requests, --iterations and --threads must be positive")
+
+    report = {
+        'meta': {
+            'label': args.label,
+            'started_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'base_url': None if args.local_only else args.base_url,
+            'levels': levels,
+            'requests_per_level': args.requests,
+        },
+        'results': [],
+        'local_hash': [],
+    }
+
+    if args.local or args.local_only:
+        print(f"{'method':<28}{'verify ms':>11}{'threads':>9}{'verify/s':>10}")
+        for iterations in iteration_counts:
+            result = measure_hash(iterations, args.threads, max(args.threads * 4, 20))
+            report['local_hash'].append(result)
+            print(f"{result['method']:<28}{result['verify_ms']:>11}{result['threads']:>9}"
+                  f"{result['verifications_per_second']:>10}")
+
+    if not args.local_only:
+        pools = Pools([], [], [], [])
+        pools.credentials = {'username': args.username, 'password': args.password}
+        # Fails early with a clear message when the server or the bench user is missing.
+        login(args.base_url, args.username, args.password)
+        builder, _writes = SCENARIOS['auth.login']
+        client = Client(args.base_url)
+        print(f"{'concurrency':<14}{'req':>6}{'err':>5}{'p50':>10}{'p95':>10}{'p99':>10}{'logins/s':>10}  statuses")
+        for index, level in enumerate(levels):
+            result = run_scenario(client, f"auth.login@{level}", builder, pools, args.requests, level, args.seed + index)
+            result['concurrency'] = level
+            report['results'].append(result)
+            print(f"{level:<14}{result['requests']:>6}{result['errors']:>5}{result['p50_ms']:>10}"
+                  f"{result['p95_ms']:>10}{result['p99_ms']:>10}{result['throughput_rps']:>10}  "
+                  f"{result['status_counts']}")
+
+    print(f"Results written to {write_results(report, args.out, args.label)}")
+
+
+if __name__ == '__main__':
+    main()
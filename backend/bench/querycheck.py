@@ -0,0 +1,229 @@
+"""
+Query-count and query-plan regression check.
+
+Runs every read scenario in bench.scenarios in-process, through the Flask
+test client, against the database named by the DB_* settings. It then checks
+two things:
+
+- Query budgets. Each request's statement count must be within its
+  scenario's budget in QUERY_BUDGETS. Every scenario runs with several
+  parameter sets (weeks, months and shipments of different sizes), so an N+1
+  loop shows up as a count that grows with the data.
+- Query plans. For the scenarios in PLAN_CHECKS, every statement that reads
+  shipped_units is re-planned with EXPLAIN. The check fails if the plan
+  contains a sequential scan on shipped_units. Plans only mean something on
+  a large table, so this part is skipped below MIN_PLAN_ROWS units unless
+  --force-plans is given (load one with python -m bench.datagen --scale 100k).
+  Statements that filter with a leading-wildcard ILIKE cannot use a btree
+  index and are reported but not failed.
+
+Response caching is bypassed, so every request reaches the database.
+Exits with status 1 on any violation, so it can gate a build.
+
+Usage (from the backend directory):
+    python -m bench.querycheck
+    python -m bench.querycheck --runs 10 --json querycheck.json
+"""
+
+import argparse
+import json
+import random
+import sys
+
+from flask import g
+
+import metrics
+import response_cache
+from app import app
+from bench.datagen import BENCH_PASSWORD, BENCH_USER
+from bench.scenarios import SCENARIOS, Pools
+from db import get_db_connection
+
+# Upper bound on statements per request, independent of how many rows match.
+QUERY_BUDGETS = {
+    'auth.login': 1,
+    'shipments.list': 2,
+    'shipments.detail': 3,
+    'shipments.stats': 9,
+    'shipments.stats_over_time': 1,
+    'shipments.fpy_weekly': 1,
+    'shipments.fpy_overall': 2,
+    'shipments.fpy_series': 2,
+    'shipments.fpy_spc': 2,
+    'shipments.manifest': 3,
+    'shipments.weekly': 2,
+    'dashboard': 14,
+    'cube.drill_down': 5,
+    'changes': 6,
+    'models.list': 2,
+    'units.check_serial': 1,
+    'checklist.items': 1,
+    'users.list': 1,
+    'models.check_part_number': 1,
+    'checklist.items_manage': 1,
+}
+
+# Scenarios whose statements are bounded by id, serial or a short date range
+# and therefore must not scan shipped_units.
+PLAN_CHECKS = ('shipments.detail', 'shipments.manifest', 'shipments.weekly', 'shipments.stats', 'units.check_serial')
+MIN_PLAN_ROWS = 100_000
+TARGET_TABLE = 'shipped_units'
+
+
+def _sql_text(query, conn):
+    if isinstance(query, (bytes, bytearray)):
+        return query.decode('utf-8', 'replace')
+    if isinstance(query, str):
+        return query
+    return query.as_string(conn)
+
+
+def _seq_scans(plan, table):
+    found = []
+    # Yearly partitions are named <table>_y<year> (see partitioning.py).
+    relation = plan.get('Relation Name') or ''
+    if plan.get('Node Type') == 'Seq Scan' and (relation == table or relation.startswith(table + '_')):
+        found.append(plan)
+    for child in plan.get('Plans', ()):
+        found.extend(_seq_scans(child, table))
+    return found
+
+
+def run_request(client, method, path, body):
+    """Returns (status, statement count, [(query, params), ...]) for one request."""
+    response_cache.invalidate()
+    with client:
+        response = client.open(path, method=method, json=body)
+        stats = g.get('db_stats') or {}
+        return response.status_code, stats.get('queries', 0), list(stats.get('statements', ()))
+
+
+def check_budgets(client, pools, names, runs, seed):
+    violations, report = [], {}
+    for index, name in enumerate(names):
+        builder, _writes = SCENARIOS[name]
+        rng = random.Random(seed + index)
+        counts, captured = [], []
+        for _ in range(runs):
+            method, path, body = builder(pools, rng)
+            status, count, statements = run_request(client, method, path, body)
+            if status >= 400:
+                violations.append(f"{name}: HTTP {status} for {method} {path}")
+                continue
+            counts.append(count)
+            captured.append(statements)
+        budget = QUERY_BUDGETS.get(name)
+        report[name] = {'budget': budget, 'counts': counts}
+        if budget is not None and counts and max(counts) > budget:
+            violations.append(f"{name}: {max(counts)} queries > budget {budget} (per run: {counts})")
+        report[name]['statements'] = captured
+    return violations, report
+
+
+def check_plans(report):
+    violations, notes = [], []
+    conn = get_db_connection()
+    if conn is None:
+        return ["plan check: unable to connect to the database"], notes
+    try:
+        seen = set()
+        for name in PLAN_CHECKS:
+            for statements in report.get(name, {}).get('statements', ()):
+                for query, params in statements:
+                    sql_text = _sql_text(query, conn)
+                    if TARGET_TABLE not in sql_text or not sql_text.lstrip().upper().startswith(('SELECT', 'WITH')):
+                        continue
+                    key = (name, sql_text)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    try:
+                        with conn.cursor() as cursor:
+                            cursor.execute("EXPLAIN (FORMAT JSON) " + sql_text, params)
+                            plan = cursor.fetchone()[0][0]['Plan']
+                    except Exception as err:
+                        conn.rollback()
+                        notes.append(f"{name}: could not EXPLAIN ({str(err).strip().splitlines()[0]})")
+                        continue
+                    if not _seq_scans(plan, TARGET_TABLE):
+                        continue
+                    summary = ' '.join(sql_text.split())[:160]
+                    if "ILIKE '%" in sql_text or 'ILIKE %s' in sql_text:
+                        notes.append(f"{name}: seq scan on {TARGET_TABLE} for leading-wildcard search (expected): {summary}")
+                    else:
+                        violations.append(f"{name}: seq scan on {TARGET_TABLE}: {summary}")
+        conn.rollback()
+    finally:
+        conn.close()
+    return violations, notes
+
+
+def _unit_count():
+    conn = get_db_connection()
+    if conn is None:
+        return 0
+    try:
+        with conn.cursor() as cursor:
+            # Planner estimate, summed over partitions; an exact COUNT(*) is slow at the 1m scale.
+            cursor.execute(
+                """
+                SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint
+                FROM pg_class c
+                WHERE c.oid = to_regclass(%s)
+                   OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(%s))
+                """,
+                (TARGET_TABLE, TARGET_TABLE)
+            )
+            return cursor.fetchone()[0]
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--username', default=BENCH_USER)
+    parser.add_argument('--password', default=BENCH_PASSWORD)
+    parser.add_argument('--runs', type=int, default=5, help='parameter sets per scenario')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--force-plans', action='store_true', help='check plans even on a small dataset')
+    parser.add_argument('--json', help='also write the report to this file')
+    args = parser.parse_args(argv)
+
+    metrics.capture_statements = True
+    pools = Pools.sample()
+    pools.credentials = {'username': args.username, 'password': args.password}
+    client = app.test_client()
+    login = client.post('/api/auth/login', json=pools.credentials)
+    if login.status_code != 200:
+        raise SystemExit(f"Login as '{args.username}' failed with HTTP {login.status_code}. Run bench.datagen first?")
+    client.environ_base['HTTP_AUTHORIZATION'] = f"Bearer {login.get_json()['access_token']}"
+
+    names = [name for name, (_builder, writes) in SCENARIOS.items() if not writes]
+    violations, report = check_budgets(client, pools, names, args.runs, args.seed)
+    for name, entry in report.items():
+        counts = entry['counts']
+        print(f"{name:<28} budget {str(entry['budget']):>3}  max {max(counts) if counts else '-':>3}  runs {counts}")
+
+    notes = []
+    units = _unit_count()
+    if units >= MIN_PLAN_ROWS or args.force_plans:
+        plan_violations, notes = check_plans(report)
+        violations.extend(plan_violations)
+    else:
+        notes.append(f"plan check skipped: ~{units:,} units < {MIN_PLAN_ROWS:,} (use --force-plans)")
+
+    for note in notes:
+        print(f"note: {note}")
+    for violation in violations:
+        print(f"FAIL: {violation}")
+    if args.json:
+        for entry in report.values():
+            entry.pop('statements', None)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'budgets': report, 'violations': violations, 'notes': notes}, f, indent=2)
+    print("OK" if not violations else f"{len(violations)} violation(s)")
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == '__main__':
+    main()
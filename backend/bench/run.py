@@ -0,0 +1,235 @@
+"""
+HTTP load driver for the benchmark suite.
+
+Runs each scenario in bench.scenarios against a running server with
+--concurrency client threads. Each thread holds a keep-alive connection.
+The driver reports p50/p95/p99 latency, throughput, status codes and
+X-Cache hits. Results are written to bench/results/<timestamp>-<label>.json
+and .csv; compare two runs with bench.compare.
+
+Usage (from the backend directory, server already running):
+    python -m bench.run --base-url http://127.0.0.1:5000 --concurrency 8 --requests 200
+    python -m bench.run --scenarios shipments.list,dashboard --label after-index
+    python -m bench.run --writes            # also run scenarios that write rows
+
+Logs in as the 'bench' user created by bench.datagen (override with
+--username / --password). Write scenarios run against scratch rows that are created
+before the run and deleted afterwards (see bench.scenarios).
+"""
+
+import argparse
+import csv
+import datetime
+import http.client
+import json
+import os
+import random
+import subprocess
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bench.datagen import BENCH_PASSWORD, BENCH_USER
+from bench.scenarios import SCENARIOS, Pools, cleanup_writes, dataset_counts
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+WARMUP_REQUESTS = 5
+
+
+class Client:
+    """One keep-alive HTTP connection per thread."""
+
+    def __init__(self, base_url, token=None, timeout=120):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        self.connection_class = http.client.HTTPSConnection if parsed.scheme == 'https' else http.client.HTTPConnection
+        self.token = token
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self.connection_class(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def request(self, method, path, body=None):
+        """Returns (status, seconds, headers, payload bytes)."""
+        headers = {'Accept': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        started = time.perf_counter()
+        try:
+            conn = self._connection()
+            conn.request(method, path, body=data, headers=headers)
+            response = conn.getresponse()
+            payload = response.read()
+            return response.status, time.perf_counter() - started, dict(response.getheaders()), payload
+        except (OSError, http.client.HTTPException):
+            self._local.conn = None
+            return 0, time.perf_counter() - started, {}, b''
+
+
+def login(base_url, username, password):
+    status, _seconds, _headers, payload = Client(base_url).request(
+        'POST', '/api/auth/login', {'username': username, 'password': password}
+    )
+    if status != 200:
+        raise SystemExit(f"Login as '{username}' failed with HTTP {status}. Run bench.datagen first?")
+    return json.loads(payload)['access_token']
+
+
+def run_scenario(client, name, builder, pools, requests, concurrency, seed):
+    rng_lock = threading.Lock()
+    rng = random.Random(seed)
+
+    def next_request():
+        with rng_lock:
+            return builder(pools, rng)
+
+    for _ in range(WARMUP_REQUESTS):
+        client.request(*next_request())
+
+    latencies = []
+    statuses = {}
+    cache_hits = 0
+    counter = iter(range(requests))
+    counter_lock = threading.Lock()
+    results_lock = threading.Lock()
+
+    def worker():
+        nonlocal cache_hits
+        local_latencies, local_statuses, local_hits = [], {}, 0
+        while True:
+            with counter_lock:
+                if next(counter, None) is None:
+                    break
+            status, seconds, headers, _payload = client.request(*next_request())
+            local_latencies.append(seconds)
+            local_statuses[status] = local_statuses.get(status, 0) + 1
+            if headers.get('X-Cache') in ('HIT', 'STALE'):
+                local_hits += 1
+        with results_lock:
+            latencies.extend(local_latencies)
+            for status, count in local_statuses.items():
+                statuses[status] = statuses.get(status, 0) + count
+            cache_hits += local_hits
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(worker)
+    wall = time.perf_counter() - started
+
+    millis = np.array(latencies) * 1000
+    errors = sum(count for status, count in statuses.items() if status == 0 or status >= 400)
+    return {
+        'scenario': name,
+        'requests': len(latencies),
+        'errors': errors,
+        'status_counts': {str(status): count for status, count in sorted(statuses.items())},
+        'cache_hit_ratio': round(cache_hits / len(latencies), 3) if latencies else None,
+        'p50_ms': round(float(np.percentile(millis, 50)), 2),
+        'p95_ms': round(float(np.percentile(millis, 95)), 2),
+        'p99_ms': round(float(np.percentile(millis, 99)), 2),
+        'mean_ms': round(float(millis.mean()), 2),
+        'max_ms': round(float(millis.max()), 2),
+        'throughput_rps': round(len(latencies) / wall, 2) if wall else None,
+        'wall_seconds': round(wall, 3),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(report, out_dir, label):
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+    base = os.path.join(out_dir, f"{stamp}-{label}" if label else stamp)
+    with open(base + '.json', 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    columns = ['scenario', 'requests', 'errors', 'cache_hit_ratio', 'p50_ms', 'p95_ms', 'p99_ms',
+               'mean_ms', 'max_ms', 'throughput_rps', 'wall_seconds']
+    with open(base + '.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(report['results'])
+    return base + '.json'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default=os.getenv('BENCH_BASE_URL', 'http://127.0.0.1:5000'))
+    parser.add_argument('--username', default=BENCH_USER)
+    parser.add_argument('--password', default=BENCH_PASSWORD)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help='measured requests per scenario')
+    parser.add_argument('--scenarios', help='comma-separated scenario names (default: all read scenarios)')
+    parser.add_argument('--writes', action='store_true', help='include scenarios that write rows')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--label', default='')
+    parser.add_argument('--out', default=RESULTS_DIR)
+    args = parser.parse_args(argv)
+    if args.requests < 1 or args.concurrency < 1:
+        raise SystemExit("--requests and --concurrency must be positive")
+
+    if args.scenarios:
+        names = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+        unknown = [name for name in names if name not in SCENARIOS]
+        if unknown:
+            raise SystemExit(f"Unknown scenarios: {', '.join(unknown)}. Known: {', '.join(SCENARIOS)}")
+    else:
+        names = [name for name, (_builder, writes) in SCENARIOS.items() if args.writes or not writes]
+
+    pools = Pools.sample()
+    pools.credentials = {'username': args.username, 'password': args.password}
+    client = Client(args.base_url, login(args.base_url, args.username, args.password))
+
+    report = {
+        'meta': {
+            'label': args.label,
+            'started_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'base_url': args.base_url,
+            'concurrency': args.concurrency,
+            'requests_per_scenario': args.requests,
+            'seed': args.seed,
+            'dataset': dataset_counts(),
+        },
+        'results': [],
+    }
+    writes = any(SCENARIOS[name][1] for name in names)
+    if writes:
+        pools.prepare_writes(args.requests + WARMUP_REQUESTS)
+    try:
+        print(f"{'scenario':<28}{'req':>6}{'err':>5}{'p50':>10}{'p95':>10}{'p99':>10}{'rps':>9}{'cache':>7}")
+        for index, name in enumerate(names):
+            builder, _writes = SCENARIOS[name]
+            result = run_scenario(client, name, builder, pools, args.requests, args.concurrency, args.seed + index)
+            report['results'].append(result)
+            print(f"{name:<28}{result['requests']:>6}{result['errors']:>5}{result['p50_ms']:>10}"
+                  f"{result['p95_ms']:>10}{result['p99_ms']:>10}{result['throughput_rps']:>9}"
+                  f"{result['cache_hit_ratio']:>7}")
+    finally:
+        if writes:
+            removed = cleanup_writes()
+            print(f"Removed bench rows: {', '.join(f'{table} {count}' for table, count in removed.items())}")
+    print(f"Results written to {write_results(report, args.out, args.label)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+"""
+Request scenarios for the benchmark suite.
+
+Each scenario builds a ``(method, path, json_body)`` request from a pool of
+real ids, serials, customers and dates sampled from the database. Runs then
+spread across the dataset instead of hitting one cached URL.
+
+Write scenarios work on scratch rows made by ``Pools.prepare_writes``:
+a BENCH- shipment, model, units and bench- users, plus spare rows for
+the DELETE scenarios to consume. ``cleanup_writes`` removes those rows and
+every row the write scenarios created.
+
+Routes that are deliberately not driven:
+- PUT /api/users/account/password. It would change the bench user's own
+  password. PUT /api/users/<id>/password covers the same hashing.
+- POST, PUT and DELETE /api/checklist/items. They change the checklist
+  that every shipment shows.
+- GET /api/events/stream. It is a long-lived stream, not a request.
+- /api/admin/* and /api/metrics. These are diagnostics, not workload.
+"""
+
+import datetime
+
+from db import get_db_connection
+
+POOL_SIZE = 500
+# Every row the write scenarios create is named with one of these prefixes.
+BENCH_PREFIX = 'BENCH-'
+BENCH_USER_PREFIX = 'bench-'
+SCRATCH_UNITS = 20
+
+
+class Pools:
+    def __init__(self, shipment_ids, serials, customers, dates, change_token='', part_numbers=None):
+        self.shipment_ids = shipment_ids or [1]
+        self.serials = serials or ['UNKNOWN']
+        self.customers = customers or ['Customer']
+        self.dates = dates or [datetime.date.today()]
+        self.change_token = change_token
+        self.part_numbers = part_numbers or ['UNKNOWN']
+        self.credentials = None
+        # Filled by prepare_writes().
+        self.scratch_shipment_id = 0
+        self.scratch_model = None
+        self.scratch_units = []
+        self.scratch_user = None
+        self.checklist_item_ids = [1]
+        self.spare_units = []
+        self.spare_shipments = []
+        self.spare_users = []
+
+    @classmethod
+    def sample(cls):
+        """Random ids, serials, customers and shipping dates from the current database."""
+        conn = get_db_connection()
+        if conn is None:
+            raise SystemExit("Unable to connect to the database.")
+        try:
+            cursor = conn.cursor()
+            # TABLESAMPLE keeps sampling cheap at the 1m scale.
+            cursor.execute("SELECT id, customer_name, shipping_date FROM shipments TABLESAMPLE SYSTEM (5) LIMIT %s", (POOL_SIZE,))
+            shipments = cursor.fetchall()
+            if len(shipments) < 10:
+                cursor.execute("SELECT id, customer_name, shipping_date FROM shipments ORDER BY random() LIMIT %s", (POOL_SIZE,))
+                shipments = cursor.fetchall()
+            cursor.execute("SELECT serial_number FROM shipped_units TABLESAMPLE SYSTEM (1) LIMIT %s", (POOL_SIZE,))
+            serials = [row[0] for row in cursor.fetchall()]
+            if len(serials) < 10:
+                cursor.execute("SELECT serial_number FROM shipped_units ORDER BY random() LIMIT %s", (POOL_SIZE,))
+                serials = [row[0] for row in cursor.fetchall()]
+            # Poll the change feed for roughly the last thousand writes, not the whole database.
+            cursor.execute("SELECT GREATEST(COALESCE(MAX(row_version), 0) - 1000, 0) FROM shipped_units")
+            change_token = str(cursor.fetchone()[0])
+            cursor.execute("SELECT part_number FROM model_numbers ORDER BY random() LIMIT %s", (POOL_SIZE,))
+            part_numbers = [row[0] for row in cursor.fetchall()]
+            cursor.close()
+        finally:
+            conn.close()
+        return cls(
+            [row[0] for row in shipments],
+            serials,
+            sorted({row[1] for row in shipments}),
+            [row[2] for row in shipments],
+            change_token,
+            part_numbers,
+        )
+
+    def prepare_writes(self, spares):
+        """Create the scratch rows the write scenarios use, with ``spares`` rows per DELETE scenario."""
+        conn = get_db_connection()
+        if conn is None:
+            raise SystemExit("Unable to connect to the database.")
+        stamp = datetime.datetime.now().strftime('%Y%m%d%H%M%S')
+        today = datetime.date.today()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO model_numbers (model_type, description, part_number) VALUES ('BENCH', 'bench', %s) "
+                "RETURNING model_id, model_type, part_number",
+                (f"{BENCH_PREFIX}{stamp}",)
+            )
+            self.scratch_model = cursor.fetchone()
+            shipment_ids = []
+            for index in range(spares + 1):
+                cursor.execute(
+                    "INSERT INTO shipments (customer_name, job_number, shipping_date, qc_name) "
+                    "VALUES ('Bench', %s, %s, 'bench') RETURNING id",
+                    (f"{BENCH_PREFIX}{stamp}-{index}", today)
+                )
+                shipment_ids.append(cursor.fetchone()[0])
+            self.scratch_shipment_id, self.spare_shipments = shipment_ids[0], shipment_ids[1:]
+            units = []
+            for index in range(SCRATCH_UNITS + spares):
+                serial = f"{BENCH_PREFIX}{stamp}-{index}"
+                cursor.execute(
+                    """
+                    INSERT INTO shipped_units (shipment_id, shipping_date, model_type, part_number, serial_number)
+                    VALUES (%s, %s, %s, %s, %s) RETURNING unit_id
+                    """,
+                    (self.scratch_shipment_id, today, self.scratch_model[1], self.scratch_model[2], serial)
+                )
+                units.append((cursor.fetchone()[0], serial))
+            self.scratch_units = units[:SCRATCH_UNITS]
+            self.spare_units = [unit_id for unit_id, _serial in units[SCRATCH_UNITS:]]
+            user_ids = []
+            for index in range(spares + 1):
+                cursor.execute(
+                    "INSERT INTO users (username, password_hash, role) VALUES (%s, 'x', 'viewer') RETURNING id, username",
+                    (f"{BENCH_USER_PREFIX}{stamp}-{index}",)
+                )
+                user_ids.append(cursor.fetchone())
+            self.scratch_user, self.spare_users = user_ids[0], [row[0] for row in user_ids[1:]]
+            cursor.execute("SELECT item_id FROM checklist_master_items WHERE is_active = TRUE")
+            self.checklist_item_ids = [row[0] for row in cursor.fetchall()] or [1]
+            conn.commit()
+            cursor.close()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+
+def cleanup_writes():
+    """Delete every row created by prepare_writes() or the write scenarios. Returns the counts."""
+    conn = get_db_connection()
+    if conn is None:
+        return {}
+    try:
+        cursor = conn.cursor()
+        counts = {}
+        # Units and checklist responses go with their shipments; models only once their units are gone.
+        for table, condition in (
+            ('shipments', "job_number LIKE %s"),
+            ('shipped_units', "serial_number LIKE %s"),
+            ('model_numbers', "part_number LIKE %s"),
+            ('users', "username LIKE %s"),
+        ):
+            prefix = BENCH_USER_PREFIX if table == 'users' else BENCH_PREFIX
+            cursor.execute(f"DELETE FROM {table} WHERE {condition}", (prefix + '%',))
+            counts[table] = cursor.rowcount
+        conn.commit()
+        cursor.close()
+        return counts
+    finally:
+        conn.close()
+
+
+def dataset_counts():
+    conn = get_db_connection()
+    if conn is None:
+        return {}
+    try:
+        cursor = conn.cursor()
+        counts = {}
+        for table in ('shipments', 'shipped_units', 'shipment_checklist_responses', 'model_numbers'):
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            counts[table] = cursor.fetchone()[0]
+        cursor.close()
+        return counts
+    finally:
+        conn.close()
+
+
+def _week_range(day):
+    start = day - datetime.timedelta(days=(day.weekday() + 1) % 7)
+    return start, start + datetime.timedelta(days=6)
+
+
+def _month_range(day):
+    start = day.replace(day=1)
+    return start, start + datetime.timedelta(days=30)
+
+
+def _shipments_list(pools, rng):
+    params = f"page={rng.randint(1, 20)}&limit=10"
+    if rng.random() < 0.5:
+        params += f"&search={rng.choice(pools.customers).replace(' ', '+')}"
+    return 'GET', f"/api/shipments?{params}", None
+
+
+def _dashboard(pools, rng):
+    params = f"page={rng.randint(1, 5)}&limit=10"
+    if rng.random() < 0.5:
+        start, end = _month_range(rng.choice(pools.dates))
+        params += f"&start_date={start}&end_date={end}"
+    return 'GET', f"/api/dashboard?{params}", None
+
+
+def _stats(pools, rng):
+    start, end = _month_range(rng.choice(pools.dates))
+    return 'GET', f"/api/shipments/stats?start_date={start}&end_date={end}", None
+
+
+def _stats_over_time(pools, rng):
+    start = rng.choice(pools.dates)
+    return 'GET', f"/api/shipments/stats/over-time?start_date={start}&end_date={start + datetime.timedelta(days=90)}", None
+
+
+def _manifest(pools, rng):
+    start, end = _week_range(rng.choice(pools.dates))
+    return 'GET', f"/api/shipments/manifest?start_date={start}&end_date={end}", None
+
+
+def _batch(pools, rng):
+    return 'POST', '/api/batch', {'requests': [
+        {'path': f"/api/shipments/{rng.choice(pools.shipment_ids)}"},
+        {'path': '/api/units/check-serial', 'params': {'serial_number': rng.choice(pools.serials)}},
+        {'path': '/api/shipments/stats'},
+    ]}
+
+
+def _take(spares):
+    # Exhausted pools yield id 0, which answers 404 and shows up as errors.
+    return spares.pop() if spares else 0
+
+
+def _new_shipment(pools, rng):
+    return 'POST', '/api/shipments', {
+        'customer_name': rng.choice(pools.customers),
+        'job_number': f"{BENCH_PREFIX}{rng.getrandbits(40):x}",
+        'shipping_date': str(datetime.date.today()),
+        'qc_name': 'bench',
+    }
+
+
+def _new_unit(pools, rng):
+    first_test_pass = rng.random() > 0.1
+    return 'POST', '/api/units', {
+        'shipment_id': pools.scratch_shipment_id,
+        'model_type': pools.scratch_model[1],
+        'part_number': pools.scratch_model[2],
+        'serial_number': f"{BENCH_PREFIX}{rng.getrandbits(48):x}",
+        'first_test_pass': first_test_pass,
+        'failed_equipment': None if first_test_pass else 'ATE1',
+        'retest_reason': None if first_test_pass else 'Gain out of spec',
+    }
+
+
+def _update_unit(pools, rng):
+    unit_id, serial = rng.choice(pools.scratch_units) if pools.scratch_units else (0, 'UNKNOWN')
+    first_test_pass = rng.random() > 0.5
+    return 'PUT', f"/api/units/{unit_id}", {
+        'model_type': pools.scratch_model[1],
+        'part_number': pools.scratch_model[2],
+        'serial_number': serial,
+        'first_test_pass': first_test_pass,
+        'failed_equipment': None if first_test_pass else 'ATE2',
+        'retest_reason': None if first_test_pass else 'Calibration drift',
+    }
+
+
+def _save_checklist_response(pools, rng):
+    return 'POST', '/api/checklist/responses', {
+        'shipment_id': pools.scratch_shipment_id,
+        'item_id': rng.choice(pools.checklist_item_ids),
+        'status': rng.choice(['Passed', 'NA']),
+        'completed_by': 'bench',
+        'completion_date': str(datetime.date.today()),
+    }
+
+
+def _new_model(pools, rng):
+    return 'POST', '/api/models', {
+        'model_type': 'BENCH', 'part_number': f"{BENCH_PREFIX}{rng.getrandbits(40):x}", 'description': 'bench',
+    }
+
+
+def _update_model(pools, rng):
+    model_id, model_type, part_number = pools.scratch_model
+    return 'PUT', f"/api/models/{model_id}", {
+        'model_type': model_type, 'part_number': part_number,
+        'description': f"bench {rng.randint(1, 1000)}", 'is_active': True,
+    }
+
+
+def _new_user(pools, rng):
+    return 'POST', '/api/users', {
+        'username': f"{BENCH_USER_PREFIX}{rng.getrandbits(40):x}", 'password': 'bench-scratch', 'role': 'viewer',
+    }
+
+
+def _scratch_user_id(pools):
+    return pools.scratch_user[0] if pools.scratch_user else 0
+
+
+# name -> (builder, writes data)
+SCENARIOS = {
+    'auth.login': (lambda pools, rng: ('POST', '/api/auth/login', pools.credentials), False),
+    'shipments.list': (_shipments_list, False),
+    'shipments.detail': (lambda pools, rng: ('GET', f"/api/shipments/{rng.choice(pools.shipment_ids)}", None), False),
+    'shipments.stats': (_stats, False),
+    'shipments.stats_over_time': (_stats_over_time, False),
+    'shipments.fpy_weekly': (lambda pools, rng: ('GET', f"/api/shipments/fpy/weekly?anchor_date={rng.choice(pools.dates)}&weeks=12", None), False),
+    'shipments.fpy_overall': (lambda pools, rng: ('GET', '/api/shipments/fpy/overall', None), False),
+    'shipments.fpy_series': (lambda pools, rng: ('GET', f"/api/shipments/fpy/series?granularity={rng.choice(['day', 'week', 'month'])}", None), False),
+    'shipments.fpy_spc': (lambda pools, rng: ('GET', '/api/shipments/fpy/spc?granularity=week', None), False),
+    'shipments.manifest': (_manifest, False),
+    'shipments.weekly': (lambda pools, rng: ('GET', f"/api/shipments/weekly?date={rng.choice(pools.dates)}", None), False),
+    'dashboard': (_dashboard, False),
+    'cube.drill_down': (lambda pools, rng: ('GET', f"/api/cube?dims={rng.choice(['part_number', 'failed_equipment', 'customer_name,part_number'])}", None), False),
+    'changes': (lambda pools, rng: ('GET', f"/api/changes?since={pools.change_token}", None), False),
+    'models.list': (lambda pools, rng: ('GET', '/api/models', None), False),
+    'units.check_serial': (lambda pools, rng: ('GET', f"/api/units/check-serial?serial_number={rng.choice(pools.serials)}", None), False),
+    'checklist.items': (lambda pools, rng: ('GET', '/api/checklist/items', None), False),
+    'users.list': (lambda pools, rng: ('GET', '/api/users', None), False),
+    'models.check_part_number': (lambda pools, rng: ('GET', f"/api/models/check_part_number?part_number={rng.choice(pools.part_numbers)}", None), False),
+    'checklist.items_manage': (lambda pools, rng: ('GET', '/api/checklist/items/manage', None), False),
+    'batch': (_batch, False),
+    'shipments.create': (_new_shipment, True),
+    'shipments.update_status': (lambda pools, rng: ('PUT', f"/api/shipments/{pools.scratch_shipment_id}/status", {'status': rng.choice(['In Progress', 'Completed'])}), True),
+    'shipments.delete': (lambda pools, rng: ('DELETE', f"/api/shipments/{_take(pools.spare_shipments)}", None), True),
+    'units.create': (_new_unit, True),
+    'units.update': (_update_unit, True),
+    'units.delete': (lambda pools, rng: ('DELETE', f"/api/units/{_take(pools.spare_units)}", None), True),
+    'checklist.save_response': (_save_checklist_response, True),
+    'models.create': (_new_model, True),
+    'models.update': (_update_model, True),
+    'users.create': (_new_user, True),
+    'users.update': (lambda pools, rng: ('PUT', f"/api/users/{_scratch_user_id(pools)}", {'username': pools.scratch_user[1] if pools.scratch_user else 'UNKNOWN', 'role': rng.choice(['viewer', 'QC'])}), True),
+    'users.toggle_active': (lambda pools, rng: ('PUT', f"/api/users/{_scratch_user_id(pools)}/toggle-active", None), True),
+    'users.reset_password': (lambda pools, rng: ('PUT', f"/api/users/{_scratch_user_id(pools)}/password", {'password': 'bench-scratch'}), True),
+    'users.delete': (lambda pools, rng: ('DELETE', f"/api/users/{_take(pools.spare_users)}", None), True),
+}
@@ -21,6 +21,7 @@ a = Analysis(
     datas=[
         ('build', 'build'),
         ('schema.sql', '.'),
+        ('migrations', 'migrations'),
         ('.env', '.')
     ],
     hiddenimports=['psycopg'],
@@ -1,33 +1,87 @@
+import logging
 import psycopg
 from psycopg.rows import dict_row
 import os
+import time
 from dotenv import load_dotenv
+from flask import g, has_request_context
+import metrics
+import slow_queries
 
 load_dotenv()
 
+logger = logging.getLogger('quality.db')
+
+
+class InstrumentedCursor(psycopg.Cursor):
+    """
+    Cursor that reports statement time and row counts to the request metrics
+    and hands statements over the slow-query threshold to the slow-query log.
+    """
+
+    def execute(self, query, params=None, **kwargs):
+        started = time.perf_counter()
+        try:
+            return super().execute(query, params, **kwargs)
+        finally:
+            self._record(query, params, time.perf_counter() - started)
+
+    def executemany(self, query, params_seq, **kwargs):
+        params_seq = list(params_seq)
+        started = time.perf_counter()
+        try:
+            return super().executemany(query, params_seq, **kwargs)
+        finally:
+            self._record(query, params_seq, time.perf_counter() - started, many=True)
+
+    def _record(self, query, params, seconds, many=False):
+        metrics.record_query(seconds, self.rowcount, query, None if many else params)
+        if seconds >= slow_queries.THRESHOLD_SECONDS:
+            slow_queries.record(self, query, params, seconds, self.rowcount, many=many)
+
+
 def get_db_connection():
+    # Reads inside POST /api/batch borrow a connection on the batch's snapshot (see routes/batch.py).
+    if has_request_context() and g.get('connection_lender') is not None:
+        return g.connection_lender.borrow()
+    return open_connection()
+
+
+def open_connection():
     try:
-        print("\n--- ATTEMPTING DB CONNECTION ---")
         db_host = os.getenv('DB_HOST')
         db_port = os.getenv('DB_PORT', '5432')
         db_user = os.getenv('DB_USER')
         db_pass = os.getenv('DB_PASSWORD')
         db_name = os.getenv('DB_NAME')
-        print(f"DEBUG_DB: HOST='{db_host}', PORT='{db_port}', USER='{db_user}', DBNAME='{db_name}'")
         if not all([db_host, db_port, db_user, db_pass, db_name]):
-            print("DEBUG_DB: ERROR: DB environment variables are MISSING.")
+            logger.error("DB environment variables are missing")
+
+        # Requests admitted by admission control carry their class's statement_timeout.
+        options = None
+        if has_request_context() and g.get('statement_timeout_ms'):
+            options = f"-c statement_timeout={int(g.statement_timeout_ms)}"
 
+        connect_started = time.perf_counter()
         conn = psycopg.connect(
             host=db_host,
             port=int(db_port),
             user=db_user,
             password=db_pass,
-            dbname=db_name
+            dbname=db_name,
+            options=options,
+            cursor_factory=InstrumentedCursor
         )
-        print("--- DB CONNECTION SUCCESSFUL ---")
+        connect_seconds = time.perf_counter() - connect_started
+        metrics.record_connect(connect_seconds)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("db connect", extra={'fields': {
+                'host': db_host, 'port': db_port, 'user': db_user, 'dbname': db_name,
+                'connect_ms': round(connect_seconds * 1000, 1),
+            }})
         return conn
     except psycopg.OperationalError as err:
-        print(f"!!!!!!!!!! DATABASE CONNECTION FAILED: {err} !!!!!!!!!!")
+        logger.error("database connection failed: %s", err)
         return None
 
 def get_dict_cursor(conn):
@@ -0,0 +1,166 @@
+"""
+Database health snapshot for /api/admin/db-health.
+
+Reads only PostgreSQL statistics views, so a snapshot costs a handful of
+catalog lookups. Each section is collected on its own. If a section fails
+(for example, pg_stat_statements is not installed, or the role cannot read
+another session's activity), that section reports ``available: false`` with
+a reason, and the other sections are still returned. Snapshots are cached
+for HEALTH_CACHE_SECONDS (default 30), so several dashboards polling at
+once cost one collection.
+"""
+
+import os
+import threading
+import time
+
+from db import get_db_connection, get_dict_cursor
+
+CACHE_SECONDS = float(os.getenv('HEALTH_CACHE_SECONDS', '30'))
+WATCHED_TABLES = ('shipments', 'shipped_units', 'shipment_checklist_responses')
+TOP_STATEMENTS = 15
+
+_lock = threading.Lock()
+_cached = None
+_cached_at = 0.0
+
+
+def _section(cursor, fn):
+    try:
+        return dict(fn(cursor), available=True)
+    except Exception as err:
+        return {'available': False, 'reason': str(err).strip().splitlines()[0]}
+
+
+def _tables(cursor):
+    cursor.execute(
+        """
+        SELECT s.relname AS table_name, root.relname AS parent_table,
+               s.seq_scan, s.seq_tup_read, s.idx_scan, s.idx_tup_fetch,
+               s.n_live_tup, s.n_dead_tup,
+               s.last_autovacuum, s.last_vacuum, s.last_autoanalyze, s.last_analyze,
+               s.autovacuum_count,
+               pg_total_relation_size(s.relid) AS total_bytes,
+               io.heap_blks_read, io.heap_blks_hit
+        FROM pg_stat_user_tables s
+        JOIN pg_statio_user_tables io ON io.relid = s.relid
+        -- Partitions (shipments_y2025, ...) are reported under their parent table.
+        JOIN pg_class root ON root.oid = COALESCE(pg_partition_root(s.relid), s.relid)
+        WHERE root.relname = ANY(%s)
+        ORDER BY root.relname, s.relname
+        """,
+        (list(WATCHED_TABLES),)
+    )
+    tables = []
+    for row in cursor.fetchall():
+        scans = (row['seq_scan'] or 0) + (row['idx_scan'] or 0)
+        live_and_dead = (row['n_live_tup'] or 0) + (row['n_dead_tup'] or 0)
+        blocks = (row['heap_blks_read'] or 0) + (row['heap_blks_hit'] or 0)
+        tables.append(dict(
+            row,
+            seq_scan_ratio=round(row['seq_scan'] / scans, 4) if scans else None,
+            dead_tuple_ratio=round(row['n_dead_tup'] / live_and_dead, 4) if live_and_dead else None,
+            cache_hit_ratio=round(row['heap_blks_hit'] / blocks, 4) if blocks else None,
+        ))
+    return {'tables': tables}
+
+
+def _cache(cursor):
+    cursor.execute(
+        """
+        SELECT blks_hit, blks_read, xact_commit, xact_rollback, deadlocks, temp_files, temp_bytes
+        FROM pg_stat_database
+        WHERE datname = current_database()
+        """
+    )
+    row = cursor.fetchone()
+    blocks = row['blks_hit'] + row['blks_read']
+    return dict(row, hit_ratio=round(row['blks_hit'] / blocks, 4) if blocks else None)
+
+
+def _connections(cursor):
+    cursor.execute(
+        """
+        SELECT COALESCE(state, 'unknown') AS state, COUNT(*) AS count,
+               MAX(EXTRACT(EPOCH FROM (now() - xact_start))) AS oldest_xact_seconds
+        FROM pg_stat_activity
+        WHERE datname = current_database()
+        GROUP BY 1
+        ORDER BY 1
+        """
+    )
+    by_state = {row['state']: {'count': row['count'], 'oldest_xact_seconds': row['oldest_xact_seconds']}
+                for row in cursor.fetchall()}
+    cursor.execute("SELECT current_setting('max_connections')::int AS max_connections")
+    return {
+        'by_state': by_state,
+        'total': sum(state['count'] for state in by_state.values()),
+        'max_connections': cursor.fetchone()['max_connections'],
+    }
+
+
+def _statements(cursor):
+    cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'")
+    if cursor.fetchone() is None:
+        raise RuntimeError('pg_stat_statements extension is not installed')
+    # Column names changed in PostgreSQL 13.
+    cursor.execute("SELECT current_setting('server_version_num')::int AS version")
+    prefix = '' if cursor.fetchone()['version'] < 130000 else 'exec_'
+    cursor.execute(
+        f"""
+        SELECT LEFT(regexp_replace(query, '\\s+', ' ', 'g'), 500) AS query,
+               calls,
+               total_{prefix}time AS total_ms,
+               mean_{prefix}time AS mean_ms,
+               rows,
+               shared_blks_hit, shared_blks_read
+        FROM pg_stat_statements
+        WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+        ORDER BY total_{prefix}time DESC
+        LIMIT %s
+        """,
+        (TOP_STATEMENTS,)
+    )
+    statements = []
+    for row in cursor.fetchall():
+        blocks = row['shared_blks_hit'] + row['shared_blks_read']
+        statements.append(dict(
+            row,
+            total_ms=round(row['total_ms'], 1),
+            mean_ms=round(row['mean_ms'], 2),
+            cache_hit_ratio=round(row['shared_blks_hit'] / blocks, 4) if blocks else None,
+        ))
+    return {'top_statements': statements}
+
+
+def collect():
+    conn = get_db_connection()
+    if conn is None:
+        return None
+    # Autocommit so one failing section does not abort the others.
+    conn.autocommit = True
+    try:
+        cursor = get_dict_cursor(conn)
+        snapshot = {
+            'collected_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'tables': _section(cursor, _tables),
+            'buffer_cache': _section(cursor, _cache),
+            'connections': _section(cursor, _connections),
+            'statements': _section(cursor, _statements),
+        }
+        cursor.close()
+        return snapshot
+    finally:
+        conn.close()
+
+
+def snapshot(force=False):
+    """Cached health snapshot, or None when the database is unreachable."""
+    global _cached, _cached_at
+    with _lock:
+        if not force and _cached is not None and time.monotonic() - _cached_at < CACHE_SECONDS:
+            return _cached
+        result = collect()
+        if result is not None:
+            _cached, _cached_at = result, time.monotonic()
+        return result
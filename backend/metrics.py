@@ -0,0 +1,254 @@
+"""
+In-process request and database metrics, exposed in Prometheus text format
+at /api/metrics.
+
+During a request, counters accumulate in ``flask.g`` without locking. They
+are merged into the shared registry once, when the response is sent.
+
+Under ``flask serve`` every worker process has its own registry, and a
+scrape reaches whichever worker accepts it. Each worker therefore writes a
+snapshot of its registry to METRICS_DIR (default LOG_DIR/metrics) with every
+heartbeat, and /api/metrics returns the series of all live workers, labelled
+``worker`` (slot) and ``pid``. Sum over those labels in queries. Other
+workers' series are up to one heartbeat (5 s) old. A restarted worker starts
+new series under its new pid, and the old worker's series drop out once its
+snapshot is SNAPSHOT_MAX_AGE_SECONDS old.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+from flask import Response, g, has_request_context, request
+
+import app_logging
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+SNAPSHOT_DIR = os.getenv('METRICS_DIR', os.path.join(app_logging.LOG_DIR, 'metrics'))
+SNAPSHOT_MAX_AGE_SECONDS = 30
+# Set by the query-budget harness (bench.querycheck) to keep each request's
+# statements and parameters in g.db_stats['statements']. Off in the server.
+capture_statements = False
+
+
+class _Histogram:
+    __slots__ = ('counts', 'total', 'count')
+
+    def __init__(self, buckets):
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, buckets, value):
+        for index, bound in enumerate(buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)
+        self.latency = defaultdict(lambda: _Histogram(LATENCY_BUCKETS))
+        self.queries_per_request = defaultdict(lambda: _Histogram(QUERY_COUNT_BUCKETS))
+        self.db_queries = defaultdict(int)
+        self.db_seconds = defaultdict(float)
+        self.db_rows = defaultdict(int)
+        self.db_connect_seconds = defaultdict(float)
+
+    def record_request(self, endpoint, method, status, duration, db):
+        with self._lock:
+            self.requests[(endpoint, method, status)] += 1
+            self.latency[endpoint].observe(LATENCY_BUCKETS, duration)
+            self.queries_per_request[endpoint].observe(QUERY_COUNT_BUCKETS, db['queries'])
+            self.db_queries[endpoint] += db['queries']
+            self.db_seconds[endpoint] += db['seconds']
+            self.db_rows[endpoint] += db['rows']
+            self.db_connect_seconds[endpoint] += db['connect_seconds']
+
+    def total_requests(self):
+        with self._lock:
+            return sum(self.requests.values())
+
+    def snapshot(self):
+        """Every series as plain lists and dicts, for rendering or for another process."""
+        with self._lock:
+            return {
+                'requests': [[*key, value] for key, value in self.requests.items()],
+                'latency': {endpoint: [h.counts, h.total, h.count] for endpoint, h in self.latency.items()},
+                'queries_per_request': {
+                    endpoint: [h.counts, h.total, h.count] for endpoint, h in self.queries_per_request.items()
+                },
+                'db_queries': dict(self.db_queries),
+                'db_seconds': dict(self.db_seconds),
+                'db_rows': dict(self.db_rows),
+                'db_connect_seconds': dict(self.db_connect_seconds),
+            }
+
+    def render(self):
+        return render([('', self.snapshot())])
+
+
+def _labels(**labels):
+    return ",".join(f'{name}="{value}"' for name, value in labels.items())
+
+
+def render(snapshots):
+    """Prometheus text for ``(label_prefix, snapshot)`` pairs; the prefix is '' or 'name="value",...,'."""
+    lines = [
+        "# HELP quality_http_requests_total HTTP requests by endpoint, method and status.",
+        "# TYPE quality_http_requests_total counter",
+    ]
+    for prefix, snapshot in snapshots:
+        for endpoint, method, status, value in sorted(snapshot['requests'], key=lambda row: row[:3]):
+            lines.append(f'quality_http_requests_total{{{prefix}'
+                         f'{_labels(endpoint=endpoint, method=method, status=status)}}} {value}')
+
+    _render_histogram(lines, 'quality_http_request_duration_seconds', 'Request latency in seconds.',
+                      [(prefix, snapshot['latency']) for prefix, snapshot in snapshots], LATENCY_BUCKETS)
+    _render_histogram(lines, 'quality_db_queries_per_request', 'SQL statements issued per request.',
+                      [(prefix, snapshot['queries_per_request']) for prefix, snapshot in snapshots],
+                      QUERY_COUNT_BUCKETS)
+
+    for name, help_text, key in (
+        ('quality_db_queries_total', 'SQL statements executed.', 'db_queries'),
+        ('quality_db_query_seconds_total', 'Time spent executing SQL.', 'db_seconds'),
+        ('quality_db_rows_total', 'Rows returned or affected by SQL.', 'db_rows'),
+        ('quality_db_connect_seconds_total', 'Time spent waiting for database connections.', 'db_connect_seconds'),
+    ):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for prefix, snapshot in snapshots:
+            for endpoint, value in sorted(snapshot[key].items()):
+                lines.append(f'{name}{{{prefix}endpoint="{endpoint}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def _render_histogram(lines, name, help_text, series, buckets):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for prefix, histograms in series:
+        for endpoint, (counts, total, count) in sorted(histograms.items()):
+            labels = f'{prefix}endpoint="{endpoint}"'
+            for bound, bucket_count in zip(buckets, counts):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {bucket_count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'{name}_sum{{{labels}}} {total}')
+            lines.append(f'{name}_count{{{labels}}} {count}')
+
+
+registry = MetricsRegistry()
+# Set in ``flask serve`` workers by ``enable_worker_snapshots``.
+_worker = None
+
+
+def _snapshot_path(worker, pid):
+    return os.path.join(SNAPSHOT_DIR, f"worker-{worker}-{pid}.json")
+
+
+def enable_worker_snapshots(worker):
+    """Make this process a ``flask serve`` worker whose metrics are shared through SNAPSHOT_DIR."""
+    global _worker
+    _worker = (str(worker), str(os.getpid()))
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+
+
+def write_snapshot():
+    """Publish this worker's registry for the other workers' scrapes. Called on every heartbeat."""
+    if _worker is None:
+        return
+    path = _snapshot_path(*_worker)
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as f:
+        json.dump({'worker': _worker[0], 'pid': _worker[1], 'metrics': registry.snapshot()}, f)
+    os.replace(temporary, path)
+
+
+def remove_snapshot():
+    if _worker is not None:
+        try:
+            os.remove(_snapshot_path(*_worker))
+        except OSError:
+            pass
+
+
+def _all_snapshots():
+    """(label prefix, snapshot) for this process and, in a worker, every other live worker."""
+    if _worker is None:
+        return [('', registry.snapshot())]
+    own = os.path.basename(_snapshot_path(*_worker))
+    snapshots = [(_labels(worker=_worker[0], pid=_worker[1]) + ',', registry.snapshot())]
+    now = time.time()
+    try:
+        names = os.listdir(SNAPSHOT_DIR)
+    except OSError:
+        names = []
+    for name in sorted(names):
+        if name == own or not (name.startswith('worker-') and name.endswith('.json')):
+            continue
+        path = os.path.join(SNAPSHOT_DIR, name)
+        try:
+            if now - os.path.getmtime(path) > SNAPSHOT_MAX_AGE_SECONDS:
+                os.remove(path)
+                continue
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        snapshots.append((_labels(worker=data['worker'], pid=data['pid']) + ',', data['metrics']))
+    return snapshots
+
+
+def _db_stats():
+    if not has_request_context():
+        return None
+    stats = g.get('db_stats')
+    if stats is None:
+        stats = {'queries': 0, 'seconds': 0.0, 'rows': 0, 'connect_seconds': 0.0}
+        g.db_stats = stats
+    return stats
+
+
+def record_query(seconds, rows, query=None, params=None):
+    """Called by the instrumented cursor after every statement."""
+    stats = _db_stats()
+    if stats is not None:
+        stats['queries'] += 1
+        stats['seconds'] += seconds
+        stats['rows'] += max(rows, 0)
+        if capture_statements:
+            stats.setdefault('statements', []).append((query, params))
+
+
+def record_connect(seconds):
+    stats = _db_stats()
+    if stats is not None:
+        stats['connect_seconds'] += seconds
+
+
+def init_app(app):
+    @app.before_request
+    def start_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record(response):
+        started = g.get('request_started')
+        if started is not None:
+            registry.record_request(
+                request.endpoint or 'unmatched',
+                request.method,
+                response.status_code,
+                time.perf_counter() - started,
+                _db_stats()
+            )
+        return response
+
+    @app.route('/api/metrics', methods=['GET'])
+    def metrics():
+        return Response(render(_all_snapshots()), mimetype='text/plain; version=0.0.4')
@@ -8,15 +8,36 @@ Override via the SRC_ENV_PATH environment variable if needed.
 
 Usage (from the backend directory):
     python migrate_mysql_to_postgres.py
+    python migrate_mysql_to_postgres.py --stream [--workers 3] [--chunk-size 5000]
+    python migrate_mysql_to_postgres.py --verify-only
+
+The default mode reads each table whole and inserts it with executemany,
+which is fine for small databases.
+
+--stream is for large ones. Each table is read through an unbuffered MySQL
+cursor in primary-key order and loaded with COPY, --chunk-size rows at a
+time. Tables that do not depend on each other are copied in parallel.
+After every chunk the last copied key is committed to the
+mysql_migration_checkpoints table, in the same transaction as the rows.
+After a failure, running the same command again resumes where it stopped;
+--restart starts over. Finally, each table's row count and checksum are
+compared between MySQL and PostgreSQL (--verify-only runs just that check).
+The exit status is 1 on any mismatch.
 """
 
 from __future__ import annotations
 
+import argparse
+import datetime
+import hashlib
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import os
 from pathlib import Path
-from typing import Callable, List, Sequence
+from typing import Callable, Iterator, List, Sequence
 
 try:
     import mysql.connector  # type: ignore
@@ -37,6 +58,18 @@ PROJECT_ROOT = BACKEND_DIR.parent
 DEFAULT_SRC_ENV = PROJECT_ROOT.with_name("quality-v2") / "backend" / ".env"
 DEFAULT_DEST_ENV = BACKEND_DIR / ".env"
 
+TARGET_TABLES = [
+    "shipment_checklist_responses",
+    "shipped_units",
+    "shipments",
+    "users",
+    "checklist_master_items",
+    "model_numbers",
+]
+# Created by ``flask partition-tables``; they hold one row per unit serial.
+SERIAL_REGISTRIES = ["shipped_unit_serials", "shipped_unit_original_serials"]
+CHECKPOINT_TABLE = "mysql_migration_checkpoints"
+
 
 def load_env(path: Path) -> dict[str, str]:
     if not path.exists():
@@ -65,65 +98,29 @@ class TableMigration:
     columns: Sequence[str]
     transform: Callable[[dict], Sequence] | None = None
     truncate_first: bool = False
+    primary_key: str = "id"
+    # Tables whose rows must be loaded first (foreign keys, looked-up values).
+    depends_on: Sequence[str] = ()
+    # Target columns, when they differ from the source columns read from MySQL.
+    dest_columns: Sequence[str] | None = None
 
     def sql_insert(self) -> str:
-        col_list = ", ".join(self.columns)
-        placeholders = ", ".join(["%s"] * len(self.columns))
+        columns = self.dest_columns or self.columns
+        col_list = ", ".join(columns)
+        placeholders = ", ".join(["%s"] * len(columns))
         return f"INSERT INTO {self.name} ({col_list}) VALUES ({placeholders})"
 
 
-def reset_identity(conn: psycopg.Connection, table: str, pk_column: str) -> None:
-    query = sql.SQL(
-        """
-        SELECT setval(
-            pg_get_serial_sequence({table_literal}, {pk_literal}),
-            COALESCE((SELECT MAX({pk_ident}) FROM {table_ident}), 0),
-            true
-        )
-        """
-    ).format(
-        table_literal=sql.Literal(table),
-        pk_literal=sql.Literal(pk_column),
-        pk_ident=sql.Identifier(pk_column),
-        table_ident=sql.Identifier(table),
-    )
-    with conn.cursor() as cur:
-        cur.execute(query)
-
-
-def main() -> None:
-    if len(sys.argv) > 1:
-        src_env_path = Path(sys.argv[1])
-    else:
-        src_env_path = Path(
-            os.environ.get("SRC_ENV_PATH", DEFAULT_SRC_ENV)  # type: ignore[arg-type]
-        )
-    dest_env_path = Path(
-        os.environ.get("DEST_ENV_PATH", DEFAULT_DEST_ENV)  # type: ignore[arg-type]
-    )
-
-    print(f"Reading MySQL credentials from: {src_env_path}")
-    src_env = load_env(src_env_path)
-    print(f"Reading PostgreSQL credentials from: {dest_env_path}")
-    dest_env = load_env(dest_env_path)
-
-    src_conn = mysql.connector.connect(
-        host=src_env.get("DB_HOST", "localhost"),
-        user=src_env.get("DB_USER"),
-        password=src_env.get("DB_PASSWORD"),
-        database=src_env.get("DB_NAME"),
-    )
-    dest_conn = psycopg.connect(
-        host=dest_env.get("DB_HOST", "localhost"),
-        port=int(dest_env.get("DB_PORT", "5432")),
-        user=dest_env.get("DB_USER"),
-        password=dest_env.get("DB_PASSWORD"),
-        dbname=dest_env.get("DB_NAME"),
-    )
-
-    tables: List[TableMigration] = [
+def build_tables(shipment_dates: dict[int, object]) -> List[TableMigration]:
+    """
+    Source-to-target mapping for every migrated table, in dependency order.
+    shipped_units rows take their shipping_date (the partition key) from
+    ``shipment_dates``, which must be filled before units are transformed.
+    """
+    return [
         TableMigration(
             name="model_numbers",
+            primary_key="model_id",
             columns=["model_id", "model_type", "description", "part_number", "is_active"],
             truncate_first=True,
             transform=lambda row: (
@@ -136,6 +133,7 @@ def main() -> None:
         ),
         TableMigration(
             name="checklist_master_items",
+            primary_key="item_id",
             columns=["item_id", "item_text", "item_order", "is_active"],
             truncate_first=True,
             transform=lambda row: (
@@ -147,6 +145,7 @@ def main() -> None:
         ),
         TableMigration(
             name="shipments",
+            primary_key="id",
             columns=["id", "customer_name", "job_number", "shipping_date", "qc_name", "status"],
             truncate_first=True,
             transform=lambda row: (
@@ -160,6 +159,7 @@ def main() -> None:
         ),
         TableMigration(
             name="users",
+            primary_key="id",
             columns=["id", "username", "password_hash", "role", "is_active", "created_at"],
             truncate_first=True,
             transform=lambda row: (
@@ -173,6 +173,8 @@ def main() -> None:
         ),
         TableMigration(
             name="shipped_units",
+            primary_key="unit_id",
+            depends_on=["shipments", "model_numbers"],
             columns=[
                 "unit_id",
                 "shipment_id",
@@ -184,10 +186,23 @@ def main() -> None:
                 "failed_equipment",
                 "retest_reason",
             ],
+            dest_columns=[
+                "unit_id",
+                "shipment_id",
+                "shipping_date",
+                "model_type",
+                "part_number",
+                "serial_number",
+                "original_serial_number",
+                "first_test_pass",
+                "failed_equipment",
+                "retest_reason",
+            ],
             truncate_first=True,
             transform=lambda row: (
                 row["unit_id"],
                 row["shipment_id"],
+                shipment_dates[row["shipment_id"]],
                 row["model_type"],
                 row["part_number"],
                 row["serial_number"],
@@ -199,6 +214,8 @@ def main() -> None:
         ),
         TableMigration(
             name="shipment_checklist_responses",
+            primary_key="response_id",
+            depends_on=["shipments", "checklist_master_items"],
             columns=[
                 "response_id",
                 "shipment_id",
@@ -221,6 +238,62 @@ def main() -> None:
         ),
     ]
 
+
+def reset_identity(conn: psycopg.Connection, table: str, pk_column: str) -> None:
+    query = sql.SQL(
+        """
+        SELECT setval(
+            pg_get_serial_sequence({table_literal}, {pk_literal}),
+            COALESCE((SELECT MAX({pk_ident}) FROM {table_ident}), 0),
+            true
+        )
+        """
+    ).format(
+        table_literal=sql.Literal(table),
+        pk_literal=sql.Literal(pk_column),
+        pk_ident=sql.Identifier(pk_column),
+        table_ident=sql.Identifier(table),
+    )
+    with conn.cursor() as cur:
+        cur.execute(query)
+
+
+def connect_source(env: dict[str, str]):
+    return mysql.connector.connect(
+        host=env.get("DB_HOST", "localhost"),
+        user=env.get("DB_USER"),
+        password=env.get("DB_PASSWORD"),
+        database=env.get("DB_NAME"),
+    )
+
+
+def connect_dest(env: dict[str, str]) -> psycopg.Connection:
+    return psycopg.connect(
+        host=env.get("DB_HOST", "localhost"),
+        port=int(env.get("DB_PORT", "5432")),
+        user=env.get("DB_USER"),
+        password=env.get("DB_PASSWORD"),
+        dbname=env.get("DB_NAME"),
+    )
+
+
+def truncate_targets(cursor) -> None:
+    """Empty every target table, and the serial registries if the tables are partitioned."""
+    cursor.execute("SELECT to_regclass(name) IS NOT NULL FROM unnest(%s::text[]) AS name", (list(SERIAL_REGISTRIES),))
+    registries = [name for name, exists in zip(SERIAL_REGISTRIES, cursor.fetchall()) if exists[0]]
+    cursor.execute(
+        f"TRUNCATE TABLE {', '.join(TARGET_TABLES + registries)} RESTART IDENTITY CASCADE"
+    )
+
+
+def migrate_buffered(src_env: dict[str, str], dest_env: dict[str, str]) -> None:
+    """Read each table whole and insert it with executemany."""
+    src_conn = connect_source(src_env)
+    dest_conn = connect_dest(dest_env)
+
+    shipment_dates: dict[int, object] = {}
+    tables = build_tables(shipment_dates)
+
     src_cursor = src_conn.cursor(dictionary=True)
     dest_cursor = dest_conn.cursor()
 
@@ -234,18 +307,7 @@ def main() -> None:
     skipped_response_items: set[int] = set()
 
     try:
-        dest_cursor.execute(
-            """
-            TRUNCATE TABLE
-                shipment_checklist_responses,
-                shipped_units,
-                shipments,
-                users,
-                checklist_master_items,
-                model_numbers
-            RESTART IDENTITY CASCADE
-            """
-        )
+        truncate_targets(dest_cursor)
         dest_conn.commit()
         print("Cleared target PostgreSQL tables.")
 
@@ -297,6 +359,9 @@ def main() -> None:
                 existing_shipment_ids = {
                     row["id"] for row in rows if row.get("id") is not None
                 }
+                shipment_dates.update(
+                    (row["id"], row["shipping_date"]) for row in rows if row.get("id") is not None
+                )
 
             if not rows:
                 print("  No rows found; skipping.")
@@ -338,16 +403,8 @@ def main() -> None:
             print(msg)
 
         # Reset sequences so future inserts continue from the latest IDs.
-        sequence_map = {
-            "model_numbers": "model_id",
-            "checklist_master_items": "item_id",
-            "shipments": "id",
-            "users": "id",
-            "shipped_units": "unit_id",
-            "shipment_checklist_responses": "response_id",
-        }
-        for table_name, pk in sequence_map.items():
-            reset_identity(dest_conn, table_name, pk)
+        for table in tables:
+            reset_identity(dest_conn, table.name, table.primary_key)
 
         dest_conn.commit()
 
@@ -355,10 +412,10 @@ def main() -> None:
         dest_conn.row_factory = dict_row
         with dest_conn.cursor() as verify_cur:
             print("\nRow counts after migration:")
-            for table in sequence_map.keys():
-                verify_cur.execute(f"SELECT COUNT(*) AS count FROM {table}")
+            for table in tables:
+                verify_cur.execute(f"SELECT COUNT(*) AS count FROM {table.name}")
                 count = verify_cur.fetchone()["count"]
-                print(f"  {table}: {count}")
+                print(f"  {table.name}: {count}")
 
         if skipped_unit_shipments:
             print(
@@ -380,5 +437,382 @@ def main() -> None:
         dest_conn.close()
 
 
+
+# --- Streaming mode -------------------------------------------------------
+
+_log_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    with _log_lock:
+        print(message, flush=True)
+
+
+def ensure_checkpoint_table(conn: psycopg.Connection) -> None:
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+            table_name TEXT PRIMARY KEY,
+            last_key BIGINT,
+            rows_copied BIGINT NOT NULL DEFAULT 0,
+            rows_skipped BIGINT NOT NULL DEFAULT 0,
+            done BOOLEAN NOT NULL DEFAULT FALSE,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
+def read_checkpoints(conn: psycopg.Connection) -> dict[str, dict]:
+    with conn.cursor(row_factory=dict_row) as cur:
+        cur.execute(f"SELECT * FROM {CHECKPOINT_TABLE}")
+        return {row["table_name"]: row for row in cur.fetchall()}
+
+
+def save_checkpoint(cur, table_name: str, last_key, copied: int, skipped: int, done: bool = False) -> None:
+    cur.execute(
+        f"""
+        INSERT INTO {CHECKPOINT_TABLE} AS c (table_name, last_key, rows_copied, rows_skipped, done)
+        VALUES (%s, %s, %s, %s, %s)
+        ON CONFLICT (table_name) DO UPDATE SET
+            last_key = COALESCE(EXCLUDED.last_key, c.last_key),
+            rows_copied = c.rows_copied + EXCLUDED.rows_copied,
+            rows_skipped = c.rows_skipped + EXCLUDED.rows_skipped,
+            done = EXCLUDED.done,
+            updated_at = CURRENT_TIMESTAMP
+        """,
+        (table_name, last_key, copied, skipped, done),
+    )
+
+
+def stream_source(src_conn, table: TableMigration, after_key, chunk_size: int) -> Iterator[list[dict]]:
+    """
+    Yield the source rows after ``after_key`` in primary-key order, in chunks
+    of ``chunk_size``. The cursor is unbuffered, so MySQL streams the result
+    and only one chunk is held in memory.
+    """
+    cursor = src_conn.cursor(dictionary=True, buffered=False)
+    query = f"SELECT {', '.join(table.columns)} FROM {table.name}"
+    params: tuple = ()
+    if after_key is not None:
+        query += f" WHERE {table.primary_key} > %s"
+        params = (after_key,)
+    cursor.execute(query + f" ORDER BY {table.primary_key}", params)
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    finally:
+        cursor.close()
+
+
+def target_row(table: TableMigration, row: dict) -> Sequence:
+    return table.transform(row) if table.transform else tuple(row[col] for col in table.columns)
+
+
+class References:
+    """
+    Keys already loaded into PostgreSQL that dependent rows must point at.
+    Rows that reference a missing shipment or checklist item are skipped, as
+    in the buffered mode; unknown part numbers get placeholder models.
+    """
+
+    def __init__(self, dest_conn: psycopg.Connection, shipment_dates: dict[int, object]):
+        with dest_conn.cursor() as cur:
+            cur.execute("SELECT id, shipping_date FROM shipments")
+            shipment_dates.update(cur.fetchall())
+            cur.execute("SELECT item_id FROM checklist_master_items")
+            self.checklist_item_ids = {row[0] for row in cur.fetchall()}
+            cur.execute("SELECT part_number FROM model_numbers")
+            self.part_numbers = {row[0] for row in cur.fetchall()}
+        self.shipment_dates = shipment_dates
+        self.missing: dict[str, set[int]] = {"shipments": set(), "checklist items": set()}
+        self._lock = threading.Lock()
+
+    def keep(self, table_name: str, row: dict, record: bool = True) -> bool:
+        missing = []
+        if table_name in ("shipped_units", "shipment_checklist_responses"):
+            if row.get("shipment_id") not in self.shipment_dates:
+                missing.append(("shipments", row.get("shipment_id")))
+        if table_name == "shipment_checklist_responses":
+            if row.get("item_id") not in self.checklist_item_ids:
+                missing.append(("checklist items", row.get("item_id")))
+        if missing and record:
+            with self._lock:
+                for kind, key in missing:
+                    if key is not None:
+                        self.missing[kind].add(key)
+        return not missing
+
+    def add_placeholder_models(self, cur, rows: list[dict]) -> dict[str, str]:
+        """Insert placeholder models for unknown part numbers. Returns them; the caller records them after commit."""
+        new_models = {}
+        for row in rows:
+            part_number = row.get("part_number")
+            if part_number and part_number not in self.part_numbers:
+                new_models[part_number] = row.get("model_type") or "Unknown Model"
+        if new_models:
+            cur.executemany(
+                "INSERT INTO model_numbers (model_type, part_number, is_active) VALUES (%s, %s, TRUE) "
+                "ON CONFLICT (part_number) DO NOTHING",
+                [(model_type, part_number) for part_number, model_type in new_models.items()],
+            )
+        return new_models
+
+
+def stream_table(
+    table: TableMigration,
+    src_env: dict[str, str],
+    dest_env: dict[str, str],
+    chunk_size: int,
+    refs: References | None,
+) -> dict:
+    """
+    Copy one table chunk by chunk. Each chunk's COPY and its checkpoint
+    commit together, so a rerun resumes after the last committed key.
+    """
+    src_conn = connect_source(src_env)
+    dest_conn = connect_dest(dest_env)
+    dest_conn.autocommit = True
+    started = time.perf_counter()
+    try:
+        checkpoint = read_checkpoints(dest_conn).get(table.name) or {}
+        copied = checkpoint.get("rows_copied", 0)
+        skipped = checkpoint.get("rows_skipped", 0)
+        if checkpoint.get("done"):
+            log(f"{table.name}: already complete ({copied} rows); skipping.")
+            return {"table": table.name, "copied": copied, "skipped": skipped, "seconds": 0.0}
+        last_key = checkpoint.get("last_key")
+        if last_key is not None:
+            log(f"{table.name}: resuming after {table.primary_key} {last_key} ({copied} rows already copied).")
+
+        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table.name),
+            sql.SQL(", ").join(sql.Identifier(col) for col in table.dest_columns or table.columns),
+        )
+        this_run = 0
+        for rows in stream_source(src_conn, table, last_key, chunk_size):
+            keep = [row for row in rows if refs is None or refs.keep(table.name, row)]
+            new_models: dict[str, str] = {}
+            with dest_conn.transaction(), dest_conn.cursor() as cur:
+                if refs is not None and table.name == "shipped_units":
+                    new_models = refs.add_placeholder_models(cur, keep)
+                with cur.copy(copy_sql) as copy:
+                    for row in keep:
+                        copy.write_row(target_row(table, row))
+                save_checkpoint(cur, table.name, rows[-1][table.primary_key], len(keep), len(rows) - len(keep))
+            if new_models:
+                refs.part_numbers.update(new_models)
+                log(f"{table.name}: created placeholder models for {', '.join(sorted(new_models))}")
+            copied += len(keep)
+            skipped += len(rows) - len(keep)
+            this_run += len(keep)
+            elapsed = time.perf_counter() - started
+            log(f"{table.name}: {copied} rows ({this_run / elapsed:,.0f} rows/s)")
+        with dest_conn.cursor() as cur:
+            save_checkpoint(cur, table.name, None, 0, 0, done=True)
+        seconds = time.perf_counter() - started
+        log(f"{table.name}: done, {copied} rows in {seconds:.1f}s" + (f", skipped {skipped}" if skipped else ""))
+        return {"table": table.name, "copied": copied, "skipped": skipped, "seconds": seconds}
+    finally:
+        src_conn.close()
+        dest_conn.close()
+
+
+def migration_levels(tables: List[TableMigration]) -> List[List[TableMigration]]:
+    """Group tables into levels; tables in one level only depend on earlier levels."""
+    loaded: set[str] = set()
+    levels = []
+    remaining = list(tables)
+    while remaining:
+        level = [table for table in remaining if set(table.depends_on) <= loaded]
+        if not level:
+            raise SystemExit(f"Unresolvable table dependencies: {[table.name for table in remaining]}")
+        levels.append(level)
+        loaded.update(table.name for table in level)
+        remaining = [table for table in remaining if table.name not in loaded]
+    return levels
+
+
+def run_parallel(fn, tables: List[TableMigration], workers: int, *args) -> list:
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tables)))) as executor:
+        futures = [executor.submit(fn, table, *args) for table in tables]
+        return [future.result() for future in futures]
+
+
+def migrate_streaming(
+    src_env: dict[str, str],
+    dest_env: dict[str, str],
+    workers: int,
+    chunk_size: int,
+    restart: bool,
+) -> bool:
+    """Copy all tables with COPY, independent tables in parallel, then verify. Returns True if verified."""
+    dest_conn = connect_dest(dest_env)
+    dest_conn.autocommit = True
+    started = time.perf_counter()
+    try:
+        ensure_checkpoint_table(dest_conn)
+        checkpoints = read_checkpoints(dest_conn)
+        if restart or not checkpoints:
+            with dest_conn.cursor() as cur:
+                truncate_targets(cur)
+                cur.execute(f"TRUNCATE {CHECKPOINT_TABLE}")
+            log("Cleared target PostgreSQL tables.")
+        else:
+            log(f"Resuming: {sum(1 for c in checkpoints.values() if c['done'])} of {len(TARGET_TABLES)} tables complete.")
+
+        shipment_dates: dict[int, object] = {}
+        tables = build_tables(shipment_dates)
+        refs = None
+        results = []
+        for level in migration_levels(tables):
+            if any(table.depends_on for table in level):
+                refs = References(dest_conn, shipment_dates)
+            log(f"Copying {', '.join(table.name for table in level)}...")
+            results.extend(run_parallel(stream_table, level, workers, src_env, dest_env, chunk_size, refs))
+            # Identities must continue past the copied ids before the next
+            # level inserts placeholder models.
+            for table in level:
+                reset_identity(dest_conn, table.name, table.primary_key)
+    finally:
+        dest_conn.close()
+
+    log(f"\nCopied in {time.perf_counter() - started:.1f}s:")
+    for result in results:
+        log(f"  {result['table']:<30} {result['copied']:>10} rows  {result['seconds']:>8.1f}s"
+            + (f"  skipped {result['skipped']}" if result["skipped"] else ""))
+    if refs is not None:
+        for kind, keys in refs.missing.items():
+            if keys:
+                log(f"Rows skipped because these {kind} are missing: {sorted(keys)}")
+    return verify(src_env, dest_env, workers, chunk_size)
+
+
+# --- Verification ---------------------------------------------------------
+
+
+def row_digest(values: Sequence) -> int:
+    # PostgreSQL returns timestamps with the session time zone; MySQL returns
+    # them naive, in the zone PostgreSQL read them in.
+    canonical = tuple(
+        value.replace(tzinfo=None) if isinstance(value, datetime.datetime) else value for value in values
+    )
+    return int.from_bytes(hashlib.blake2b(repr(canonical).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def fingerprint(rows) -> tuple[int, int]:
+    """Row count and an order-independent checksum (sum of row digests mod 2**64)."""
+    count = total = 0
+    for values in rows:
+        count += 1
+        total = (total + row_digest(values)) % 2**64
+    return count, total
+
+
+def verify_table(
+    table: TableMigration,
+    src_env: dict[str, str],
+    dest_env: dict[str, str],
+    refs: References,
+    chunk_size: int,
+) -> dict:
+    """
+    Compare a table's row count and checksum on both sides. Source rows go
+    through the same filter and transform as the copy. Target rows are read
+    up to the highest source key, so placeholder models and rows written
+    since the migration are left out.
+    """
+    src_conn = connect_source(src_env)
+    dest_conn = connect_dest(dest_env)
+    last_key = None
+
+    def source_rows():
+        nonlocal last_key
+        for rows in stream_source(src_conn, table, None, chunk_size):
+            for row in rows:
+                if refs.keep(table.name, row, record=False):
+                    last_key = row[table.primary_key]
+                    yield target_row(table, row)
+
+    try:
+        source = fingerprint(source_rows())
+        columns = sql.SQL(", ").join(sql.Identifier(col) for col in table.dest_columns or table.columns)
+        # Named cursor: PostgreSQL streams the rows server-side, itersize at a time.
+        with dest_conn.cursor(name=f"verify_{table.name}") as cur:
+            cur.itersize = chunk_size
+            cur.execute(
+                sql.SQL("SELECT {} FROM {} WHERE {} <= %s ORDER BY {}").format(
+                    columns, sql.Identifier(table.name), sql.Identifier(table.primary_key), sql.Identifier(table.primary_key)
+                ),
+                (last_key if last_key is not None else 0,),
+            )
+            target = fingerprint(cur)
+        dest_conn.rollback()
+        return {"table": table.name, "source": source, "target": target}
+    finally:
+        src_conn.close()
+        dest_conn.close()
+
+
+def verify(src_env: dict[str, str], dest_env: dict[str, str], workers: int, chunk_size: int) -> bool:
+    started = time.perf_counter()
+    shipment_dates: dict[int, object] = {}
+    tables = build_tables(shipment_dates)
+    dest_conn = connect_dest(dest_env)
+    try:
+        refs = References(dest_conn, shipment_dates)
+    finally:
+        dest_conn.close()
+    log("\nVerifying row counts and checksums...")
+    results = run_parallel(verify_table, tables, workers, src_env, dest_env, refs, chunk_size)
+    ok = True
+    for result in results:
+        (source_count, source_sum), (target_count, target_sum) = result["source"], result["target"]
+        matches = (source_count, source_sum) == (target_count, target_sum)
+        ok = ok and matches
+        detail = f"{source_count} rows, checksum {source_sum:016x}"
+        if not matches:
+            detail = f"source {detail}; target {target_count} rows, checksum {target_sum:016x}"
+        log(f"  {'OK      ' if matches else 'MISMATCH'} {result['table']:<30} {detail}")
+    log(f"Verification {'passed' if ok else 'FAILED'} in {time.perf_counter() - started:.1f}s.")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("src_env", nargs="?", default=os.environ.get("SRC_ENV_PATH", DEFAULT_SRC_ENV),
+                        help="legacy MySQL .env file")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream with COPY, in parallel, resumable, with verification")
+    parser.add_argument("--workers", type=int, default=3, help="tables copied at once in --stream mode")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="rows per COPY and checkpoint")
+    parser.add_argument("--restart", action="store_true", help="discard checkpoints and start over")
+    parser.add_argument("--verify-only", action="store_true", help="only compare row counts and checksums")
+    args = parser.parse_args()
+
+    src_env_path = Path(args.src_env)
+    dest_env_path = Path(
+        os.environ.get("DEST_ENV_PATH", DEFAULT_DEST_ENV)  # type: ignore[arg-type]
+    )
+    print(f"Reading MySQL credentials from: {src_env_path}")
+    src_env = load_env(src_env_path)
+    print(f"Reading PostgreSQL credentials from: {dest_env_path}")
+    dest_env = load_env(dest_env_path)
+
+    if args.verify_only:
+        sys.exit(0 if verify(src_env, dest_env, args.workers, args.chunk_size) else 1)
+    if args.stream:
+        try:
+            ok = migrate_streaming(src_env, dest_env, args.workers, args.chunk_size, args.restart)
+        except Exception as exc:
+            print(f"Migration stopped: {exc}\nRun the same command again to resume from the last checkpoint.")
+            sys.exit(1)
+        sys.exit(0 if ok else 1)
+    migrate_buffered(src_env, dest_env)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,3 @@
+-- migrate: no-transaction
+-- Units by shipment: shipment details, manifest, weekly view and every stats join.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_shipped_units_shipment_id ON shipped_units (shipment_id);
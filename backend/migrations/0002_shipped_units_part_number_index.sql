@@ -0,0 +1,3 @@
+-- migrate: no-transaction
+-- Per-part FPY and the ON DELETE RESTRICT check from model_numbers.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_shipped_units_part_number ON shipped_units (part_number);
@@ -0,0 +1,6 @@
+-- migrate: no-transaction
+-- Failed-first-test units are a few percent of the table; the retest reason and
+-- failed equipment breakdowns read only these rows.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_shipped_units_failed
+    ON shipped_units (shipment_id) INCLUDE (failed_equipment, retest_reason)
+    WHERE first_test_pass = FALSE;
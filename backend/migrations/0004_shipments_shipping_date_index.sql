@@ -0,0 +1,3 @@
+-- migrate: no-transaction
+-- Date-range filters and the newest-first listing (ORDER BY shipping_date DESC, id DESC).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_shipments_shipping_date ON shipments (shipping_date DESC, id DESC);
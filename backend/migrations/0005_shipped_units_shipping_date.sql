@@ -0,0 +1,70 @@
+-- Units carry their shipment's shipping_date. It is the partition key for
+-- yearly partitioning (flask partition-tables), and lets unit queries filter
+-- by date directly. The composite foreign key keeps it in step with the
+-- shipment: ON UPDATE CASCADE follows shipping-date edits.
+
+ALTER TABLE shipped_units ADD COLUMN IF NOT EXISTS shipping_date DATE;
+
+-- Backfill without firing row triggers: no row_version bumps, NOTIFYs or cube dirtying.
+ALTER TABLE shipped_units DISABLE TRIGGER USER;
+UPDATE shipped_units su
+SET shipping_date = s.shipping_date
+FROM shipments s
+WHERE s.id = su.shipment_id
+  AND su.shipping_date IS DISTINCT FROM s.shipping_date;
+ALTER TABLE shipped_units ENABLE TRIGGER USER;
+
+ALTER TABLE shipped_units ALTER COLUMN shipping_date SET NOT NULL;
+
+ALTER TABLE shipments ADD CONSTRAINT uq_shipments_id_shipping_date UNIQUE (id, shipping_date);
+ALTER TABLE shipped_units ADD CONSTRAINT fk_shipped_units_shipment
+    FOREIGN KEY (shipment_id, shipping_date) REFERENCES shipments (id, shipping_date)
+    ON UPDATE CASCADE ON DELETE CASCADE;
+ALTER TABLE shipped_units DROP CONSTRAINT IF EXISTS shipped_units_shipment_id_fkey;
+
+CREATE INDEX IF NOT EXISTS ix_shipped_units_shipping_date ON shipped_units (shipping_date);
+
+-- Name of the table a trigger was declared on. Triggers on a partitioned
+-- table fire on the partition, so TG_TABLE_NAME would be e.g. shipments_y2025.
+CREATE OR REPLACE FUNCTION root_table_name(rel OID) RETURNS TEXT AS $$
+    SELECT relname::text FROM pg_class WHERE oid = COALESCE(pg_partition_root(rel), rel);
+$$ LANGUAGE sql STABLE;
+
+-- TG_ARGV[0] names the primary key column of the table being tracked.
+-- On a partitioned table, a row that still exists once the statement is done
+-- moved to another partition (its shipping year changed); it was not deleted.
+CREATE OR REPLACE FUNCTION record_change_tombstone() RETURNS trigger AS $$
+DECLARE
+    root_table TEXT := root_table_name(TG_RELID);
+    deleted_id INTEGER := (to_jsonb(OLD) ->> TG_ARGV[0])::integer;
+    moved BOOLEAN := FALSE;
+BEGIN
+    IF root_table <> TG_TABLE_NAME THEN
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE %I = $1)', root_table, TG_ARGV[0])
+            INTO moved USING deleted_id;
+    END IF;
+    IF NOT moved THEN
+        INSERT INTO change_tombstones (table_name, row_id) VALUES (root_table, deleted_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notify_quality_event() RETURNS trigger AS $$
+DECLARE
+    row_data JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := to_jsonb(OLD);
+    ELSE
+        row_data := to_jsonb(NEW);
+    END IF;
+    PERFORM pg_notify('quality_events', json_build_object(
+        'table', root_table_name(TG_RELID),
+        'op', TG_OP,
+        'shipment_id', COALESCE(row_data ->> 'shipment_id', row_data ->> 'id')::integer,
+        'id', (row_data ->> TG_ARGV[0])::integer
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
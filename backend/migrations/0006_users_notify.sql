@@ -0,0 +1,26 @@
+-- Account changes for the per-process user status cache (user_status.py), so
+-- deactivated, deleted or demoted users lose access without waiting for their
+-- token to expire. A separate channel keeps them out of the SSE stream.
+-- Payload: {"op": ..., "id": ..., "is_active": ..., "role": ...}
+CREATE OR REPLACE FUNCTION notify_user_change() RETURNS trigger AS $$
+DECLARE
+    row_data users;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := OLD;
+    ELSE
+        row_data := NEW;
+    END IF;
+    PERFORM pg_notify('user_changes', json_build_object(
+        'op', TG_OP,
+        'id', row_data.id,
+        'is_active', row_data.is_active IS TRUE,
+        'role', row_data.role
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER trg_users_notify
+    AFTER INSERT OR DELETE OR UPDATE OF is_active, role ON users
+    FOR EACH ROW EXECUTE FUNCTION notify_user_change();
@@ -0,0 +1,11 @@
+-- Tombstones older than CHANGE_TOMBSTONE_RETENTION_DAYS are pruned by
+-- ``flask cube-refresh``. pruned_through is the highest tombstone version
+-- removed; a change-feed token below it may have missed deletions and gets
+-- 410 (reload everything) from /api/changes.
+CREATE INDEX IF NOT EXISTS ix_change_tombstones_deleted_at ON change_tombstones (deleted_at);
+
+CREATE TABLE IF NOT EXISTS change_feed_state (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    pruned_through BIGINT NOT NULL DEFAULT 0
+);
+INSERT INTO change_feed_state DEFAULT VALUES ON CONFLICT DO NOTHING;
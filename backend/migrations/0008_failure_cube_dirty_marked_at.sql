@@ -0,0 +1,4 @@
+-- When each month of the failure cube went stale. The cube is refreshed in
+-- the background, so /api/cube reports how old its oldest dirty month is.
+-- CURRENT_TIMESTAMP is stable, so adding the column does not rewrite the table.
+ALTER TABLE failure_cube_dirty ADD COLUMN IF NOT EXISTS marked_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP;
@@ -0,0 +1,24 @@
+-- Adding row_version with DEFAULT nextval('change_seq') in one step rewrites
+-- the table under ACCESS EXCLUSIVE, because nextval() is volatile. Add the
+-- column without a default, backfill it (row locks only), then set the
+-- default and NOT NULL. On a database that already has the column this
+-- only changes catalog entries.
+ALTER TABLE shipments ADD COLUMN IF NOT EXISTS row_version BIGINT;
+UPDATE shipments SET row_version = nextval('change_seq') WHERE row_version IS NULL;
+ALTER TABLE shipments ALTER COLUMN row_version SET DEFAULT nextval('change_seq');
+ALTER TABLE shipments ALTER COLUMN row_version SET NOT NULL;
+
+ALTER TABLE shipped_units ADD COLUMN IF NOT EXISTS row_version BIGINT;
+UPDATE shipped_units SET row_version = nextval('change_seq') WHERE row_version IS NULL;
+ALTER TABLE shipped_units ALTER COLUMN row_version SET DEFAULT nextval('change_seq');
+ALTER TABLE shipped_units ALTER COLUMN row_version SET NOT NULL;
+
+ALTER TABLE shipment_checklist_responses ADD COLUMN IF NOT EXISTS row_version BIGINT;
+UPDATE shipment_checklist_responses SET row_version = nextval('change_seq') WHERE row_version IS NULL;
+ALTER TABLE shipment_checklist_responses ALTER COLUMN row_version SET DEFAULT nextval('change_seq');
+ALTER TABLE shipment_checklist_responses ALTER COLUMN row_version SET NOT NULL;
+
+ALTER TABLE model_numbers ADD COLUMN IF NOT EXISTS row_version BIGINT;
+UPDATE model_numbers SET row_version = nextval('change_seq') WHERE row_version IS NULL;
+ALTER TABLE model_numbers ALTER COLUMN row_version SET DEFAULT nextval('change_seq');
+ALTER TABLE model_numbers ALTER COLUMN row_version SET NOT NULL;
@@ -0,0 +1,131 @@
+"""
+Process-wide PostgreSQL LISTEN/NOTIFY fan-out.
+
+A single background thread holds one dedicated connection, LISTENs on the
+requested channels and hands every notification to in-process handlers and
+to per-subscriber queues (used by the SSE stream). The thread starts lazily
+on first use, so CLI commands never open a listener connection.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+
+from psycopg import sql
+
+from db import get_db_connection
+
+logger = logging.getLogger('quality.notifications')
+
+QUALITY_EVENTS_CHANNEL = 'quality_events'
+SUBSCRIBER_QUEUE_SIZE = 256
+POLL_TIMEOUT_SECONDS = 5
+RECONNECT_DELAY_SECONDS = 5
+
+
+class NotificationListener:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels = set()
+        self._handlers = {}
+        self._subscribers = {}
+        self._thread = None
+        self._stop = threading.Event()
+
+    def add_handler(self, channel, handler):
+        """Call ``handler(payload)`` for every notification on ``channel``."""
+        with self._lock:
+            self._handlers.setdefault(channel, []).append(handler)
+            self._channels.add(channel)
+        self._ensure_started()
+
+    def subscribe(self, channel=QUALITY_EVENTS_CHANNEL):
+        """Return a bounded queue receiving ``channel`` payloads. Slow consumers drop events."""
+        subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscriber)
+            self._channels.add(channel)
+        self._ensure_started()
+        return subscriber
+
+    def unsubscribe(self, subscriber, channel=QUALITY_EVENTS_CHANNEL):
+        with self._lock:
+            self._subscribers.get(channel, set()).discard(subscriber)
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(subs) for subs in self._subscribers.values())
+
+    def stop(self):
+        self._stop.set()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='pg-notify-listener', daemon=True)
+            self._thread.start()
+
+    def _dispatch(self, channel, payload):
+        with self._lock:
+            handlers = list(self._handlers.get(channel, ()))
+            subscribers = list(self._subscribers.get(channel, ()))
+        for handler in handlers:
+            try:
+                handler(payload)
+            except Exception as err:
+                logger.exception("notification handler failed on '%s': %s", channel, err)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(payload)
+            except queue.Full:
+                pass
+
+    def _listen(self, conn, channels):
+        for channel in channels:
+            conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+
+    def _run(self):
+        first_connect = True
+        while not self._stop.is_set():
+            conn = get_db_connection()
+            if conn is None:
+                time.sleep(RECONNECT_DELAY_SECONDS)
+                continue
+            conn.autocommit = True
+            try:
+                listening = set()
+                with self._lock:
+                    channels = set(self._channels)
+                self._listen(conn, channels)
+                listening |= channels
+                if not first_connect:
+                    # Anything sent while we were disconnected is lost; tell consumers to resync.
+                    for channel in listening:
+                        self._dispatch(channel, {'op': 'RESYNC'})
+                first_connect = False
+
+                while not self._stop.is_set():
+                    for notify in conn.notifies(timeout=POLL_TIMEOUT_SECONDS):
+                        try:
+                            payload = json.loads(notify.payload) if notify.payload else {}
+                        except ValueError:
+                            payload = {'raw': notify.payload}
+                        self._dispatch(notify.channel, payload)
+                    with self._lock:
+                        new_channels = self._channels - listening
+                    if new_channels:
+                        self._listen(conn, new_channels)
+                        listening |= new_channels
+            except Exception as err:
+                logger.warning("notification listener lost its connection: %s", err)
+                time.sleep(RECONNECT_DELAY_SECONDS)
+            finally:
+                if not conn.closed:
+                    conn.close()
+
+
+listener = NotificationListener()
@@ -0,0 +1,464 @@
+"""
+Yearly range partitioning of shipments and shipped_units, and cold archiving
+of closed years.
+
+``flask partition-tables`` converts both tables, once, into tables
+partitioned BY RANGE (shipping_date). Each year gets a partition
+(shipments_y2024, shipped_units_y2024, ...), and a DEFAULT partition catches
+anything else. Queries bounded by shipping_date only read the partitions in
+their range.
+The conversion copies every row in one transaction that holds ACCESS
+EXCLUSIVE locks, so run it in a maintenance window. Run ``flask db-upgrade``
+first: it adds shipped_units.shipping_date, the partition key.
+
+Unique constraints on a partitioned table must include the partition key, so
+the conversion changes some keys:
+- The primary keys become (id, shipping_date) and (unit_id, shipping_date).
+  Ids still come from one sequence per table, so they stay unique.
+- serial_number and original_serial_number stay unique through the registry
+  tables shipped_unit_serials and shipped_unit_original_serials, which a
+  trigger maintains. Their keys keep the constraint names
+  uq_shipped_units_serial_number and uq_shipped_units_original_serial, so
+  duplicates are reported exactly as before.
+- shipment_checklist_responses checks its shipment and cascades deletes
+  with triggers instead of a foreign key.
+
+This needs PostgreSQL 15 or later. Earlier versions run a cross-partition
+UPDATE of shipments.shipping_date as a delete plus an insert, and the delete
+cascades to the shipment's units.
+
+``flask partition-maintain`` creates partitions ahead of time; run it
+yearly. ``flask archive-year YEAR`` archives a closed year. PostgreSQL does
+not compress table data, so archiving packs the year's partitions instead:
+it rewrites them at fillfactor 100, clustered for their read pattern, and
+runs VACUUM FREEZE. It then makes them read-only and, when ARCHIVE_TABLESPACE
+is set, moves them to that tablespace. Put the tablespace on a compressed
+volume (NTFS compression, ZFS or btrfs) to get compressed cold storage.
+"""
+
+import datetime
+import os
+import time
+
+from psycopg import sql
+
+from db import get_db_connection
+
+PARTITIONED_TABLES = ('shipments', 'shipped_units')
+PRIMARY_KEYS = {'shipments': 'id', 'shipped_units': 'unit_id'}
+MIN_SERVER_VERSION = 150000
+YEARS_AHEAD = int(os.getenv('PARTITION_YEARS_AHEAD', '1'))
+ARCHIVE_TABLESPACE = os.getenv('ARCHIVE_TABLESPACE')
+ARCHIVED_TRIGGER = 'trg_archived_read_only'
+# Index each archived partition is clustered on: units are read per shipment,
+# shipments by date.
+ARCHIVE_CLUSTER_INDEXES = {'shipments': 'ix_shipments_shipping_date', 'shipped_units': 'ix_shipped_units_shipment_id'}
+# (registry table, column, constraint name of the old unique constraint)
+SERIAL_REGISTRIES = (
+    ('shipped_unit_serials', 'serial_number', 'uq_shipped_units_serial_number'),
+    ('shipped_unit_original_serials', 'original_serial_number', 'uq_shipped_units_original_serial'),
+)
+
+SUPPORT_SQL = """
+CREATE OR REPLACE FUNCTION maintain_unit_serials() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+            AND NEW.serial_number IS NOT DISTINCT FROM OLD.serial_number
+            AND NEW.original_serial_number IS NOT DISTINCT FROM OLD.original_serial_number THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM shipped_unit_serials WHERE serial_number = OLD.serial_number;
+        DELETE FROM shipped_unit_original_serials WHERE original_serial_number = OLD.original_serial_number;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO shipped_unit_serials (serial_number, unit_id) VALUES (NEW.serial_number, NEW.unit_id);
+        IF NEW.original_serial_number IS NOT NULL THEN
+            INSERT INTO shipped_unit_original_serials (original_serial_number, unit_id)
+            VALUES (NEW.original_serial_number, NEW.unit_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Foreign key replacement: a referenced table must have a unique key on
+-- shipment_id alone, which a partitioned shipments cannot have.
+CREATE OR REPLACE FUNCTION check_checklist_shipment() RETURNS trigger AS $$
+BEGIN
+    PERFORM 1 FROM shipments WHERE id = NEW.shipment_id FOR KEY SHARE;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'shipment % does not exist', NEW.shipment_id
+            USING ERRCODE = 'foreign_key_violation';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- A shipment still present once the statement is done moved partitions.
+CREATE OR REPLACE FUNCTION delete_shipment_checklist() RETURNS trigger AS $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM shipments WHERE id = OLD.id) THEN
+        DELETE FROM shipment_checklist_responses WHERE shipment_id = OLD.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION reject_archived_write() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION '% is archived and read-only', TG_TABLE_NAME
+        USING ERRCODE = 'read_only_sql_transaction';
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+SUPPORT_TRIGGERS_SQL = """
+CREATE OR REPLACE TRIGGER trg_shipped_units_serials
+    AFTER INSERT OR UPDATE OF serial_number, original_serial_number OR DELETE ON shipped_units
+    FOR EACH ROW EXECUTE FUNCTION maintain_unit_serials();
+CREATE OR REPLACE TRIGGER trg_checklist_responses_shipment
+    BEFORE INSERT OR UPDATE OF shipment_id ON shipment_checklist_responses
+    FOR EACH ROW EXECUTE FUNCTION check_checklist_shipment();
+CREATE OR REPLACE TRIGGER trg_shipments_checklist_cascade
+    AFTER DELETE ON shipments
+    FOR EACH ROW EXECUTE FUNCTION delete_shipment_checklist();
+"""
+
+
+def partition_name(table, year):
+    return f"{table}_y{year}"
+
+
+def is_partitioned(cursor, table):
+    cursor.execute("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+    row = cursor.fetchone()
+    return bool(row and row[0])
+
+
+def ensure_partitions(cursor, first_year, last_year):
+    """Create the missing yearly partitions in [first_year, last_year]. Returns their names."""
+    created = []
+    for table in PARTITIONED_TABLES:
+        for year in range(first_year, last_year + 1):
+            name = partition_name(table, year)
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (name,))
+            if cursor.fetchone()[0]:
+                continue
+            # The DEFAULT partition must not already hold rows for the new range.
+            cursor.execute(
+                sql.SQL("SELECT COUNT(*) FROM {} WHERE shipping_date >= %s AND shipping_date < %s").format(
+                    sql.Identifier(f"{table}_default")),
+                (datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1))
+            )
+            stray = cursor.fetchone()[0]
+            if stray:
+                raise RuntimeError(
+                    f"{table}_default holds {stray} row(s) dated {year}; "
+                    f"move them out before creating {name}."
+                )
+            cursor.execute(sql.SQL("CREATE TABLE {} PARTITION OF {} FOR VALUES FROM ({}) TO ({})").format(
+                sql.Identifier(name), sql.Identifier(table),
+                sql.Literal(datetime.date(year, 1, 1)), sql.Literal(datetime.date(year + 1, 1, 1)),
+            ))
+            created.append(name)
+    return created
+
+
+def rebuild_serial_registries(cursor):
+    """Refill the serial registries from shipped_units, e.g. after a load that skipped triggers."""
+    for registry, column, _constraint in SERIAL_REGISTRIES:
+        cursor.execute(sql.SQL("TRUNCATE {}").format(sql.Identifier(registry)))
+        cursor.execute(sql.SQL("INSERT INTO {0} ({1}, unit_id) SELECT {1}, unit_id FROM shipped_units WHERE {1} IS NOT NULL").format(
+            sql.Identifier(registry), sql.Identifier(column)
+        ))
+
+
+def _check_ready(cursor):
+    cursor.execute("SHOW server_version_num")
+    if int(cursor.fetchone()[0]) < MIN_SERVER_VERSION:
+        raise RuntimeError("Partitioning needs PostgreSQL 15 or later.")
+    for table in PARTITIONED_TABLES:
+        if is_partitioned(cursor, table):
+            raise RuntimeError(f"{table} is already partitioned.")
+    cursor.execute(
+        "SELECT 1 FROM pg_attribute WHERE attrelid = 'shipped_units'::regclass AND attname = 'shipping_date' AND NOT attisdropped"
+    )
+    if cursor.fetchone() is None:
+        raise RuntimeError("shipped_units.shipping_date is missing; run flask db-upgrade first.")
+
+
+def _captured_definitions(cursor, table):
+    """
+    CREATE statements for the table's indexes (other than those backing
+    constraints) and user triggers. They are replayed on the partitioned
+    table, so indexes added by migrations survive the conversion.
+    """
+    cursor.execute(
+        """
+        SELECT pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        WHERE i.indrelid = %s::regclass
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c
+              WHERE c.conindid = i.indexrelid AND c.conrelid = i.indrelid AND c.contype IN ('p', 'u', 'x')
+          )
+        ORDER BY i.indexrelid
+        """,
+        (table,)
+    )
+    indexes = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT pg_get_triggerdef(oid) FROM pg_trigger WHERE tgrelid = %s::regclass AND NOT tgisinternal ORDER BY tgname",
+        (table,)
+    )
+    return indexes + [row[0] for row in cursor.fetchall()]
+
+
+def _create_partitioned_copy(cursor, table, first_year, last_year):
+    new_table = f"{table}_partitioned"
+    sequence = f"{new_table}_{PRIMARY_KEYS[table]}_seq"
+    # Identity columns on partitioned tables need PostgreSQL 17, so ids come from a plain sequence.
+    cursor.execute(sql.SQL("CREATE SEQUENCE {} AS integer").format(sql.Identifier(sequence)))
+    cursor.execute(sql.SQL(
+        "CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (shipping_date)"
+    ).format(sql.Identifier(new_table), sql.Identifier(table)))
+    cursor.execute(sql.SQL("ALTER TABLE {} ALTER COLUMN {} SET DEFAULT nextval({})").format(
+        sql.Identifier(new_table), sql.Identifier(PRIMARY_KEYS[table]), sql.Literal(sequence)
+    ))
+    for year in range(first_year, last_year + 1):
+        cursor.execute(sql.SQL("CREATE TABLE {} PARTITION OF {} FOR VALUES FROM ({}) TO ({})").format(
+            sql.Identifier(partition_name(table, year)), sql.Identifier(new_table),
+            sql.Literal(datetime.date(year, 1, 1)), sql.Literal(datetime.date(year + 1, 1, 1)),
+        ))
+    cursor.execute(sql.SQL("CREATE TABLE {} PARTITION OF {} DEFAULT").format(
+        sql.Identifier(f"{table}_default"), sql.Identifier(new_table)
+    ))
+    # LIKE keeps the column order, so rows copy over positionally.
+    cursor.execute(sql.SQL("INSERT INTO {} SELECT * FROM {}").format(sql.Identifier(new_table), sql.Identifier(table)))
+    # Continue from the old identity, not MAX(id), so ids of deleted rows are never reused.
+    cursor.execute(
+        sql.SQL("""
+            SELECT setval({}, GREATEST(
+                (SELECT COALESCE(MAX({}), 1) FROM {}),
+                COALESCE(pg_sequence_last_value(pg_get_serial_sequence(%s, %s)::regclass), 1)
+            ))
+        """).format(sql.Literal(sequence), sql.Identifier(PRIMARY_KEYS[table]), sql.Identifier(table)),
+        (table, PRIMARY_KEYS[table])
+    )
+    return new_table, sequence
+
+
+def convert(log=print):
+    """Convert shipments and shipped_units to yearly partitioned tables, in one transaction."""
+    conn = get_db_connection()
+    if conn is None:
+        raise RuntimeError("Unable to connect to the database.")
+    cursor = conn.cursor()
+    try:
+        _check_ready(cursor)
+        cursor.execute("LOCK TABLE shipments, shipped_units, shipment_checklist_responses IN ACCESS EXCLUSIVE MODE")
+        captured = {table: _captured_definitions(cursor, table) for table in PARTITIONED_TABLES}
+        cursor.execute("SELECT EXTRACT(YEAR FROM MIN(shipping_date))::int, EXTRACT(YEAR FROM MAX(shipping_date))::int FROM shipments")
+        first_year, last_year = cursor.fetchone()
+        this_year = datetime.date.today().year
+        first_year = first_year or this_year
+        last_year = max(last_year or this_year, this_year + YEARS_AHEAD)
+
+        renames = []
+        for table in PARTITIONED_TABLES:
+            started = time.perf_counter()
+            renames.append((table, *_create_partitioned_copy(cursor, table, first_year, last_year)))
+            log(f"  copied {table} into {last_year - first_year + 2} partitions in {time.perf_counter() - started:.1f}s")
+
+        # Drops the old identity sequences and the checklist foreign key with them.
+        cursor.execute("DROP TABLE shipped_units, shipments CASCADE")
+        for table, new_table, sequence in renames:
+            cursor.execute(sql.SQL("ALTER TABLE {} RENAME TO {}").format(sql.Identifier(new_table), sql.Identifier(table)))
+            final_sequence = f"{table}_{PRIMARY_KEYS[table]}_seq"
+            cursor.execute(sql.SQL("ALTER SEQUENCE {} RENAME TO {}").format(sql.Identifier(sequence), sql.Identifier(final_sequence)))
+            cursor.execute(sql.SQL("ALTER SEQUENCE {} OWNED BY {}.{}").format(
+                sql.Identifier(final_sequence), sql.Identifier(table), sql.Identifier(PRIMARY_KEYS[table])
+            ))
+
+        started = time.perf_counter()
+        cursor.execute("""
+            ALTER TABLE shipments ADD CONSTRAINT shipments_pkey PRIMARY KEY (id, shipping_date);
+            ALTER TABLE shipments ADD CONSTRAINT uq_shipments_job_date UNIQUE (job_number, shipping_date);
+            ALTER TABLE shipped_units ADD CONSTRAINT shipped_units_pkey PRIMARY KEY (unit_id, shipping_date);
+            ALTER TABLE shipped_units ADD CONSTRAINT fk_shipped_units_shipment
+                FOREIGN KEY (shipment_id, shipping_date) REFERENCES shipments (id, shipping_date)
+                ON UPDATE CASCADE ON DELETE CASCADE;
+            ALTER TABLE shipped_units ADD CONSTRAINT fk_shipped_units_part_number
+                FOREIGN KEY (part_number) REFERENCES model_numbers (part_number) ON DELETE RESTRICT;
+            CREATE INDEX IF NOT EXISTS ix_shipped_units_serial_number ON shipped_units (serial_number);
+        """)
+        for table in PARTITIONED_TABLES:
+            for statement in captured[table]:
+                cursor.execute(statement)
+        log(f"  rebuilt keys, indexes and triggers in {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        for registry, column, constraint in SERIAL_REGISTRIES:
+            cursor.execute(sql.SQL(
+                "CREATE TABLE {} ({} VARCHAR(128) NOT NULL, unit_id INTEGER NOT NULL, CONSTRAINT {} PRIMARY KEY ({}))"
+            ).format(sql.Identifier(registry), sql.Identifier(column), sql.Identifier(constraint), sql.Identifier(column)))
+        rebuild_serial_registries(cursor)
+        cursor.execute(SUPPORT_SQL)
+        cursor.execute(SUPPORT_TRIGGERS_SQL)
+        log(f"  built serial registries in {time.perf_counter() - started:.1f}s")
+
+        cursor.execute("ANALYZE shipments")
+        cursor.execute("ANALYZE shipped_units")
+        conn.commit()
+        return first_year, last_year
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def maintain(years_ahead=YEARS_AHEAD):
+    """Create partitions through this year + ``years_ahead``. Returns the names created."""
+    conn = get_db_connection()
+    if conn is None:
+        raise RuntimeError("Unable to connect to the database.")
+    cursor = conn.cursor()
+    try:
+        for table in PARTITIONED_TABLES:
+            if not is_partitioned(cursor, table):
+                raise RuntimeError(f"{table} is not partitioned; run flask partition-tables first.")
+        this_year = datetime.date.today().year
+        created = ensure_partitions(cursor, this_year, this_year + years_ahead)
+        conn.commit()
+        return created
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def partition_report():
+    """One row per partition: table, partition, bounds, bytes, tablespace, archived."""
+    conn = get_db_connection()
+    if conn is None:
+        raise RuntimeError("Unable to connect to the database.")
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT parent.relname, child.relname, pg_get_expr(child.relpartbound, child.oid),
+                       pg_total_relation_size(child.oid), COALESCE(ts.spcname, 'default'),
+                       EXISTS (SELECT 1 FROM pg_trigger t WHERE t.tgrelid = child.oid AND t.tgname = %s)
+                FROM pg_inherits i
+                JOIN pg_class parent ON parent.oid = i.inhparent AND parent.relkind = 'p'
+                JOIN pg_class child ON child.oid = i.inhrelid
+                LEFT JOIN pg_tablespace ts ON ts.oid = child.reltablespace
+                WHERE parent.relname = ANY(%s)
+                ORDER BY parent.relname, child.relname
+                """,
+                (ARCHIVED_TRIGGER, list(PARTITIONED_TABLES))
+            )
+            return cursor.fetchall()
+    finally:
+        conn.close()
+
+
+def _partition_indexes(cursor, partition):
+    cursor.execute(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE i.indrelid = to_regclass(%s)",
+        (partition,)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _cluster_index(cursor, table, partition):
+    """The partition's child of ARCHIVE_CLUSTER_INDEXES[table], or None."""
+    cursor.execute(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_index x ON x.indexrelid = c.oid
+        WHERE i.inhparent = to_regclass(%s) AND x.indrelid = to_regclass(%s)
+        """,
+        (ARCHIVE_CLUSTER_INDEXES[table], partition)
+    )
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def archive_year(year, tablespace=ARCHIVE_TABLESPACE, log=print):
+    """
+    Archive a closed year: make its partitions read-only, move them to
+    ``tablespace`` (if given), and rewrite them packed and frozen.
+    Returns {partition: (bytes before, bytes after)}.
+    """
+    if year >= datetime.date.today().year:
+        raise RuntimeError("Only past years can be archived.")
+    partitions = [(table, partition_name(table, year)) for table in PARTITIONED_TABLES]
+    conn = get_db_connection()
+    if conn is None:
+        raise RuntimeError("Unable to connect to the database.")
+    cursor = conn.cursor()
+    try:
+        for table, partition in partitions:
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (partition,))
+            if not cursor.fetchone()[0]:
+                raise RuntimeError(f"Partition {partition} does not exist; run flask partition-tables first.")
+        cursor.execute(sql.SQL("LOCK TABLE {}, {} IN SHARE MODE").format(
+            *(sql.Identifier(partition) for _table, partition in partitions)
+        ))
+        cursor.execute(sql.SQL("SELECT COUNT(*) FROM {} WHERE status <> 'Completed'").format(
+            sql.Identifier(partition_name('shipments', year))
+        ))
+        open_shipments = cursor.fetchone()[0]
+        if open_shipments:
+            raise RuntimeError(f"{year} still has {open_shipments} shipment(s) in progress.")
+
+        sizes = {}
+        for table, partition in partitions:
+            cursor.execute("SELECT pg_total_relation_size(to_regclass(%s))", (partition,))
+            sizes[partition] = [cursor.fetchone()[0], None]
+            cursor.execute(sql.SQL(
+                "CREATE OR REPLACE TRIGGER {} BEFORE INSERT OR UPDATE OR DELETE ON {} "
+                "FOR EACH ROW EXECUTE FUNCTION reject_archived_write()"
+            ).format(sql.Identifier(ARCHIVED_TRIGGER), sql.Identifier(partition)))
+            cursor.execute(sql.SQL("ALTER TABLE {} SET (fillfactor = 100)").format(sql.Identifier(partition)))
+            if tablespace:
+                cursor.execute(sql.SQL("ALTER TABLE {} SET TABLESPACE {}").format(
+                    sql.Identifier(partition), sql.Identifier(tablespace)
+                ))
+                for index in _partition_indexes(cursor, partition):
+                    cursor.execute(sql.SQL("ALTER INDEX {} SET TABLESPACE {}").format(
+                        sql.Identifier(index), sql.Identifier(tablespace)
+                    ))
+        conn.commit()
+        log(f"  {year} is read-only" + (f" and moved to tablespace {tablespace}" if tablespace else ""))
+
+        # CLUSTER and VACUUM cannot run inside a transaction block.
+        conn.autocommit = True
+        for table, partition in partitions:
+            started = time.perf_counter()
+            index = _cluster_index(cursor, table, partition)
+            if index:
+                cursor.execute(sql.SQL("CLUSTER {} USING {}").format(sql.Identifier(partition), sql.Identifier(index)))
+            else:
+                cursor.execute(sql.SQL("VACUUM FULL {}").format(sql.Identifier(partition)))
+            cursor.execute(sql.SQL("VACUUM (FREEZE, ANALYZE) {}").format(sql.Identifier(partition)))
+            cursor.execute("SELECT pg_total_relation_size(to_regclass(%s))", (partition,))
+            sizes[partition][1] = cursor.fetchone()[0]
+            log(f"  packed {partition}: {sizes[partition][0]:,} -> {sizes[partition][1]:,} bytes "
+                f"in {time.perf_counter() - started:.1f}s")
+        return {partition: tuple(size) for partition, size in sizes.items()}
+    except Exception:
+        if not conn.autocommit:
+            conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,85 @@
+"""
+Password hashing with a configurable work factor.
+
+Hashes use werkzeug's PBKDF2 format (pbkdf2:<digest>:<iterations>$salt$hash).
+The digest and iteration count come from PASSWORD_HASH_DIGEST (default
+sha256) and PASSWORD_HASH_ITERATIONS (default: werkzeug's 260000). A stored
+hash made with other parameters still verifies, and a successful login
+replaces it with a current one (see ``needs_rehash``).
+
+Hashing is deliberately slow CPU work. hashlib releases the GIL while it
+runs, so it goes to a dedicated pool of PASSWORD_HASH_WORKERS threads. At most
+PASSWORD_HASH_MAX_PENDING hashes (default: two per worker) may be queued or
+running. Past that, callers wait up to QUEUE_TIMEOUT_SECONDS and then get
+HashingBusy, so a burst of logins at shift change cannot occupy every core.
+Logins also have their own admission class, no wider than the worker pool
+(see admission.py), so they cannot take the request threads writes need.
+
+The settings are read at import time, so .env is loaded here as in db.py;
+``waitress-serve app:app`` may import this module before db.
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+from flask import jsonify
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+load_dotenv()
+
+DIGEST = os.getenv('PASSWORD_HASH_DIGEST', 'sha256')
+ITERATIONS = int(os.getenv('PASSWORD_HASH_ITERATIONS', str(DEFAULT_PBKDF2_ITERATIONS)))
+METHOD = f"pbkdf2:{DIGEST}:{ITERATIONS}"
+SALT_LENGTH = 16
+WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(max(1, (os.cpu_count() or 2) // 2))))
+MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', str(WORKERS * 2)))
+QUEUE_TIMEOUT_SECONDS = 5.0
+
+if DIGEST not in hashlib.algorithms_available:
+    raise ValueError(f"PASSWORD_HASH_DIGEST '{DIGEST}' is not a hashlib algorithm")
+
+
+class HashingBusy(Exception):
+    """Too many password hashes are queued; the caller should answer ``busy_response()``."""
+
+
+def busy_response():
+    """503 with Retry-After for a request refused with HashingBusy."""
+    response = jsonify({"msg": "Too many logins in progress, try again shortly"})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(max(1, int(QUEUE_TIMEOUT_SECONDS)))
+    return response
+
+
+_slots = threading.BoundedSemaphore(MAX_PENDING)
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _run(fn, *args):
+    global _executor
+    if not _slots.acquire(timeout=QUEUE_TIMEOUT_SECONDS):
+        raise HashingBusy()
+    try:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix='password-hash')
+        return _executor.submit(fn, *args).result()
+    finally:
+        _slots.release()
+
+
+def hash_password(password):
+    return _run(generate_password_hash, password, METHOD, SALT_LENGTH)
+
+
+def verify(stored_hash, password):
+    return _run(check_password_hash, stored_hash, password)
+
+
+def needs_rehash(stored_hash):
+    """True when ``stored_hash`` was made with other parameters than the configured ones."""
+    return stored_hash.split('$', 1)[0] != METHOD
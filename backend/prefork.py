@@ -0,0 +1,418 @@
+"""
+Pre-fork multi-process server for Linux (``flask serve``).
+
+A single waitress process runs every request under one GIL, so CPU-bound
+work (JSON encoding, the FPY aggregation loops, password hashing) is
+serialised across its threads. Here the master imports the app once, binds
+the listening socket and forks SERVE_WORKERS processes. Each one runs waitress
+with SERVE_THREADS threads on the shared socket, and the kernel hands every
+new connection to one of them.
+
+Workers are forked before any database connection, NOTIFY listener or
+executor exists, so each process opens its own connections and keeps its own
+caches, metrics and admission limits. Workers publish their metrics with
+every heartbeat, so /api/metrics reports all of them (see metrics.py).
+Before it takes traffic, a worker checks the database and fills the response
+cache for SERVE_WARM_PATHS.
+
+Signals to the master:
+    HUP       graceful reload. The master checks that the app still imports,
+              re-executes itself (new code and .env) on the same socket and
+              pid, starts fresh workers and stops the old ones once the new
+              ones are ready.
+    TERM/INT  graceful stop. Workers stop accepting, finish in-flight
+              requests (up to SERVE_GRACEFUL_TIMEOUT seconds) and exit.
+
+Every worker reports its health over a pipe every few seconds. The master
+restarts workers that exit or stop reporting for SERVE_WORKER_TIMEOUT seconds,
+and writes the per-worker health to SERVE_STATUS_FILE (``flask serve --status``,
+GET /api/admin/workers).
+"""
+
+import json
+import logging
+import os
+import selectors
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from waitress.server import create_server
+
+import admission
+import app_logging
+import metrics
+import response_cache
+from db import get_db_connection
+from metrics import registry
+
+logger = logging.getLogger('quality.serve')
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKERS = int(os.getenv('SERVE_WORKERS', str(min(4, os.cpu_count() or 1))))
+THREADS = int(os.getenv('SERVE_THREADS', '8'))
+WORKER_TIMEOUT = float(os.getenv('SERVE_WORKER_TIMEOUT', '60'))
+GRACEFUL_TIMEOUT = float(os.getenv('SERVE_GRACEFUL_TIMEOUT', '30'))
+STATUS_FILE = os.getenv('SERVE_STATUS_FILE', os.path.join(app_logging.LOG_DIR, 'serve-status.json'))
+WARM_PATHS = [path.strip() for path in os.getenv(
+    'SERVE_WARM_PATHS', '/api/dashboard,/api/shipments/stats,/api/shipments/fpy/overall'
+).split(',') if path.strip()]
+HEARTBEAT_SECONDS = 5
+# A worker that exits sooner than this after starting is respawned after a pause.
+MIN_WORKER_LIFETIME_SECONDS = 5
+# Set across a reload re-exec: the inherited listening socket and the workers to retire.
+FD_ENV = 'QUALITY_SERVE_FD'
+OLD_WORKERS_ENV = 'QUALITY_SERVE_OLD_WORKERS'
+
+
+# --- worker process ---
+
+def warm(app):
+    """Open a first database connection and fill the response cache for WARM_PATHS."""
+    started = time.perf_counter()
+    conn = get_db_connection()
+    if conn is None:
+        return {'database': 'unavailable'}
+    conn.close()
+    results = {'database': {'ms': round((time.perf_counter() - started) * 1000, 1)}}
+    response_cache.cache.ensure_listening()
+    client = app.test_client()
+    for path in WARM_PATHS:
+        started = time.perf_counter()
+        try:
+            status = client.get(path).status_code
+        except Exception as err:
+            logger.warning("warming %s failed: %s", path, err)
+            status = 'error'
+        results[path] = {'status': status, 'ms': round((time.perf_counter() - started) * 1000, 1)}
+    return results
+
+
+def _health(state):
+    import resource
+    return dict(
+        state,
+        requests=registry.total_requests(),
+        active=sum(endpoint_class.stats()['active'] for endpoint_class in admission.endpoint_classes.values()),
+        threads=threading.active_count(),
+        max_rss_kb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    )
+
+
+def _report(pipe, state, wake, stopping, master_pid):
+    while True:
+        if os.getppid() != master_pid:
+            # The master died without stopping us; nobody would restart or retire this worker.
+            stopping.set()
+        try:
+            os.write(pipe, json.dumps(_health(state)).encode() + b'\n')
+        except OSError:
+            # The master re-executed or exited; the new master retires this process.
+            return
+        try:
+            metrics.write_snapshot()
+        except OSError as err:
+            logger.warning("could not write the metrics snapshot: %s", err)
+        wake.wait(HEARTBEAT_SECONDS)
+        wake.clear()
+
+
+def _idle(server):
+    return not server.task_dispatcher.queue and not any(
+        channel.requests or channel.total_outbufs_len for channel in list(server.active_channels.values())
+    )
+
+
+def run_worker(app, sock, slot, pipe, threads):
+    """Serve ``app`` on the inherited ``sock`` until SIGTERM, reporting health on ``pipe``."""
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    # Ctrl+C reaches the whole process group; the master turns it into SIGTERM.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    app_logging.after_fork(f"w{slot}")
+    admission.configure(threads)
+    metrics.enable_worker_snapshots(slot)
+
+    state = {'slot': slot, 'pid': os.getpid(), 'state': 'warming', 'started': time.time()}
+    wake = threading.Event()
+    threading.Thread(target=_report, args=(pipe, state, wake, stopping, os.getppid()),
+                     name='serve-heartbeat', daemon=True).start()
+
+    state['warm'] = warm(app)
+    server = create_server(app, sockets=[sock], threads=threads, ident='quality')
+    state['state'] = 'ready'
+    wake.set()
+    logger.info("worker ready", extra={'fields': {'slot': slot, 'warm': state['warm']}})
+
+    deadline = None
+    while True:
+        server.asyncore.loop(timeout=1.0, map=server._map, use_poll=True, count=1)
+        if not stopping.is_set():
+            continue
+        if deadline is None:
+            server.accepting = False
+            deadline = time.monotonic() + GRACEFUL_TIMEOUT
+            state['state'] = 'stopping'
+            wake.set()
+        if _idle(server) or time.monotonic() >= deadline:
+            break
+    server.task_dispatcher.shutdown(timeout=5)
+    metrics.remove_snapshot()
+    logger.info("worker stopped", extra={'fields': {'slot': slot, 'requests': registry.total_requests()}})
+
+
+# --- master process ---
+
+class _Worker:
+    """The master's view of one worker process."""
+
+    def __init__(self, slot, pid, pipe):
+        self.slot = slot
+        self.pid = pid
+        self.pipe = pipe
+        self.buffer = b''
+        self.started = time.monotonic()
+        self.last_seen = time.monotonic()
+        self.health = {'state': 'starting'}
+
+
+class Master:
+    def __init__(self, app, host, port, workers=WORKERS, threads=THREADS):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.count = workers
+        self.threads = threads
+        self.workers = {}
+        self.restarts = [0] * workers
+        self.pending = []
+        self.awaiting_ready = []
+        self.retiring = {}
+        self.selector = selectors.DefaultSelector()
+        self.stop_requested = False
+        self.reload_requested = False
+        self.stop_deadline = None
+        self.started = time.time()
+
+    def _listen_socket(self):
+        inherited = os.environ.pop(FD_ENV, None)
+        if inherited:
+            return socket.socket(fileno=int(inherited))
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(1024)
+        return sock
+
+    def _spawn(self, slot):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            self.selector.close()
+            for worker in self.workers.values():
+                os.close(worker.pipe)
+            code = 0
+            try:
+                run_worker(self.app, self.sock, slot, write_fd, self.threads)
+            except BaseException as err:
+                logger.exception("worker %s failed: %s", slot, err)
+                code = 1
+            finally:
+                app_logging.stop_listeners()
+                os._exit(code)
+        os.close(write_fd)
+        os.set_blocking(read_fd, False)
+        worker = _Worker(slot, pid, read_fd)
+        self.workers[pid] = worker
+        self.selector.register(read_fd, selectors.EVENT_READ, worker)
+        logger.info("worker started", extra={'fields': {'slot': slot, 'pid': pid}})
+
+    def _close_pipe(self, worker):
+        if worker.pipe is not None:
+            self.selector.unregister(worker.pipe)
+            os.close(worker.pipe)
+            worker.pipe = None
+
+    def _read(self, worker):
+        try:
+            data = os.read(worker.pipe, 65536)
+        except BlockingIOError:
+            return
+        if not data:
+            self._close_pipe(worker)
+            return
+        *lines, worker.buffer = (worker.buffer + data).split(b'\n')
+        for line in lines:
+            try:
+                worker.health = json.loads(line)
+            except ValueError:
+                continue
+            worker.last_seen = time.monotonic()
+
+    def _reap(self):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            self.retiring.pop(pid, None)
+            if pid in self.awaiting_ready:
+                self.awaiting_ready.remove(pid)
+            worker = self.workers.pop(pid, None)
+            if worker is None:
+                continue
+            self._close_pipe(worker)
+            if self.stop_requested:
+                continue
+            logger.warning("worker exited", extra={'fields': {
+                'slot': worker.slot, 'pid': pid, 'exit_status': os.waitstatus_to_exitcode(status)}})
+            self.restarts[worker.slot] += 1
+            delay = 1 if time.monotonic() - worker.started < MIN_WORKER_LIFETIME_SECONDS else 0
+            self.pending.append((worker.slot, time.monotonic() + delay))
+
+    def _check_workers(self):
+        now = time.monotonic()
+        for slot, due in list(self.pending):
+            if due <= now:
+                self.pending.remove((slot, due))
+                self._spawn(slot)
+        for worker in list(self.workers.values()):
+            if now - worker.last_seen > WORKER_TIMEOUT:
+                logger.error("worker stopped reporting, killing it", extra={'fields': {
+                    'slot': worker.slot, 'pid': worker.pid, 'silent_seconds': round(now - worker.last_seen)}})
+                self._kill(worker.pid, signal.SIGKILL)
+                worker.last_seen = now
+        if self.awaiting_ready:
+            ready = all(worker.health.get('state') == 'ready' for worker in self.workers.values())
+            if ready or now - self.started_generation > WORKER_TIMEOUT:
+                self._retire(self.awaiting_ready)
+                self.awaiting_ready = []
+        for pid, deadline in list(self.retiring.items()):
+            if now >= deadline:
+                self._kill(pid, signal.SIGKILL)
+                self.retiring.pop(pid)
+
+    def _kill(self, pid, sig):
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def _retire(self, pids):
+        for pid in pids:
+            self._kill(pid, signal.SIGTERM)
+            self.retiring[pid] = time.monotonic() + GRACEFUL_TIMEOUT + 5
+        logger.info("retiring previous workers", extra={'fields': {'pids': list(pids)}})
+
+    def _reload(self):
+        check = subprocess.run([sys.executable, '-c', 'import app'], cwd=BACKEND_DIR,
+                               capture_output=True, text=True, timeout=120)
+        if check.returncode != 0:
+            logger.error("reload aborted: the app does not import", extra={'fields': {'stderr': check.stderr[-2000:]}})
+            return
+        logger.info("reloading", extra={'fields': {'workers': list(self.workers)}})
+        self.sock.set_inheritable(True)
+        os.environ[FD_ENV] = str(self.sock.fileno())
+        os.environ[OLD_WORKERS_ENV] = ','.join(str(pid) for pid in [*self.workers, *self.retiring, *self.awaiting_ready])
+        argv = getattr(sys, 'orig_argv', None) or [sys.executable, *sys.argv]
+        app_logging.stop_listeners()
+        os.execv(sys.executable, argv)
+
+    def _write_status(self):
+        now = time.monotonic()
+        workers = []
+        for worker in sorted(self.workers.values(), key=lambda worker: worker.slot):
+            health = dict(worker.health)
+            health.update(
+                slot=worker.slot,
+                pid=worker.pid,
+                restarts=self.restarts[worker.slot],
+                uptime_seconds=round(now - worker.started),
+                heartbeat_age_seconds=round(now - worker.last_seen, 1),
+            )
+            workers.append(health)
+        status = {
+            'master_pid': os.getpid(),
+            'listen': f"{self.host}:{self.port}",
+            'threads_per_worker': self.threads,
+            'started': self.started,
+            'updated': time.time(),
+            'retiring': list(self.retiring),
+            'workers': workers,
+        }
+        os.makedirs(os.path.dirname(STATUS_FILE), exist_ok=True)
+        temporary = STATUS_FILE + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(status, f, indent=2)
+        os.replace(temporary, STATUS_FILE)
+
+    def _on_stop(self, *_):
+        self.stop_requested = True
+
+    def _on_reload(self, *_):
+        self.reload_requested = True
+
+    def run(self):
+        self.sock = self._listen_socket()
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+        self.awaiting_ready = [int(pid) for pid in os.environ.pop(OLD_WORKERS_ENV, '').split(',') if pid]
+        self.started_generation = time.monotonic()
+        for slot in range(self.count):
+            self._spawn(slot)
+        logger.info("serving", extra={'fields': {
+            'listen': f"{self.host}:{self.port}", 'workers': self.count, 'threads': self.threads}})
+
+        next_status = 0
+        while True:
+            for key, _events in self.selector.select(timeout=1.0):
+                self._read(key.data)
+            self._reap()
+            if self.stop_requested:
+                if self.stop_deadline is None:
+                    logger.info("stopping")
+                    self.stop_deadline = time.monotonic() + GRACEFUL_TIMEOUT + 5
+                    self.pending = []
+                    for pid in [*self.workers, *self.retiring, *self.awaiting_ready]:
+                        self._kill(pid, signal.SIGTERM)
+                if not self.workers and not self.retiring and not self.awaiting_ready:
+                    break
+                if time.monotonic() >= self.stop_deadline:
+                    for pid in [*self.workers, *self.retiring, *self.awaiting_ready]:
+                        self._kill(pid, signal.SIGKILL)
+            else:
+                if self.reload_requested:
+                    self.reload_requested = False
+                    self._reload()
+                self._check_workers()
+            if time.monotonic() >= next_status:
+                self._write_status()
+                next_status = time.monotonic() + HEARTBEAT_SECONDS
+        self.sock.close()
+        try:
+            os.remove(STATUS_FILE)
+        except OSError:
+            pass
+        logger.info("stopped")
+
+
+def serve(app, host, port, workers=WORKERS, threads=THREADS):
+    Master(app, host, port, workers, threads).run()
+
+
+def read_status():
+    """The running server's last status report, or None when ``flask serve`` is not running."""
+    try:
+        with open(STATUS_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
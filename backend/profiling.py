@@ -0,0 +1,135 @@
+"""
+On-demand per-request profiling for admins.
+
+An admin can send ``X-Profile: 1`` or add ``?__profile=1`` to run that one
+request under cProfile. The profile is saved to PROFILE_DIR (default
+logs/profiles) as a .prof file, with a JSON sidecar holding the route,
+parameters, status and timing. Admin endpoints list and download the
+profiles. Normal requests pay only the header and query-string lookup.
+A profiled request bypasses the response cache and single-flight, so it
+always runs (and profiles) the view, and its response is never cached.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import uuid
+
+from flask import g, request
+from flask_jwt_extended import verify_jwt_in_request
+
+import user_status
+
+PROFILE_DIR = os.getenv(
+    'PROFILE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'profiles')
+)
+MAX_PROFILES = int(os.getenv('PROFILE_KEEP', '50'))
+PROFILE_ID_LENGTH = 12
+
+
+def _requested():
+    return request.headers.get('X-Profile') == '1' or request.args.get('__profile') == '1'
+
+
+def _is_admin():
+    try:
+        verify_jwt_in_request(optional=True)
+    except Exception:
+        return False
+    # The current role, not the token's: a demoted admin cannot keep profiling.
+    return user_status.current_role() == 'admin'
+
+
+def _save(profiler, status):
+    duration = time.perf_counter() - g.profile_started
+    profile_id = uuid.uuid4().hex[:PROFILE_ID_LENGTH]
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    profiler.dump_stats(os.path.join(PROFILE_DIR, f"{profile_id}.prof"))
+    meta = {
+        'id': profile_id,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'route': request.endpoint,
+        'method': request.method,
+        'path': request.path,
+        'params': {key: value for key, value in request.args.items() if key != '__profile'},
+        'status': status,
+        'duration_ms': round(duration * 1000, 1),
+    }
+    with open(os.path.join(PROFILE_DIR, f"{profile_id}.json"), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    _prune()
+    return profile_id
+
+
+def _prune():
+    profiles = list_profiles()
+    for meta in profiles[MAX_PROFILES:]:
+        for ext in ('.prof', '.json'):
+            try:
+                os.remove(os.path.join(PROFILE_DIR, meta['id'] + ext))
+            except OSError:
+                pass
+
+
+def list_profiles():
+    """Recent profiles, newest first."""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    profiles = []
+    for name in os.listdir(PROFILE_DIR):
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(PROFILE_DIR, name), encoding='utf-8') as f:
+                profiles.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    profiles.sort(key=lambda meta: meta.get('created_at', ''), reverse=True)
+    return profiles
+
+
+def profile_path(profile_id):
+    """Path of a stored .prof file, or None. Rejects anything that is not a profile id."""
+    if len(profile_id) != PROFILE_ID_LENGTH or not all(c in '0123456789abcdef' for c in profile_id):
+        return None
+    path = os.path.join(PROFILE_DIR, f"{profile_id}.prof")
+    return path if os.path.exists(path) else None
+
+
+def profile_text(path, limit=60):
+    out = io.StringIO()
+    stats = pstats.Stats(path, stream=out)
+    stats.sort_stats('cumulative').print_stats(limit)
+    return out.getvalue()
+
+
+def init_app(app):
+    @app.before_request
+    def start_profiler():
+        if not _requested() or not _is_admin():
+            return None
+        profiler = cProfile.Profile()
+        g.profiler = profiler
+        g.profile_started = time.perf_counter()
+        profiler.enable()
+        return None
+
+    @app.after_request
+    def stop_profiler(response):
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            response.headers['X-Profile-Id'] = _save(profiler, response.status_code)
+        return response
+
+    @app.teardown_request
+    def discard_profiler(_exc):
+        # Only reached with a live profiler when the view raised.
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            _save(profiler, 500)
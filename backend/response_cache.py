@@ -0,0 +1,173 @@
+"""
+Stale-while-revalidate response cache for heavy aggregate endpoints.
+
+Within ``soft_ttl`` a cached response is served as-is. Between ``soft_ttl``
+and ``hard_ttl`` it is still served immediately, and a background worker
+recomputes it. Past ``hard_ttl``, or after a write invalidates the cache,
+the next request recomputes synchronously. Writes are picked up through the
+quality_events NOTIFY channel, so every process drops its entries. Writers
+in this process also call ``invalidate()`` directly, so they see their own
+changes right away.
+
+Background recomputes are admitted like requests: they take a slot of the
+endpoint's class and run under its statement_timeout, and are skipped when
+the class is full.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import wraps
+
+from flask import Response, current_app, make_response, request
+
+import admission
+from notifications import listener, QUALITY_EVENTS_CHANNEL
+from singleflight import bypasses_sharing, normalized_query_key
+
+logger = logging.getLogger('quality.response_cache')
+
+MAX_ENTRIES = 256
+REFRESH_WORKERS = 2
+# Checklist responses do not feed any cached aggregate.
+INVALIDATING_TABLES = {'shipments', 'shipped_units'}
+
+
+class ResponseCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._generation = 0
+        self._executor = None
+        self._listening = False
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def generation(self):
+        with self._lock:
+            return self._generation
+
+    def store(self, key, entry, generation):
+        """Keep ``entry`` unless the cache was invalidated after it started computing."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def schedule_refresh(self, key, fn):
+        """Run ``fn`` on the refresh pool unless a refresh of ``key`` is already queued."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix='cache-refresh')
+            executor = self._executor
+
+        def run():
+            try:
+                fn()
+            except Exception as err:
+                logger.exception("background cache refresh failed for %s: %s", key[0], err)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(run)
+
+    def ensure_listening(self):
+        with self._lock:
+            if self._listening:
+                return
+            self._listening = True
+        listener.add_handler(QUALITY_EVENTS_CHANNEL, self._on_event)
+
+    def _on_event(self, payload):
+        if payload.get('op') == 'RESYNC' or payload.get('table') in INVALIDATING_TABLES:
+            self.invalidate()
+
+
+cache = ResponseCache()
+
+
+def invalidate():
+    cache.invalidate()
+
+
+def cached_response(soft_ttl=30, hard_ttl=600):
+    """
+    Cache a view's successful responses per endpoint and normalized query.
+    Adds X-Cache (HIT, STALE or MISS), Age and X-Cache-Soft-TTL headers.
+    Only use on views whose response does not depend on who is asking.
+    Only a miss takes an admission slot (a coalesced view takes it in its leader).
+    Requests that bypass sharing (profiled ones) skip the cache entirely.
+    """
+    def decorator(view):
+        takes_slot = not getattr(view, 'defers_admission', False)
+
+        def compute(args, kwargs):
+            generation = cache.generation()
+            with admission.slot() if takes_slot else nullcontext():
+                response = make_response(view(*args, **kwargs))
+            entry = (response.get_data(), response.status_code, list(response.headers.items()), time.monotonic())
+            if response.status_code == 200:
+                cache.store(normalized_query_key(), entry, generation)
+            return entry
+
+        def respond(entry, status_label):
+            body, status, headers, created = entry
+            response = Response(body, status=status, headers=headers)
+            response.headers['X-Cache'] = status_label
+            response.headers['Age'] = str(int(time.monotonic() - created))
+            response.headers['X-Cache-Soft-TTL'] = str(soft_ttl)
+            return response
+
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if bypasses_sharing():
+                with admission.slot() if takes_slot else nullcontext():
+                    return view(*args, **kwargs)
+            cache.ensure_listening()
+            key = normalized_query_key()
+            entry = cache.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry[3]
+                if age < soft_ttl:
+                    return respond(entry, 'HIT')
+                if age < hard_ttl:
+                    app = current_app._get_current_object()
+                    path, query_string = request.path, request.query_string
+
+                    def refresh():
+                        # A test request context skips before_request, so admit it here.
+                        with app.test_request_context(path, query_string=query_string):
+                            admission.defer_current_request()
+                            try:
+                                compute(args, kwargs)
+                            except admission.Busy as err:
+                                logger.info("background refresh of %s skipped: the %s class is full",
+                                            key[0], err.endpoint_class.name)
+
+                    cache.schedule_refresh(key, refresh)
+                    return respond(entry, 'STALE')
+            return respond(compute(args, kwargs), 'MISS')
+        wrapper.defers_admission = True
+        return wrapper
+    return decorator
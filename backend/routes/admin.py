@@ -0,0 +1,104 @@
+from flask import Blueprint, jsonify, request, send_file, Response
+from routes.auth_decorators import admin_required
+from singleflight import flights
+from admission import endpoint_classes
+import slow_queries
+import profiling
+import db_health
+import prefork
+
+admin_bp = Blueprint('admin', __name__)
+
+
+@admin_bp.route('/singleflight', methods=['GET'])
+@admin_required
+def get_singleflight_stats():
+    """
+    Per-endpoint request coalescing counters: 'executions' actually ran the
+    query, 'coalesced' reused a concurrent execution's response.
+    """
+    stats = flights.stats()
+    return jsonify({
+        'endpoints': stats,
+        'executions_saved': sum(values['coalesced'] for values in stats.values())
+    })
+
+
+@admin_bp.route('/admission', methods=['GET'])
+@admin_required
+def get_admission_stats():
+    """Concurrency limits, current load and rejections per endpoint class."""
+    return jsonify({name: endpoint_class.stats() for name, endpoint_class in endpoint_classes.items()})
+
+
+@admin_bp.route('/slow-queries', methods=['GET'])
+@admin_required
+def get_slow_queries():
+    """
+    Top slow statements by normalized SQL.
+    Query params: limit (default 20), order_by (total_ms | max_ms | count).
+    """
+    order_by = request.args.get('order_by', 'total_ms')
+    if order_by not in ('total_ms', 'max_ms', 'count'):
+        return jsonify({'error': "order_by must be 'total_ms', 'max_ms' or 'count'"}), 400
+    try:
+        limit = max(1, min(int(request.args.get('limit', 20)), 200))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    return jsonify({
+        'threshold_ms': slow_queries.THRESHOLD_SECONDS * 1000,
+        'queries': slow_queries.top_offenders(limit, order_by)
+    })
+
+
+@admin_bp.route('/slow-queries', methods=['DELETE'])
+@admin_required
+def reset_slow_queries():
+    slow_queries.reset()
+    return jsonify({'message': 'Slow query statistics cleared.'})
+
+
+@admin_bp.route('/db-health', methods=['GET'])
+@admin_required
+def get_db_health():
+    """
+    Table scan and vacuum statistics, buffer cache hit ratio, connection
+    counts and top pg_stat_statements entries. Cached briefly; pass
+    ?refresh=1 to force a new snapshot.
+    """
+    health = db_health.snapshot(force=request.args.get('refresh') == '1')
+    if health is None:
+        return jsonify({'error': 'Database connection failed'}), 500
+    return jsonify(health)
+
+
+@admin_bp.route('/workers', methods=['GET'])
+@admin_required
+def get_workers():
+    """Per-worker health of the pre-forked server (flask serve), as last reported to its master."""
+    status = prefork.read_status()
+    if status is None:
+        return jsonify({'error': 'Not running under flask serve'}), 404
+    return jsonify(status)
+
+
+@admin_bp.route('/profiles', methods=['GET'])
+@admin_required
+def get_profiles():
+    """Recently captured request profiles (newest first)."""
+    return jsonify(profiling.list_profiles())
+
+
+@admin_bp.route('/profiles/<profile_id>', methods=['GET'])
+@admin_required
+def download_profile(profile_id):
+    """
+    Download a captured profile as a cProfile .prof file, or pass
+    ?format=text for the top functions by cumulative time.
+    """
+    path = profiling.profile_path(profile_id)
+    if path is None:
+        return jsonify({'error': 'Profile not found'}), 404
+    if request.args.get('format') == 'text':
+        return Response(profiling.profile_text(path), mimetype='text/plain')
+    return send_file(path, mimetype='application/octet-stream', as_attachment=True, download_name=f"{profile_id}.prof")
@@ -1,14 +1,41 @@
+import logging
 from flask import Blueprint, request, jsonify
-from werkzeug.security import check_password_hash
 from flask_jwt_extended import create_access_token
 from datetime import timedelta
 from db import get_db_connection, get_dict_cursor
+import passwords
 
 auth_bp = Blueprint('auth', __name__)
+logger = logging.getLogger('quality.auth')
+
+
+def _rehash(user, password):
+    """Replace a hash made with outdated parameters; the login succeeds either way."""
+    try:
+        new_hash = passwords.hash_password(password)
+    except passwords.HashingBusy:
+        return
+    conn = get_db_connection()
+    if conn is None:
+        return
+    try:
+        with conn.cursor() as cursor:
+            # Only if the password was not changed in the meantime.
+            cursor.execute(
+                "UPDATE users SET password_hash = %s WHERE id = %s AND password_hash = %s",
+                (new_hash, user['id'], user['password_hash'])
+            )
+        conn.commit()
+        logger.info("password rehashed", extra={'fields': {'username': user['username'], 'method': passwords.METHOD}})
+    except Exception as err:
+        conn.rollback()
+        logger.warning("could not rehash password for %s: %s", user['username'], err)
+    finally:
+        conn.close()
+
 
 @auth_bp.route('/login', methods=['POST'])
 def login():
-    print("--- LOGIN ROUTE HIT ---")
     data = request.get_json()
     username = data.get('username')
     password = data.get('password')
@@ -20,7 +47,7 @@ def login():
 
     # If connection fails, conn will be None
     if conn is None:
-        print("ERROR: Login failed because database connection is None.")
+        logger.error("login failed: no database connection")
         return jsonify({"msg": "Internal server error: Cannot connect to database"}), 500
 
     cursor = get_dict_cursor(conn)
@@ -29,11 +56,19 @@ def login():
     cursor.close()
     conn.close()
 
-    if user and check_password_hash(user['password_hash'], password):
-        print(f"SUCCESS: User '{username}' authenticated successfully.")
+    try:
+        valid = user is not None and passwords.verify(user['password_hash'], password)
+    except passwords.HashingBusy:
+        logger.warning("login rejected: password hashing queue is full", extra={'fields': {'username': username}})
+        return passwords.busy_response()
+
+    if valid:
+        if passwords.needs_rehash(user['password_hash']):
+            _rehash(user, password)
+        logger.debug("login succeeded", extra={'fields': {'username': username}})
         identity = {"id": user['id'], "username": user['username'], "role": user['role']}
         access_token = create_access_token(identity=identity, expires_delta=timedelta(hours=8))
         return jsonify(access_token=access_token)
 
-    print(f"ERROR: Authentication failed for user '{username}'.")
+    logger.info("login failed", extra={'fields': {'username': username}})
     return jsonify({"msg": "Bad username or password"}), 401
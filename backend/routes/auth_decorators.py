@@ -1,6 +1,11 @@
 from functools import wraps
 from flask import jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+import user_status
+
+# Tokens of deactivated or deleted users are rejected by jwt_required itself
+# (user_status registers the JWT blocklist check). The role comes from the
+# user status cache, so a role change applies without logging in again.
 
 def editor_access_required(fn):
     """
@@ -10,8 +15,7 @@ def editor_access_required(fn):
     @wraps(fn)
     @jwt_required() # Ensures a valid token is present first
     def wrapper(*args, **kwargs):
-        current_user = get_jwt_identity()
-        if current_user and current_user.get('role') in ['admin', 'user']:
+        if user_status.current_role() in ['admin', 'user']:
             return fn(*args, **kwargs)
         else:
             return jsonify(msg="Editor or administrator rights required to perform this action."), 403
@@ -24,9 +28,8 @@ def admin_required(fn):
     @wraps(fn)
     @jwt_required()
     def wrapper(*args, **kwargs):
-        current_user = get_jwt_identity()
-        if current_user and current_user.get('role') == 'admin':
+        if user_status.current_role() == 'admin':
             return fn(*args, **kwargs)
         else:
             return jsonify(msg="Administrator rights required."), 403
-    return wrapper
\ No newline at end of file
+    return wrapper
@@ -0,0 +1,250 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg
+from psycopg import sql
+from flask import Blueprint, current_app, g, has_request_context, jsonify, request
+from flask_jwt_extended import JWTManager, get_jwt
+from werkzeug.exceptions import HTTPException
+from werkzeug.test import EnvironBuilder
+from db import open_connection
+from routes.auth_decorators import jwt_required
+
+batch_bp = Blueprint('batch', __name__)
+logger = logging.getLogger('quality.batch')
+
+MAX_REQUESTS = 20
+READ_WORKERS = 4
+METHODS = {'GET', 'POST', 'PUT', 'DELETE'}
+# Streams and nested batches cannot be answered inside a batch.
+UNBATCHABLE_ENDPOINTS = {'batch.run_batch', 'events.stream_events'}
+# GETs that write cannot run on the read-only snapshot: a dashboard search builds a temp table.
+WRITING_READ_ENDPOINTS = {'dashboard.get_dashboard'}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _read_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=READ_WORKERS, thread_name_prefix='batch-read')
+        return _executor
+
+
+class SharedTokenJWTManager(JWTManager):
+    """
+    JWTManager that verifies a batch's token once. Sub-requests carry the
+    caller's token; when it is the one the batch already verified, its claims
+    are reused instead of decoding it again (user_status also skips the
+    revocation check for it).
+    """
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        verified = g.get('verified_token') if has_request_context() else None
+        if verified is not None and verified[0] == encoded_token:
+            return dict(verified[1])
+        return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+
+class _BorrowedConnection:
+    """
+    The connection a view gets from get_db_connection() during a batched read.
+    It stays in the batch's snapshot transaction: commit() and close() keep the
+    transaction open for the next sub-request on this thread, and rollback()
+    starts a new transaction on the same snapshot. The isolation level is fixed.
+    """
+
+    def __init__(self, lender, conn):
+        object.__setattr__(self, '_lender', lender)
+        object.__setattr__(self, '_conn', conn)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        if name in ('isolation_level', 'read_only', 'autocommit', 'deferrable'):
+            return
+        setattr(self._conn, name, value)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        self._lender.begin(self._conn)
+
+    def close(self):
+        if self._conn.info.transaction_status == psycopg.pq.TransactionStatus.INERROR:
+            self.rollback()
+
+
+class SnapshotLender:
+    """
+    Exports one REPEATABLE READ snapshot and lends each thread a connection
+    that has imported it, so every read in a group sees the same data.
+    """
+
+    def __init__(self):
+        self._leader = open_connection()
+        if self._leader is None:
+            raise psycopg.OperationalError("Database connection failed")
+        self._leader.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+        self._leader.read_only = True
+        self.snapshot = self._leader.execute("SELECT pg_export_snapshot()").fetchone()[0]
+        self._lock = threading.Lock()
+        self._connections = {}
+
+    def begin(self, conn):
+        conn.rollback()
+        conn.execute(sql.SQL("SET TRANSACTION SNAPSHOT {}").format(sql.Literal(self.snapshot)))
+
+    def borrow(self):
+        thread = threading.get_ident()
+        with self._lock:
+            entry = self._connections.get(thread)
+        if entry is None:
+            conn = open_connection()
+            if conn is None:
+                return None
+            conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+            conn.read_only = True
+            self.begin(conn)
+            entry = [conn, None]
+            with self._lock:
+                self._connections[thread] = entry
+        conn, timeout_ms = entry
+        # Each sub-request keeps its own admission class's statement timeout.
+        wanted = g.get('statement_timeout_ms')
+        if wanted and wanted != timeout_ms:
+            conn.execute("SELECT set_config('statement_timeout', %s, false)", (str(int(wanted)),))
+            entry[1] = wanted
+        return _BorrowedConnection(self, conn)
+
+    def close(self):
+        with self._lock:
+            connections = [entry[0] for entry in self._connections.values()]
+            self._connections.clear()
+        for conn in [*connections, self._leader]:
+            try:
+                conn.rollback()
+            finally:
+                conn.close()
+
+
+def _sub_request_environ(index, item):
+    headers = {'X-Request-ID': f"{g.get('request_id', '')}.{index}"}
+    if request.headers.get('Authorization'):
+        headers['Authorization'] = request.headers['Authorization']
+    builder = EnvironBuilder(
+        path=item['path'],
+        method=item['method'],
+        query_string=item.get('params') or None,
+        json=item.get('body'),
+        headers=headers,
+        environ_base={'REMOTE_ADDR': request.remote_addr},
+    )
+    try:
+        return builder.get_environ()
+    finally:
+        builder.close()
+
+
+def _dispatch(app, environ, verified_token, lender=None):
+    """Run one sub-request through the app's normal dispatch, in a fresh app context."""
+    with app.app_context(), app.request_context(environ):
+        g.verified_token = verified_token
+        g.connection_lender = lender
+        try:
+            response = app.full_dispatch_request()
+        except Exception as err:
+            response = app.make_response(app.handle_exception(err))
+        response.direct_passthrough = False
+        body = response.get_json(silent=True) if response.is_json else response.get_data(as_text=True)
+        return {'status': response.status_code, 'body': body}
+
+
+def _run_reads(app, environs, verified_token):
+    if len(environs) == 1:
+        return [_dispatch(app, environs[0], verified_token)]
+    lender = SnapshotLender()
+    try:
+        return list(_read_executor().map(lambda environ: _dispatch(app, environ, verified_token, lender), environs))
+    finally:
+        lender.close()
+
+
+def _plan(items):
+    """Validate the sub-requests. Returns (steps, errors): each step is ('read', index) or ('serial', index)."""
+    adapter = current_app.url_map.bind('')
+    steps, errors = [], {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not isinstance(item.get('path'), str):
+            errors[index] = {'status': 400, 'body': {'error': "Each request needs a 'path'"}}
+            continue
+        item['method'] = str(item.get('method', 'GET')).upper()
+        if item['method'] not in METHODS or not item['path'].startswith('/api/'):
+            errors[index] = {'status': 400, 'body': {'error': 'Only GET, POST, PUT and DELETE to /api/ paths can be batched'}}
+            continue
+        if item.get('params') is not None and not isinstance(item['params'], dict):
+            errors[index] = {'status': 400, 'body': {'error': "'params' must be an object"}}
+            continue
+        try:
+            endpoint, _args = adapter.match(item['path'], item['method'])
+        except HTTPException as err:
+            errors[index] = {'status': err.code, 'body': {'error': err.description}}
+            continue
+        if endpoint in UNBATCHABLE_ENDPOINTS:
+            errors[index] = {'status': 400, 'body': {'error': f"{item['path']} cannot be batched"}}
+            continue
+        reads_only = item['method'] == 'GET' and endpoint not in WRITING_READ_ENDPOINTS
+        steps.append(('read' if reads_only else 'serial', index))
+    return steps, errors
+
+
+@batch_bp.route('', methods=['POST'])
+@batch_bp.route('/', methods=['POST'])
+@jwt_required()
+def run_batch():
+    """
+    Runs several API requests in one round trip and returns their responses in order.
+    Body: {"requests": [{"method": "GET", "path": "/api/shipments/stats", "params": {...}, "body": {...}}, ...]}
+    Each entry of the returned array is {"status": ..., "body": ...}.
+
+    Sub-requests go through the normal routes as the caller, so role checks
+    and admission control apply to each one. The token is verified once for
+    the whole batch. Consecutive reads run concurrently on one shared
+    REPEATABLE READ snapshot, bypassing the response cache and single-flight,
+    so they agree with each other. A write (or a read that writes) runs on
+    its own, in order, so later reads see it.
+    """
+    payload = request.get_json(silent=True)
+    items = payload.get('requests') if isinstance(payload, dict) else None
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': "'requests' must be a non-empty list"}), 400
+    if len(items) > MAX_REQUESTS:
+        return jsonify({'error': f"At most {MAX_REQUESTS} requests per batch"}), 400
+
+    steps, results = _plan(items)
+    app = current_app._get_current_object()
+    verified_token = (request.headers['Authorization'].split(None, 1)[-1], get_jwt())
+    environs = {index: _sub_request_environ(index, items[index]) for _kind, index in steps}
+    try:
+        position = 0
+        while position < len(steps):
+            kind, index = steps[position]
+            if kind == 'serial':
+                results[index] = _dispatch(app, environs[index], verified_token)
+                position += 1
+                continue
+            group = []
+            while position < len(steps) and steps[position][0] == 'read':
+                group.append(steps[position][1])
+                position += 1
+            for group_index, result in zip(group, _run_reads(app, [environs[i] for i in group], verified_token)):
+                results[group_index] = result
+    except psycopg.OperationalError as err:
+        logger.error("batch could not open its snapshot: %s", err)
+        return jsonify({'error': 'Database connection failed'}), 500
+    return jsonify([results[index] for index in range(len(items))])
@@ -0,0 +1,165 @@
+import os
+from datetime import date, datetime
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required
+from db import get_db_connection, get_dict_cursor
+
+changes_bp = Blueprint('changes', __name__)
+
+TOMBSTONE_RETENTION_DAYS = int(os.getenv('CHANGE_TOMBSTONE_RETENTION_DAYS', '30'))
+
+# Tables exposed through the change feed, with their primary key and the
+# columns sent to clients.
+CHANGE_FEED_TABLES = {
+    'shipments': (
+        'id',
+        "id, customer_name, job_number, shipping_date, qc_name, status, row_version, updated_at"
+    ),
+    'shipped_units': (
+        'unit_id',
+        "unit_id, shipment_id, model_type, part_number, serial_number, original_serial_number, "
+        "first_test_pass, failed_equipment, retest_reason, row_version, updated_at"
+    ),
+    'shipment_checklist_responses': (
+        'response_id',
+        "response_id, shipment_id, item_id, status, completed_by, completion_date, comments, row_version, updated_at"
+    ),
+    'model_numbers': (
+        'model_id',
+        "model_id, model_type, description, part_number, is_active, row_version, updated_at"
+    ),
+}
+
+
+def _parse_token(token):
+    """
+    A token is '<last row_version>.<snapshot xmin>'. Returns (version, xmin);
+    an empty token means 'everything'.
+    """
+    if not token:
+        return 0, None
+    version, _, xmin = token.partition('.')
+    return int(version), (int(xmin) if xmin else None)
+
+
+def prune_change_tombstones(conn, days=TOMBSTONE_RETENTION_DAYS):
+    """
+    Delete tombstones older than ``days`` and commit. Clients whose token
+    predates a pruned tombstone are told to reload everything.
+    Returns the number of tombstones deleted.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            WITH pruned AS (
+                DELETE FROM change_tombstones
+                WHERE deleted_at < CURRENT_TIMESTAMP - make_interval(days => %s)
+                RETURNING row_version
+            )
+            UPDATE change_feed_state
+            SET pruned_through = GREATEST(pruned_through, (SELECT max(row_version) FROM pruned))
+            RETURNING (SELECT count(*) FROM pruned)
+        """, (days,))
+        row = cursor.fetchone()
+        conn.commit()
+        return row[0] if row else 0
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _serialize(row):
+    for key, value in row.items():
+        if isinstance(value, (date, datetime)):
+            row[key] = value.isoformat()
+    return row
+
+
+@changes_bp.route('', methods=['GET'])
+@changes_bp.route('/', methods=['GET'])
+@jwt_required()
+def get_changes():
+    """
+    Returns rows of shipments, shipped_units, shipment_checklist_responses and
+    model_numbers changed since ``since``, plus tombstones for deleted rows.
+    Pass the returned ``next`` token on the following poll.
+
+    Sequence numbers are taken at write time but become visible at commit, so
+    a row can appear with a version below one already delivered. The token
+    therefore also carries the snapshot xmin of the previous poll, and rows
+    written by any transaction at or after it are sent again. Clients should
+    apply changes idempotently (upsert by primary key).
+
+    Tombstones are kept for CHANGE_TOMBSTONE_RETENTION_DAYS. A token older
+    than the pruned ones gets 410; the client should reload everything and
+    start again without ``since``.
+
+    ``tables`` (comma-separated) limits the feed to the tables a page shows.
+    The token can only be reused with the same tables.
+    """
+    try:
+        since_version, since_xmin = _parse_token(request.args.get('since', ''))
+    except ValueError:
+        return jsonify({'error': "Invalid 'since' token."}), 400
+    tables = [name.strip() for name in request.args.get('tables', '').split(',') if name.strip()]
+    unknown = [name for name in tables if name not in CHANGE_FEED_TABLES]
+    if unknown:
+        return jsonify({'error': f"Unknown table(s): {', '.join(unknown)}"}), 400
+    tables = tables or list(CHANGE_FEED_TABLES)
+
+    if since_xmin is None:
+        change_filter = "row_version > %s"
+        filter_params = [since_version]
+    else:
+        change_filter = "(row_version > %s OR row_xid >= %s::text::xid8)"
+        filter_params = [since_version, since_xmin]
+
+    conn = get_db_connection()
+    if conn is None:
+        return jsonify({'error': 'Database connection failed'}), 500
+    cursor = None
+    try:
+        cursor = get_dict_cursor(conn)
+        # Take the horizon first so nothing committed after it is skipped next time.
+        cursor.execute("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint AS xmin")
+        xmin = cursor.fetchone()['xmin']
+
+        if since_version or since_xmin is not None:
+            cursor.execute("SELECT pruned_through FROM change_feed_state")
+            state = cursor.fetchone()
+            if state and since_version < state['pruned_through']:
+                return jsonify({'error': "The 'since' token has expired; reload everything.", 'resync': True}), 410
+
+        changes = {}
+        max_version = since_version
+        for table in tables:
+            _pk, columns = CHANGE_FEED_TABLES[table]
+            cursor.execute(
+                f"SELECT {columns} FROM {table} WHERE {change_filter} ORDER BY row_version",
+                tuple(filter_params)
+            )
+            rows = [_serialize(row) for row in cursor.fetchall()]
+            if rows:
+                max_version = max(max_version, max(row['row_version'] for row in rows))
+            changes[table] = {'upserted': rows, 'deleted': []}
+
+        if since_version or since_xmin is not None:
+            cursor.execute(
+                f"SELECT table_name, row_id, row_version FROM change_tombstones "
+                f"WHERE {change_filter} AND table_name = ANY(%s) ORDER BY row_version",
+                (*filter_params, tables)
+            )
+            for row in cursor.fetchall():
+                if row['table_name'] in changes:
+                    changes[row['table_name']]['deleted'].append(row['row_id'])
+                max_version = max(max_version, row['row_version'])
+
+        return jsonify({'changes': changes, 'next': f"{max_version}.{xmin}"})
+    except Exception as err:
+        return jsonify({'error': str(err)}), 500
+    finally:
+        if cursor:
+            cursor.close()
+        conn.close()
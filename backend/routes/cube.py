@@ -0,0 +1,243 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from flask import Blueprint, request, jsonify
+from db import get_db_connection, get_dict_cursor
+
+cube_bp = Blueprint('cube', __name__)
+logger = logging.getLogger('quality.cube')
+
+# Order matters: it must match the GROUPING() argument order used to build the cube.
+CUBE_DIMENSIONS = ('part_number', 'model_type', 'failed_equipment', 'retest_reason', 'customer_name')
+CUBE_REFRESH_LOCK_ID = 29029
+# How often each server process rebuilds the months queued in failure_cube_dirty.
+CUBE_REFRESH_SECONDS = float(os.getenv('CUBE_REFRESH_SECONDS', '60'))
+
+CUBE_BUILD_SQL = """
+    INSERT INTO failure_cube (
+        period, grouping_mask, part_number, model_type, failed_equipment, retest_reason, customer_name,
+        total_units, failed_units, reason_mentions
+    )
+    SELECT
+        date_trunc('month', s.shipping_date)::date AS period,
+        GROUPING(su.part_number, su.model_type, f.failed_equipment, r.reason, s.customer_name) AS grouping_mask,
+        su.part_number,
+        su.model_type,
+        f.failed_equipment,
+        r.reason,
+        s.customer_name,
+        COUNT(DISTINCT su.unit_id) AS total_units,
+        COUNT(DISTINCT su.unit_id) FILTER (WHERE su.first_test_pass = FALSE) AS failed_units,
+        COUNT(r.reason) AS reason_mentions
+    FROM shipped_units su
+    JOIN shipments s ON su.shipment_id = s.id AND su.shipping_date = s.shipping_date
+    CROSS JOIN LATERAL (
+        SELECT CASE WHEN su.first_test_pass = FALSE THEN NULLIF(su.failed_equipment, '') END AS failed_equipment
+    ) f
+    LEFT JOIN LATERAL (
+        SELECT NULLIF(trim(reason), '') AS reason
+        FROM unnest(string_to_array(su.retest_reason, ',')) AS reason
+        WHERE su.first_test_pass = FALSE
+    ) r ON TRUE
+    {where_sql}
+    GROUP BY
+        date_trunc('month', s.shipping_date)::date,
+        CUBE (su.part_number, su.model_type, f.failed_equipment, r.reason, s.customer_name)
+"""
+
+
+def dimension_mask(dimensions):
+    """GROUPING() value for a cube row that keeps ``dimensions`` and rolls up the rest."""
+    mask = 0
+    for index, name in enumerate(CUBE_DIMENSIONS):
+        if name not in dimensions:
+            mask |= 1 << (len(CUBE_DIMENSIONS) - 1 - index)
+    return mask
+
+
+def refresh_failure_cube(conn, full=False, wait=True):
+    """
+    Bring failure_cube up to date and commit. By default only months queued in
+    failure_cube_dirty are rebuilt; ``full`` rebuilds every month.
+    With ``wait=False`` nothing is done when the queue is empty or another
+    refresh is running.
+    Returns the number of months rebuilt (None for a full rebuild).
+    """
+    cursor = conn.cursor()
+    try:
+        if not wait:
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM failure_cube_dirty)")
+            if not cursor.fetchone()[0]:
+                conn.commit()
+                return 0
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", (CUBE_REFRESH_LOCK_ID,))
+            if not cursor.fetchone()[0]:
+                conn.commit()
+                return 0
+        else:
+            # Serialize refreshers so two requests never rebuild the same month twice.
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (CUBE_REFRESH_LOCK_ID,))
+        if full:
+            cursor.execute("DELETE FROM failure_cube_dirty")
+            cursor.execute("DELETE FROM failure_cube")
+            cursor.execute(CUBE_BUILD_SQL.format(where_sql=""))
+            conn.commit()
+            return None
+
+        cursor.execute("DELETE FROM failure_cube_dirty RETURNING period")
+        periods = [row[0] for row in cursor.fetchall()]
+        if periods:
+            cursor.execute("DELETE FROM failure_cube WHERE period = ANY(%s)", (periods,))
+            cursor.execute(
+                CUBE_BUILD_SQL.format(where_sql="WHERE date_trunc('month', s.shipping_date)::date = ANY(%s)"),
+                (periods,)
+            )
+        conn.commit()
+        return len(periods)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+class CubeRefresher:
+    """
+    Background thread that drains failure_cube_dirty every CUBE_REFRESH_SECONDS,
+    so drill-downs only ever read failure_cube. It starts lazily on the first
+    drill-down, so CLI commands never run it. Under ``flask serve`` every
+    worker runs one; the advisory lock lets only one of them rebuild at a time.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def ensure_started(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='failure-cube-refresh', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            conn = get_db_connection()
+            if conn is not None:
+                try:
+                    rebuilt = refresh_failure_cube(conn, wait=False)
+                    if rebuilt:
+                        logger.info("failure cube refreshed (%s month(s) rebuilt)", rebuilt)
+                except Exception as err:
+                    logger.warning("background failure cube refresh failed: %s", err)
+                finally:
+                    conn.close()
+            time.sleep(self.interval)
+
+
+refresher = CubeRefresher(CUBE_REFRESH_SECONDS)
+
+
+def _parse_month(value):
+    return datetime.strptime(value, '%Y-%m').date().replace(day=1)
+
+
+@cube_bp.route('', methods=['GET'])
+@cube_bp.route('/', methods=['GET'])
+def drill_down():
+    """
+    Slices the failure cube.
+    Query params:
+      - dims : comma-separated dimensions to break down by; any of
+               period, part_number, model_type, failed_equipment, retest_reason, customer_name
+      - start / end (YYYY-MM) : inclusive month range
+      - part_number, model_type, failed_equipment, retest_reason, customer_name : exact-match filters
+    Each returned cell carries total_units, failed_units, reason_mentions and first_pass_yield.
+    Only failure_cube is read; it is refreshed in the background, and the
+    X-Cube-Stale-Seconds header says how long its oldest out-of-date month
+    has been waiting (0 when it is current).
+    """
+    requested = [d.strip() for d in request.args.get('dims', '').split(',') if d.strip()]
+    unknown = [d for d in requested if d != 'period' and d not in CUBE_DIMENSIONS]
+    if unknown:
+        return jsonify({'error': f"Unknown dimension(s): {', '.join(unknown)}"}), 400
+    filters = {name: request.args[name] for name in CUBE_DIMENSIONS if request.args.get(name)}
+
+    try:
+        start = _parse_month(request.args['start']) if request.args.get('start') else None
+        end = _parse_month(request.args['end']) if request.args.get('end') else None
+    except ValueError:
+        return jsonify({'error': "Invalid month format. Use YYYY-MM."}), 400
+
+    group_dims = [d for d in requested if d != 'period']
+    # Filtered dimensions must be kept (not rolled up) in the grouping set we read.
+    mask = dimension_mask(set(group_dims) | set(filters))
+
+    where_clauses = ["grouping_mask = %s"]
+    params = [mask]
+    if start:
+        where_clauses.append("period >= %s")
+        params.append(start)
+    if end:
+        where_clauses.append("period <= %s")
+        params.append(end)
+    for name, value in filters.items():
+        where_clauses.append(f"{name} = %s")
+        params.append(value)
+
+    select_dims = list(group_dims)
+    if 'period' in requested:
+        select_dims.insert(0, 'period')
+    select_sql = "".join(f"{d}, " for d in select_dims)
+    group_sql = f"GROUP BY {', '.join(select_dims)}" if select_dims else ""
+    order_sql = f"ORDER BY {', '.join(select_dims)}" if select_dims else ""
+
+    query = f"""
+        SELECT
+            {select_sql}
+            SUM(total_units) AS total_units,
+            SUM(failed_units) AS failed_units,
+            SUM(reason_mentions) AS reason_mentions
+        FROM failure_cube
+        WHERE {' AND '.join(where_clauses)}
+        {group_sql}
+        {order_sql}
+    """
+
+    conn = get_db_connection()
+    if conn is None:
+        return jsonify({'error': 'Database connection failed'}), 500
+    refresher.ensure_started()
+    cursor = None
+    try:
+        cursor = get_dict_cursor(conn)
+        cursor.execute(query, tuple(params))
+        cells = cursor.fetchall()
+        cursor.execute(
+            "SELECT COALESCE(EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - MIN(marked_at)), 0) AS stale_seconds "
+            "FROM failure_cube_dirty"
+        )
+        stale_seconds = int(cursor.fetchone()['stale_seconds'])
+    except Exception as err:
+        return jsonify({'error': str(err)}), 500
+    finally:
+        if cursor:
+            cursor.close()
+        conn.close()
+
+    for cell in cells:
+        if cell.get('period'):
+            cell['period'] = cell['period'].strftime('%Y-%m')
+        total = cell['total_units'] or 0
+        failed = cell['failed_units'] or 0
+        cell['total_units'] = int(total)
+        cell['failed_units'] = int(failed)
+        cell['reason_mentions'] = int(cell['reason_mentions'] or 0)
+        cell['first_pass_yield'] = round(((total - failed) / total) * 100, 2) if total else None
+
+    response = jsonify({'dims': select_dims, 'filters': filters, 'cells': cells})
+    response.headers['X-Cube-Stale-Seconds'] = str(max(0, stale_seconds))
+    return response
@@ -0,0 +1,221 @@
+import psycopg
+from flask import Blueprint, request, jsonify
+from db import get_db_connection, get_dict_cursor
+from singleflight import coalesce_requests
+from response_cache import cached_response
+from routes.shipments import compute_dashboard_stats, format_over_time_rows, _serialize_shipment_rows
+
+dashboard_bp = Blueprint('dashboard', __name__)
+
+DASHBOARD_SECTIONS = ('stats', 'over_time', 'shipments')
+
+SHIPMENT_SUMMARY_SQL = """
+    COALESCE(
+        (
+            SELECT json_agg(json_build_object('model_type', su.model_type, 'count', su.unit_count))
+            FROM (
+                SELECT model_type, COUNT(unit_id) AS unit_count
+                FROM shipped_units
+                WHERE shipment_id = s.id
+                GROUP BY model_type
+            ) su
+        ),
+        '[]'::json
+    ) AS shipped_units_summary
+"""
+
+
+def _resolve_search_hits(cursor, search_term):
+    """
+    Evaluate the search filter exactly once and keep the matching
+    (shipment, unit) pairs in a temp table for the rest of the transaction.
+    A shipment matched on job/customer contributes all of its units; a unit
+    matched on its own fields contributes only itself.
+    """
+    like_term = f"%{search_term}%"
+    cursor.execute("""
+        CREATE TEMP TABLE dashboard_hits ON COMMIT DROP AS
+        SELECT s.id AS shipment_id, s.shipping_date, s.status, su.unit_id
+        FROM shipments s
+        LEFT JOIN shipped_units su ON s.id = su.shipment_id
+        WHERE (s.job_number ILIKE %s OR s.customer_name ILIKE %s OR su.serial_number ILIKE %s
+            OR su.original_serial_number ILIKE %s OR su.part_number ILIKE %s OR su.model_type ILIKE %s)
+    """, tuple([like_term] * 6))
+    cursor.execute("ANALYZE dashboard_hits")
+
+
+def _stats_section(cursor, search_term, start_date, end_date):
+    if search_term:
+        subquery = "SELECT DISTINCT shipment_id AS id FROM dashboard_hits"
+    else:
+        subquery = "SELECT s.id FROM shipments s"
+    where_clauses = []
+    params = []
+    if start_date:
+        where_clauses.append("shipping_date >= %s")
+        params.append(start_date)
+    if end_date:
+        where_clauses.append("shipping_date <= %s")
+        params.append(end_date)
+    if where_clauses:
+        subquery += " WHERE " + " AND ".join(where_clauses)
+    return compute_dashboard_stats(cursor, subquery, params, search_term)
+
+
+def _over_time_section(cursor, search_term):
+    if search_term:
+        source = "dashboard_hits h JOIN shipped_units su ON su.unit_id = h.unit_id"
+        date_column = "h.shipping_date"
+    else:
+        source = "shipped_units su"
+        date_column = "su.shipping_date"
+    cursor.execute(f"""
+        SELECT
+            to_char({date_column}, 'YYYY-MM') AS month,
+            COUNT(su.unit_id) AS total_units,
+            (SUM(CASE WHEN su.first_test_pass = TRUE THEN 1 ELSE 0 END)::numeric / NULLIF(COUNT(su.unit_id), 0)) * 100 AS first_pass_yield
+        FROM {source}
+        GROUP BY month
+        ORDER BY month DESC
+        LIMIT 12
+    """)
+    return format_over_time_rows(cursor.fetchall())
+
+
+def _shipments_section(cursor, search_term, start_date, end_date, status, page, per_page):
+    where_clauses = []
+    params = []
+    if search_term:
+        # Text search spans all dates, matching the /shipments list endpoint.
+        source = """
+            shipments s
+            JOIN (
+                SELECT shipment_id, COUNT(unit_id) AS total_units
+                FROM dashboard_hits
+                GROUP BY shipment_id
+            ) m ON m.shipment_id = s.id
+        """
+        total_units_sql = "m.total_units"
+    else:
+        source = "shipments s"
+        total_units_sql = "(SELECT COUNT(*) FROM shipped_units WHERE shipment_id = s.id)"
+        if start_date:
+            where_clauses.append("s.shipping_date >= %s")
+            params.append(start_date)
+        if end_date:
+            where_clauses.append("s.shipping_date <= %s")
+            params.append(end_date)
+    if status and status in ['In Progress', 'Completed']:
+        where_clauses.append("s.status = %s")
+        params.append(status)
+
+    where_sql = ""
+    if where_clauses:
+        where_sql = "WHERE " + " AND ".join(where_clauses)
+
+    cursor.execute(f"SELECT COUNT(*) AS total_records FROM {source} {where_sql}", tuple(params))
+    total_records = (cursor.fetchone() or {}).get('total_records') or 0
+
+    cursor.execute(f"""
+        SELECT
+            s.id,
+            s.job_number,
+            s.customer_name,
+            s.shipping_date,
+            s.status,
+            {total_units_sql} AS total_units,
+            {SHIPMENT_SUMMARY_SQL}
+        FROM {source}
+        {where_sql}
+        ORDER BY s.shipping_date DESC, s.id DESC
+        LIMIT %s OFFSET %s
+    """, tuple(params + [per_page, (page - 1) * per_page]))
+    shipments = _serialize_shipment_rows(cursor.fetchall())
+
+    return {
+        'shipments': shipments,
+        'total_pages': (total_records + per_page - 1) // per_page,
+        'current_page': page
+    }
+
+
+def _shipment_rows_section(cursor, shipment_ids):
+    """The list rows of ``shipment_ids`` only, for patching a page in place. Deleted ids are absent."""
+    cursor.execute(f"""
+        SELECT
+            s.id,
+            s.job_number,
+            s.customer_name,
+            s.shipping_date,
+            s.status,
+            (SELECT COUNT(*) FROM shipped_units WHERE shipment_id = s.id) AS total_units,
+            {SHIPMENT_SUMMARY_SQL}
+        FROM shipments s
+        WHERE s.id = ANY(%s)
+    """, (shipment_ids,))
+    return {'shipments': _serialize_shipment_rows(cursor.fetchall())}
+
+
+@dashboard_bp.route('', methods=['GET'])
+@dashboard_bp.route('/', methods=['GET'])
+@cached_response(soft_ttl=15)
+@coalesce_requests
+def get_dashboard():
+    """
+    Returns the HomePage KPI stats, the 12-month series and the first page of
+    shipments from a single REPEATABLE READ snapshot, so the three sections
+    always agree with each other.
+    Query params mirror /shipments, /shipments/stats and /shipments/stats/over-time:
+      - search, start_date, end_date, status, page, limit
+    Live updates refresh only what an event touched:
+      - sections : comma-separated subset of stats, over_time, shipments (default all)
+      - shipment_ids : comma-separated ids; the shipments section then holds
+        just those rows (unfiltered, unpaginated)
+    """
+    search_term = request.args.get('search', '')
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    status = request.args.get('status')
+    sections = [name.strip() for name in request.args.get('sections', '').split(',') if name.strip()]
+    unknown = [name for name in sections if name not in DASHBOARD_SECTIONS]
+    if unknown:
+        return jsonify({'error': f"Unknown section(s): {', '.join(unknown)}"}), 400
+    sections = sections or list(DASHBOARD_SECTIONS)
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+        per_page = max(1, int(request.args.get('limit', 10)))
+        shipment_ids = [int(value) for value in request.args.get('shipment_ids', '').split(',') if value.strip()]
+    except ValueError:
+        return jsonify({'error': 'page, limit and shipment_ids must be integers'}), 400
+
+    conn = get_db_connection()
+    if conn is None:
+        return jsonify({'error': 'Database connection failed'}), 500
+    conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+    cursor = None
+    try:
+        cursor = get_dict_cursor(conn)
+        searched = {'stats', 'over_time'} | (set() if shipment_ids else {'shipments'})
+        if search_term and searched & set(sections):
+            _resolve_search_hits(cursor, search_term)
+        payload = {}
+        if 'stats' in sections:
+            payload['stats'] = _stats_section(cursor, search_term, start_date, end_date)
+        if 'over_time' in sections:
+            payload['over_time'] = _over_time_section(cursor, search_term)
+        if 'shipments' in sections:
+            if shipment_ids:
+                payload['shipments'] = _shipment_rows_section(cursor, shipment_ids)
+            else:
+                payload['shipments'] = _shipments_section(
+                    cursor, search_term, start_date, end_date, status, page, per_page
+                )
+        conn.commit()
+        return jsonify(payload)
+    except Exception as err:
+        conn.rollback()
+        return jsonify({'error': str(err)}), 500
+    finally:
+        if cursor:
+            cursor.close()
+        conn.close()
@@ -0,0 +1,67 @@
+import json
+import queue
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from flask_jwt_extended import decode_token
+from notifications import listener, QUALITY_EVENTS_CHANNEL
+import user_status
+
+events_bp = Blueprint('events', __name__)
+
+HEARTBEAT_SECONDS = 15
+EVENT_NAMES = {
+    'shipments': 'shipment',
+    'shipped_units': 'unit',
+    'shipment_checklist_responses': 'checklist',
+}
+
+
+def _format_event(payload):
+    event_name = EVENT_NAMES.get(payload.get('table'), 'resync' if payload.get('op') == 'RESYNC' else 'message')
+    return f"event: {event_name}\ndata: {json.dumps(payload)}\n\n"
+
+
+@events_bp.route('/stream', methods=['GET'])
+def stream_events():
+    """
+    Server-Sent Events stream of shipment, unit and checklist changes.
+    Events are named 'shipment', 'unit' or 'checklist' and carry
+    {table, op, shipment_id, id}; a 'resync' event means notifications may
+    have been missed and the client should reload.
+    EventSource cannot send headers, so the JWT is passed as ?token=.
+    Every open stream holds one server thread, so streams have their own
+    admission class (ADMISSION_STREAM_LIMIT); past it, new streams get 503
+    and the client retries with backoff. A browser shares one stream across its tabs.
+    The user's status is checked again before every event and keep-alive,
+    so deactivating or deleting a user closes their open streams.
+    """
+    token = request.args.get('token')
+    if not token:
+        return jsonify(msg="Missing token"), 401
+    try:
+        claims = decode_token(token)
+    except Exception:
+        return jsonify(msg="Invalid or expired token"), 401
+    identity = claims.get(current_app.config['JWT_IDENTITY_CLAIM'])
+    if user_status.is_revoked(identity):
+        return jsonify(msg="Token has been revoked"), 401
+
+    subscriber = listener.subscribe(QUALITY_EVENTS_CHANNEL)
+
+    def generate():
+        try:
+            yield f"retry: {HEARTBEAT_SECONDS * 1000}\n\n"
+            while True:
+                try:
+                    payload = subscriber.get(timeout=HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    payload = None
+                if user_status.is_revoked(identity):
+                    return
+                yield ": keep-alive\n\n" if payload is None else _format_event(payload)
+        finally:
+            listener.unsubscribe(subscriber, QUALITY_EVENTS_CHANNEL)
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
@@ -1,7 +1,8 @@
 from psycopg import errors
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+from flask_jwt_extended import verify_jwt_in_request
 from db import get_db_connection, get_dict_cursor
+import user_status
 
 models_bp = Blueprint('models', __name__)
 
@@ -15,8 +16,7 @@ def require_editor_role():
         return None
 
     verify_jwt_in_request()
-    current_user = get_jwt_identity()
-    if not current_user or current_user.get('role') not in ['admin', 'user']:
+    if user_status.current_role() not in ['admin', 'user']:
         return jsonify(msg="Editor or administrator rights required to perform this action."), 403
 
     return None
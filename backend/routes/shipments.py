@@ -5,6 +5,11 @@ import json
 from collections import Counter
 from datetime import date, timedelta, datetime
 from routes.auth_decorators import admin_required
+import numpy as np
+import spc
+from singleflight import coalesce_requests
+from response_cache import cached_response
+import response_cache
 
 shipments_bp = Blueprint('shipments', __name__)
 
@@ -23,6 +28,7 @@ def add_shipment():
         )
         new_id = cursor.fetchone()[0]
         conn.commit()
+        response_cache.invalidate()
         return jsonify({'message': 'Shipment created successfully', 'id': new_id}), 201
     except errors.UniqueViolation:
         conn.rollback()
@@ -136,6 +142,17 @@ def get_shipments():
             cursor.close()
         conn.close()
 
+    _serialize_shipment_rows(shipments)
+
+    return jsonify({
+        'shipments': shipments,
+        'total_pages': (total_records + per_page - 1) // per_page,
+        'current_page': page
+    })
+
+
+def _serialize_shipment_rows(shipments):
+    """Normalize shipment list rows (dates and unit summaries) for JSON output."""
     for shipment in shipments:
         if shipment.get('shipping_date'):
             shipment['shipping_date'] = shipment['shipping_date'].isoformat()
@@ -144,12 +161,7 @@ def get_shipments():
             shipment['shipped_units_summary'] = json.loads(summary)
         else:
             shipment['shipped_units_summary'] = summary
-
-    return jsonify({
-        'shipments': shipments,
-        'total_pages': (total_records + per_page - 1) // per_page,
-        'current_page': page
-    })
+    return shipments
 
 
 @shipments_bp.route('/<int:shipment_id>', methods=['GET'])
@@ -161,14 +173,21 @@ def get_shipment_details(shipment_id):
     cursor = None
     try:
         cursor = get_dict_cursor(conn)
-        cursor.execute("SELECT * FROM shipments WHERE id = %s", (shipment_id,))
+        cursor.execute(
+            "SELECT id, customer_name, job_number, shipping_date, qc_name, status FROM shipments WHERE id = %s",
+            (shipment_id,)
+        )
         shipment = cursor.fetchone()
         if not shipment:
             return jsonify({'error': 'Shipment not found'}), 404
         if shipment.get('shipping_date'):
             shipment['shipping_date'] = shipment['shipping_date'].isoformat()
 
-        cursor.execute("SELECT * FROM shipped_units WHERE shipment_id = %s ORDER BY unit_id", (shipment_id,))
+        cursor.execute("""
+            SELECT unit_id, shipment_id, model_type, part_number, serial_number, original_serial_number,
+                   first_test_pass, failed_equipment, retest_reason
+            FROM shipped_units WHERE shipment_id = %s ORDER BY unit_id
+        """, (shipment_id,))
         shipment['units'] = cursor.fetchall()
 
         query = """
@@ -214,6 +233,7 @@ def update_shipment_status(shipment_id):
     try:
         cursor.execute("UPDATE shipments SET status = %s WHERE id = %s", (new_status, shipment_id))
         conn.commit()
+        response_cache.invalidate()
         if cursor.rowcount == 0:
             return jsonify({'error': 'Shipment not found'}), 404
         return jsonify({'message': f'Shipment status updated to {new_status}'})
@@ -234,6 +254,7 @@ def delete_shipment(shipment_id):
     try:
         cursor.execute("DELETE FROM shipments WHERE id = %s", (shipment_id,))
         conn.commit()
+        response_cache.invalidate()
         if cursor.rowcount == 0:
             return jsonify({'error': 'Shipment not found or already deleted'}), 404
             
@@ -245,7 +266,174 @@ def delete_shipment(shipment_id):
         cursor.close()
         conn.close()
 
+def compute_dashboard_stats(cursor, shipment_id_subquery, shipment_params, search_term):
+    """
+    Compute the dashboard KPI block for the shipments selected by
+    ``shipment_id_subquery`` (a SELECT yielding an ``id`` column).
+    """
+    cursor.execute(f"SELECT COUNT(id) as total_shipments FROM ({shipment_id_subquery}) as filtered_shipments", tuple(shipment_params))
+    total_shipments_row = cursor.fetchone() or {}
+    total_shipments = total_shipments_row.get('total_shipments', 0)
+
+    unit_query = f"""
+    SELECT 
+        COUNT(unit_id) as total_units,
+        SUM(CASE WHEN first_test_pass = TRUE THEN 1 ELSE 0 END) as total_first_pass
+    FROM shipped_units 
+    WHERE shipment_id IN ({shipment_id_subquery})
+"""
+    cursor.execute(unit_query, tuple(shipment_params))
+    unit_stats = cursor.fetchone() or {}
+    total_units = unit_stats.get('total_units') or 0
+    total_first_pass = unit_stats.get('total_first_pass') or 0
+
+    fpy = (total_first_pass / total_units) * 100 if total_units else 0
+
+    if search_term:
+        like_term = f"%{search_term}%"
+        filter_dimension = None
+        filter_value = None
+
+        # Prefer an exact part number match if it uniquely identifies a product.
+        part_exact_query = f"""
+        SELECT DISTINCT part_number
+        FROM shipped_units
+        WHERE shipment_id IN ({shipment_id_subquery}) AND LOWER(part_number) = LOWER(%s)
+    """
+        part_exact_params = shipment_params.copy()
+        part_exact_params.append(search_term)
+        cursor.execute(part_exact_query, tuple(part_exact_params))
+        part_exact_matches = [row['part_number'] for row in cursor.fetchall()]
+
+        if part_exact_matches:
+            unique_matches = {pn.lower(): pn for pn in part_exact_matches}
+            if len(unique_matches) == 1:
+                filter_dimension = 'part_number'
+                filter_value = next(iter(unique_matches.values()))
+
+        if not filter_dimension:
+            part_like_query = f"""
+            SELECT DISTINCT part_number
+            FROM shipped_units
+            WHERE shipment_id IN ({shipment_id_subquery})
+            AND part_number ILIKE %s
+        """
+            part_like_params = shipment_params.copy()
+            part_like_params.append(like_term)
+            cursor.execute(part_like_query, tuple(part_like_params))
+            part_like_matches = [row['part_number'] for row in cursor.fetchall()]
+
+            if part_like_matches:
+                lowered = [pn.lower() for pn in part_like_matches]
+                if search_term.lower() in lowered:
+                    filter_dimension = 'part_number'
+                    filter_value = part_like_matches[lowered.index(search_term.lower())]
+                elif len(set(lowered)) == 1:
+                    filter_dimension = 'part_number'
+                    filter_value = part_like_matches[0]
+                elif len(part_like_matches) == 1:
+                    filter_dimension = 'part_number'
+                    filter_value = part_like_matches[0]
+
+        if not filter_dimension:
+            # Fall back to model_type matching when part number doesn't uniquely identify a product.
+            exact_type_query = f"""
+            SELECT DISTINCT model_type 
+            FROM shipped_units 
+            WHERE shipment_id IN ({shipment_id_subquery}) AND LOWER(model_type) = LOWER(%s)
+        """
+            exact_type_params = shipment_params.copy()
+            exact_type_params.append(search_term)
+            cursor.execute(exact_type_query, tuple(exact_type_params))
+            exact_matches = [row['model_type'] for row in cursor.fetchall()]
+
+            if len(exact_matches) == 1:
+                filter_dimension = 'model_type'
+                filter_value = exact_matches[0]
+            else:
+                like_type_query = f"""
+                SELECT DISTINCT model_type 
+                FROM shipped_units 
+                WHERE shipment_id IN ({shipment_id_subquery}) 
+                AND (model_type ILIKE %s OR part_number ILIKE %s)
+            """
+                like_type_params = shipment_params.copy()
+                like_type_params.extend([like_term, like_term])
+                cursor.execute(like_type_query, tuple(like_type_params))
+                like_matches = [row['model_type'] for row in cursor.fetchall()]
+
+                if like_matches:
+                    lowered_matches = [mt.lower() for mt in like_matches]
+                    if search_term.lower() in lowered_matches:
+                        filter_dimension = 'model_type'
+                        filter_value = like_matches[lowered_matches.index(search_term.lower())]
+                    elif len(set(lowered_matches)) == 1:
+                        filter_dimension = 'model_type'
+                        filter_value = like_matches[0]
+                    elif len(like_matches) == 1:
+                        filter_dimension = 'model_type'
+                        filter_value = like_matches[0]
+
+        if filter_dimension and filter_value:
+            filtered_query = f"""
+            SELECT 
+                COUNT(unit_id) as filtered_units,
+                SUM(CASE WHEN first_test_pass = TRUE THEN 1 ELSE 0 END) as filtered_first_pass
+            FROM shipped_units 
+            WHERE shipment_id IN ({shipment_id_subquery}) AND {filter_dimension} = %s
+        """
+            filtered_params = shipment_params.copy()
+            filtered_params.append(filter_value)
+            cursor.execute(filtered_query, tuple(filtered_params))
+            filtered_stats = cursor.fetchone() or {}
+            filtered_units = filtered_stats.get('filtered_units') or 0
+            filtered_first_pass = filtered_stats.get('filtered_first_pass') or 0
+
+            if filtered_units:
+                fpy = (filtered_first_pass / filtered_units) * 100
+
+    retest_fetch_query = f"""
+    SELECT retest_reason FROM shipped_units
+    WHERE first_test_pass = FALSE AND retest_reason IS NOT NULL AND retest_reason != ''
+    AND shipment_id IN ({shipment_id_subquery})
+"""
+    cursor.execute(retest_fetch_query, tuple(shipment_params))
+    raw_reasons_list = cursor.fetchall()
+
+    reason_counts = Counter()
+    for row in raw_reasons_list:
+        reasons = [r.strip() for r in row['retest_reason'].split(',')]
+        reason_counts.update(reasons)
+
+    retest_reasons = [{'retest_reason': reason, 'count': count} for reason, count in reason_counts.items()]
+
+    failed_equipment_fetch_query = f"""
+    SELECT failed_equipment FROM shipped_units
+    WHERE first_test_pass = FALSE AND failed_equipment IS NOT NULL AND failed_equipment != ''
+    AND shipment_id IN ({shipment_id_subquery})
+"""
+    cursor.execute(failed_equipment_fetch_query, tuple(shipment_params))
+    raw_failed_equipment_list = cursor.fetchall()
+
+    failed_equipment_counts = Counter()
+    for row in raw_failed_equipment_list:
+        if row['failed_equipment']:
+            failed_equipment_counts.update([row['failed_equipment']])
+
+    failed_equipment_stats = [{'equipment': equipment, 'count': count} for equipment, count in failed_equipment_counts.items()]
+    
+    return {
+        'total_shipments': total_shipments,
+        'total_units_shipped': total_units,
+        'first_pass_yield': round(fpy, 2),
+        'retest_reasons': retest_reasons,
+        'failed_equipment_stats': failed_equipment_stats
+    }
+
+
 @shipments_bp.route('/stats', methods=['GET'])
+@cached_response(soft_ttl=30)
+@coalesce_requests
 def get_dashboard_stats():
     search_term = request.args.get('search', '')
     start_date = request.args.get('start_date')
@@ -278,164 +466,8 @@ def get_dashboard_stats():
     cursor = None
     try:
         cursor = get_dict_cursor(conn)
-
-        cursor.execute(f"SELECT COUNT(id) as total_shipments FROM ({shipment_id_subquery}) as filtered_shipments", tuple(shipment_params))
-        total_shipments_row = cursor.fetchone() or {}
-        total_shipments = total_shipments_row.get('total_shipments', 0)
-
-        unit_query = f"""
-        SELECT 
-            COUNT(unit_id) as total_units,
-            SUM(CASE WHEN first_test_pass = TRUE THEN 1 ELSE 0 END) as total_first_pass
-        FROM shipped_units 
-        WHERE shipment_id IN ({shipment_id_subquery})
-    """
-        cursor.execute(unit_query, tuple(shipment_params))
-        unit_stats = cursor.fetchone() or {}
-        total_units = unit_stats.get('total_units') or 0
-        total_first_pass = unit_stats.get('total_first_pass') or 0
-
-        fpy = (total_first_pass / total_units) * 100 if total_units else 0
-
-        if search_term and like_term:
-            filter_dimension = None
-            filter_value = None
-
-            # Prefer an exact part number match if it uniquely identifies a product.
-            part_exact_query = f"""
-            SELECT DISTINCT part_number
-            FROM shipped_units
-            WHERE shipment_id IN ({shipment_id_subquery}) AND LOWER(part_number) = LOWER(%s)
-        """
-            part_exact_params = shipment_params.copy()
-            part_exact_params.append(search_term)
-            cursor.execute(part_exact_query, tuple(part_exact_params))
-            part_exact_matches = [row['part_number'] for row in cursor.fetchall()]
-
-            if part_exact_matches:
-                unique_matches = {pn.lower(): pn for pn in part_exact_matches}
-                if len(unique_matches) == 1:
-                    filter_dimension = 'part_number'
-                    filter_value = next(iter(unique_matches.values()))
-
-            if not filter_dimension:
-                part_like_query = f"""
-                SELECT DISTINCT part_number
-                FROM shipped_units
-                WHERE shipment_id IN ({shipment_id_subquery})
-                AND part_number ILIKE %s
-            """
-                part_like_params = shipment_params.copy()
-                part_like_params.append(like_term)
-                cursor.execute(part_like_query, tuple(part_like_params))
-                part_like_matches = [row['part_number'] for row in cursor.fetchall()]
-
-                if part_like_matches:
-                    lowered = [pn.lower() for pn in part_like_matches]
-                    if search_term.lower() in lowered:
-                        filter_dimension = 'part_number'
-                        filter_value = part_like_matches[lowered.index(search_term.lower())]
-                    elif len(set(lowered)) == 1:
-                        filter_dimension = 'part_number'
-                        filter_value = part_like_matches[0]
-                    elif len(part_like_matches) == 1:
-                        filter_dimension = 'part_number'
-                        filter_value = part_like_matches[0]
-
-            if not filter_dimension:
-                # Fall back to model_type matching when part number doesn't uniquely identify a product.
-                exact_type_query = f"""
-                SELECT DISTINCT model_type 
-                FROM shipped_units 
-                WHERE shipment_id IN ({shipment_id_subquery}) AND LOWER(model_type) = LOWER(%s)
-            """
-                exact_type_params = shipment_params.copy()
-                exact_type_params.append(search_term)
-                cursor.execute(exact_type_query, tuple(exact_type_params))
-                exact_matches = [row['model_type'] for row in cursor.fetchall()]
-
-                if len(exact_matches) == 1:
-                    filter_dimension = 'model_type'
-                    filter_value = exact_matches[0]
-                else:
-                    like_type_query = f"""
-                    SELECT DISTINCT model_type 
-                    FROM shipped_units 
-                    WHERE shipment_id IN ({shipment_id_subquery}) 
-                    AND (model_type ILIKE %s OR part_number ILIKE %s)
-                """
-                    like_type_params = shipment_params.copy()
-                    like_type_params.extend([like_term, like_term])
-                    cursor.execute(like_type_query, tuple(like_type_params))
-                    like_matches = [row['model_type'] for row in cursor.fetchall()]
-
-                    if like_matches:
-                        lowered_matches = [mt.lower() for mt in like_matches]
-                        if search_term.lower() in lowered_matches:
-                            filter_dimension = 'model_type'
-                            filter_value = like_matches[lowered_matches.index(search_term.lower())]
-                        elif len(set(lowered_matches)) == 1:
-                            filter_dimension = 'model_type'
-                            filter_value = like_matches[0]
-                        elif len(like_matches) == 1:
-                            filter_dimension = 'model_type'
-                            filter_value = like_matches[0]
-
-            if filter_dimension and filter_value:
-                filtered_query = f"""
-                SELECT 
-                    COUNT(unit_id) as filtered_units,
-                    SUM(CASE WHEN first_test_pass = TRUE THEN 1 ELSE 0 END) as filtered_first_pass
-                FROM shipped_units 
-                WHERE shipment_id IN ({shipment_id_subquery}) AND {filter_dimension} = %s
-            """
-                filtered_params = shipment_params.copy()
-                filtered_params.append(filter_value)
-                cursor.execute(filtered_query, tuple(filtered_params))
-                filtered_stats = cursor.fetchone() or {}
-                filtered_units = filtered_stats.get('filtered_units') or 0
-                filtered_first_pass = filtered_stats.get('filtered_first_pass') or 0
-
-                if filtered_units:
-                    fpy = (filtered_first_pass / filtered_units) * 100
-
-        retest_fetch_query = f"""
-        SELECT retest_reason FROM shipped_units
-        WHERE first_test_pass = FALSE AND retest_reason IS NOT NULL AND retest_reason != ''
-        AND shipment_id IN ({shipment_id_subquery})
-    """
-        cursor.execute(retest_fetch_query, tuple(shipment_params))
-        raw_reasons_list = cursor.fetchall()
-    
-        reason_counts = Counter()
-        for row in raw_reasons_list:
-            reasons = [r.strip() for r in row['retest_reason'].split(',')]
-            reason_counts.update(reasons)
-    
-        retest_reasons = [{'retest_reason': reason, 'count': count} for reason, count in reason_counts.items()]
-
-        failed_equipment_fetch_query = f"""
-        SELECT failed_equipment FROM shipped_units
-        WHERE first_test_pass = FALSE AND failed_equipment IS NOT NULL AND failed_equipment != ''
-        AND shipment_id IN ({shipment_id_subquery})
-    """
-        cursor.execute(failed_equipment_fetch_query, tuple(shipment_params))
-        raw_failed_equipment_list = cursor.fetchall()
-
-        failed_equipment_counts = Counter()
-        for row in raw_failed_equipment_list:
-            if row['failed_equipment']:
-                failed_equipment_counts.update([row['failed_equipment']])
-
-        failed_equipment_stats = [{'equipment': equipment, 'count': count} for equipment, count in failed_equipment_counts.items()]
-        
-        return jsonify({
-            'total_shipments': total_shipments,
-            'total_units_shipped': total_units,
-            'first_pass_yield': round(fpy, 2),
-            'retest_reasons': retest_reasons,
-            'failed_equipment_stats': failed_equipment_stats
-        })
+        stats = compute_dashboard_stats(cursor, shipment_id_subquery, shipment_params, search_term)
+        return jsonify(stats)
     except Exception as err:
         return jsonify({'error': str(err)}), 500
     finally:
@@ -443,7 +475,22 @@ def get_dashboard_stats():
             cursor.close()
         conn.close()
 
+def format_over_time_rows(data):
+    """Turn newest-first monthly rows into the chart payload used by HomePage."""
+    data = list(reversed(data))
+    labels = [row['month'] for row in data]
+    total_units_data = [row['total_units'] for row in data]
+    fpy_data = [round(row['first_pass_yield'], 2) if row['first_pass_yield'] is not None else 0 for row in data]
+    return {
+        "labels": labels,
+        "totalUnits": total_units_data,
+        "fpy": fpy_data
+    }
+
+
 @shipments_bp.route('/stats/over-time', methods=['GET'])
+@cached_response(soft_ttl=300)
+@coalesce_requests
 def get_stats_over_time():
     search_term = request.args.get('search', '')
     start_date = request.args.get('start_date')
@@ -462,12 +509,13 @@ def get_stats_over_time():
             OR su.part_number ILIKE %s OR su.model_type ILIKE %s)""")
         like_term = f"%{search_term}%"
         params.extend([like_term] * 5)
+    # Bound both sides of the join so each one is pruned to the range's partitions.
     if start_date:
-        where_clauses.append("s.shipping_date >= %s")
-        params.append(start_date)
+        where_clauses.append("s.shipping_date >= %s AND su.shipping_date >= %s")
+        params.extend([start_date, start_date])
     if end_date:
-        where_clauses.append("s.shipping_date <= %s")
-        params.append(end_date)
+        where_clauses.append("s.shipping_date <= %s AND su.shipping_date <= %s")
+        params.extend([end_date, end_date])
         
     where_sql = ""
     if where_clauses:
@@ -481,7 +529,7 @@ def get_stats_over_time():
     FROM
         shipped_units su
     JOIN
-        shipments s ON su.shipment_id = s.id
+        shipments s ON su.shipment_id = s.id AND su.shipping_date = s.shipping_date
     {where_sql}
     GROUP BY
         month
@@ -491,19 +539,7 @@ def get_stats_over_time():
     """
     try:
         cursor.execute(query, tuple(params))
-        data = cursor.fetchall()
-        data.reverse()
-
-        labels = [row['month'] for row in data]
-        total_units_data = [row['total_units'] for row in data]
-        fpy_data = [round(row['first_pass_yield'], 2) if row['first_pass_yield'] is not None else 0 for row in data]
-
-        chart_data = {
-            "labels": labels,
-            "totalUnits": total_units_data,
-            "fpy": fpy_data
-        }
-        return jsonify(chart_data)
+        return jsonify(format_over_time_rows(cursor.fetchall()))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
@@ -511,6 +547,7 @@ def get_stats_over_time():
         conn.close()
 
 @shipments_bp.route('/fpy/weekly', methods=['GET'])
+@coalesce_requests
 def get_weekly_fpy_stats():
     """
     Returns weekly First Pass Yield statistics grouped by product (model_type).
@@ -550,14 +587,13 @@ def get_weekly_fpy_stats():
     # The SQL groups by model type and Sunday-based week bucket.
     stats_query = """
         SELECT
-            (s.shipping_date - (EXTRACT(DOW FROM s.shipping_date)::int) * INTERVAL '1 day')::date AS week_start,
+            (su.shipping_date - (EXTRACT(DOW FROM su.shipping_date)::int) * INTERVAL '1 day')::date AS week_start,
             su.part_number,
             su.model_type,
             COUNT(*) AS total_units,
             SUM(CASE WHEN su.first_test_pass = TRUE THEN 1 ELSE 0 END) AS first_pass_units
         FROM shipped_units su
-        JOIN shipments s ON su.shipment_id = s.id
-        WHERE s.shipping_date BETWEEN %s AND %s
+        WHERE su.shipping_date BETWEEN %s AND %s
         GROUP BY week_start, su.part_number, su.model_type
     """
 
@@ -636,6 +672,8 @@ def get_weekly_fpy_stats():
 
 
 @shipments_bp.route('/fpy/overall', methods=['GET'])
+@cached_response(soft_ttl=300)
+@coalesce_requests
 def get_overall_fpy_stats():
     """
     Returns the lifetime FPY for every part number plus overall totals.
@@ -691,6 +729,242 @@ def get_overall_fpy_stats():
         conn.close()
 
 
+# Bucket start for each supported granularity. Weeks begin on Sunday to match the UI.
+FPY_SERIES_BUCKETS = {
+    'day': ("{col}", "1 day"),
+    'week': ("({col} - EXTRACT(DOW FROM {col})::int)", "1 week"),
+    'month': ("date_trunc('month', {col})::date", "1 month"),
+    'quarter': ("date_trunc('quarter', {col})::date", "3 months"),
+    'year': ("date_trunc('year', {col})::date", "1 year"),
+}
+FPY_SERIES_DEFAULT_DAYS = {'day': 30, 'week': 7 * 12, 'month': 365, 'quarter': 2 * 365, 'year': 5 * 365}
+FPY_SERIES_GROUP_COLUMNS = {
+    'part_number': 'su.part_number',
+    'model_type': 'su.model_type',
+    'equipment': 'su.failed_equipment',
+}
+FPY_SERIES_MAX_DAYS = 3653
+
+
+def parse_series_range(args, granularity):
+    """
+    Parse ``start_date``/``end_date`` for the FPY series endpoints.
+    Returns ``(start_date, end_date, error_message)``.
+    """
+    try:
+        end_date = datetime.strptime(args['end_date'], '%Y-%m-%d').date() if args.get('end_date') else date.today()
+        start_date = (
+            datetime.strptime(args['start_date'], '%Y-%m-%d').date() if args.get('start_date')
+            else end_date - timedelta(days=FPY_SERIES_DEFAULT_DAYS[granularity])
+        )
+    except ValueError:
+        return None, None, "Invalid date format. Use YYYY-MM-DD."
+    if start_date > end_date:
+        return None, None, "start_date must be on or before end_date."
+    if (end_date - start_date).days > FPY_SERIES_MAX_DAYS:
+        return None, None, "Date range is limited to 10 years."
+    return start_date, end_date, None
+
+
+def fetch_fpy_series(cursor, granularity, start_date, end_date, group_by=None):
+    """
+    Run the bucketed, gap-filled FPY query.
+    Returns ``(bucket_starts, bucket_ends, rows)`` where each row holds a
+    ``group_key`` and ``total_units``/``first_pass_units``/``first_pass_yield``
+    arrays aligned with the buckets.
+    """
+    bucket_expr, step = FPY_SERIES_BUCKETS[granularity]
+    group_expr = FPY_SERIES_GROUP_COLUMNS[group_by] if group_by else "NULL::text"
+    # Ungrouped requests always return a single (possibly all-zero) series.
+    keys_sql = "SELECT DISTINCT group_key FROM counts" if group_by else "SELECT NULL::text AS group_key"
+    range_start = f"({bucket_expr.format(col='%(start)s::date')})::timestamp"
+    range_end = f"({bucket_expr.format(col='%(end)s::date')})::timestamp"
+
+    query = f"""
+        WITH buckets AS (
+            SELECT gs::date AS bucket_start, (gs + INTERVAL '{step}' - INTERVAL '1 day')::date AS bucket_end
+            FROM generate_series({range_start}, {range_end}, INTERVAL '{step}') AS gs
+        ),
+        counts AS (
+            SELECT
+                {bucket_expr.format(col='su.shipping_date')} AS bucket_start,
+                {group_expr} AS group_key,
+                COUNT(*) AS total_units,
+                SUM(CASE WHEN su.first_test_pass = TRUE THEN 1 ELSE 0 END) AS first_pass_units
+            FROM shipped_units su
+            WHERE su.shipping_date BETWEEN (SELECT MIN(bucket_start) FROM buckets)
+                AND (SELECT MAX(bucket_end) FROM buckets)
+            GROUP BY 1, 2
+        ),
+        keys AS ({keys_sql})
+        SELECT
+            k.group_key,
+            array_agg(COALESCE(c.total_units, 0) ORDER BY b.bucket_start) AS total_units,
+            array_agg(COALESCE(c.first_pass_units, 0) ORDER BY b.bucket_start) AS first_pass_units,
+            array_agg(ROUND(c.first_pass_units * 100.0 / NULLIF(c.total_units, 0), 2)::float8 ORDER BY b.bucket_start) AS first_pass_yield
+        FROM keys k
+        CROSS JOIN buckets b
+        LEFT JOIN counts c ON c.bucket_start = b.bucket_start AND c.group_key IS NOT DISTINCT FROM k.group_key
+        GROUP BY k.group_key
+        ORDER BY k.group_key NULLS FIRST
+    """
+    buckets_query = f"""
+        SELECT
+            array_agg(to_char(gs, 'YYYY-MM-DD') ORDER BY gs) AS bucket_starts,
+            array_agg(to_char(gs + INTERVAL '{step}' - INTERVAL '1 day', 'YYYY-MM-DD') ORDER BY gs) AS bucket_ends
+        FROM generate_series({range_start}, {range_end}, INTERVAL '{step}') AS gs
+    """
+    params = {'start': start_date, 'end': end_date}
+    cursor.execute(buckets_query, params)
+    bucket_row = cursor.fetchone() or {}
+    cursor.execute(query, params)
+    return bucket_row.get('bucket_starts') or [], bucket_row.get('bucket_ends') or [], cursor.fetchall()
+
+
+@shipments_bp.route('/fpy/series', methods=['GET'])
+@coalesce_requests
+def get_fpy_series():
+    """
+    Returns an FPY time series bucketed and gap-filled in SQL.
+    Query params:
+      - granularity : day | week | month | quarter | year (defaults to week)
+      - start_date / end_date (YYYY-MM-DD) : range of up to 10 years (end defaults to today)
+      - group_by : part_number | model_type | equipment (optional; one series when omitted).
+        Grouping by equipment yields a null-keyed series for units that passed first time.
+    The response is columnar: one shared ``buckets`` array plus per-series
+    arrays aligned with it. Empty buckets report 0 units and a null FPY.
+    """
+    granularity = request.args.get('granularity', 'week')
+    group_by = request.args.get('group_by') or None
+    if granularity not in FPY_SERIES_BUCKETS:
+        return jsonify({'error': f"Invalid granularity. Use one of: {', '.join(FPY_SERIES_BUCKETS)}."}), 400
+    if group_by and group_by not in FPY_SERIES_GROUP_COLUMNS:
+        return jsonify({'error': f"Invalid group_by. Use one of: {', '.join(FPY_SERIES_GROUP_COLUMNS)}."}), 400
+    start_date, end_date, range_error = parse_series_range(request.args, granularity)
+    if range_error:
+        return jsonify({'error': range_error}), 400
+
+    conn = get_db_connection()
+    if conn is None:
+        return jsonify({'error': 'Database connection failed'}), 500
+    cursor = get_dict_cursor(conn)
+    try:
+        buckets, bucket_ends, rows = fetch_fpy_series(cursor, granularity, start_date, end_date, group_by)
+        series = [
+            {
+                'key': row['group_key'],
+                'total_units': row['total_units'],
+                'first_pass_units': row['first_pass_units'],
+                'first_pass_yield': row['first_pass_yield']
+            }
+            for row in rows
+        ]
+        return jsonify({
+            'granularity': granularity,
+            'group_by': group_by,
+            'start': start_date.isoformat(),
+            'end': end_date.isoformat(),
+            'buckets': buckets,
+            'bucket_ends': bucket_ends,
+            'series': series
+        })
+    except Exception as err:
+        return jsonify({'error': str(err)}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
+
+@shipments_bp.route('/fpy/spc', methods=['GET'])
+@cached_response(soft_ttl=300, hard_ttl=3600)
+@coalesce_requests
+def get_fpy_spc():
+    """
+    Returns FPY p-charts for every part number over the same bucketed counts
+    as /fpy/series: centre line, 3-sigma control limits, 95% Wilson intervals
+    and Western Electric rule violations. Responses are cached per query
+    (range, granularity) and dropped when shipments or units change.
+    Query params: granularity, start_date, end_date (see /fpy/series).
+    """
+    granularity = request.args.get('granularity', 'week')
+    if granularity not in FPY_SERIES_BUCKETS:
+        return jsonify({'error': f"Invalid granularity. Use one of: {', '.join(FPY_SERIES_BUCKETS)}."}), 400
+    start_date, end_date, range_error = parse_series_range(request.args, granularity)
+    if range_error:
+        return jsonify({'error': range_error}), 400
+
+    conn = get_db_connection()
+    if conn is None:
+        return jsonify({'error': 'Database connection failed'}), 500
+    cursor = get_dict_cursor(conn)
+    try:
+        buckets, bucket_ends, rows = fetch_fpy_series(cursor, granularity, start_date, end_date, 'part_number')
+    except Exception as err:
+        return jsonify({'error': str(err)}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
+    parts = []
+    if rows:
+        chart = spc.p_chart(
+            [row['total_units'] for row in rows],
+            [row['first_pass_units'] for row in rows]
+        )
+        violations = chart['violations']
+        for index, row in enumerate(rows):
+            rule_hits = [
+                {'rule': rule[0], 'indices': np.flatnonzero(violations[rule_index, index]).tolist()}
+                for rule_index, rule in enumerate(spc.WESTERN_ELECTRIC_RULES)
+            ]
+            parts.append({
+                'part_number': row['group_key'],
+                'center': spc.to_percent_list([chart['center'][index]])[0],
+                'total_units': row['total_units'],
+                'first_pass_units': row['first_pass_units'],
+                'first_pass_yield': spc.to_percent_list(chart['p'][index]),
+                'ucl': spc.to_percent_list(chart['ucl'][index]),
+                'lcl': spc.to_percent_list(chart['lcl'][index]),
+                'ci_low': spc.to_percent_list(chart['ci_low'][index]),
+                'ci_high': spc.to_percent_list(chart['ci_high'][index]),
+                'violations': [hit for hit in rule_hits if hit['indices']]
+            })
+
+    return jsonify({
+        'granularity': granularity,
+        'start': start_date.isoformat(),
+        'end': end_date.isoformat(),
+        'buckets': buckets,
+        'bucket_ends': bucket_ends,
+        'parts': parts
+    })
+
+
+MANIFEST_UNIT_COLUMNS = (
+    "model_type, part_number, serial_number, original_serial_number, "
+    "first_test_pass, failed_equipment, retest_reason"
+)
+
+
+def fetch_units_by_shipment(cursor, columns, shipment_ids, unit_filter="", filter_params=()):
+    """
+    Units for many shipments in one query, as {shipment_id: [unit, ...]}
+    ordered by model_type and part_number. ``unit_filter`` is an extra
+    "AND ..." clause with its own parameters.
+    """
+    units_by_shipment = {}
+    if not shipment_ids:
+        return units_by_shipment
+    cursor.execute(
+        f"SELECT shipment_id, {columns} FROM shipped_units "
+        f"WHERE shipment_id = ANY(%s) {unit_filter} ORDER BY model_type, part_number",
+        (list(shipment_ids), *filter_params)
+    )
+    for unit in cursor.fetchall():
+        units_by_shipment.setdefault(unit.pop('shipment_id'), []).append(unit)
+    return units_by_shipment
+
+
 @shipments_bp.route('/manifest', methods=['GET'])
 def get_manifest_data():
     search_term = request.args.get('search', '')
@@ -731,39 +1005,31 @@ def get_manifest_data():
     try:
         cursor.execute(base_query, tuple(params))
         shipments = cursor.fetchall()
-        
-        for shipment in shipments:
-            unit_query = (
-                "SELECT model_type, part_number, serial_number, original_serial_number, "
-                "first_test_pass, failed_equipment, retest_reason "
-                "FROM shipped_units WHERE shipment_id = %s"
+        shipment_ids = [shipment['id'] for shipment in shipments]
+
+        if search_term:
+            like_term = f"%{search_term}%"
+            # First, only the units that match the search term
+            units_by_shipment = fetch_units_by_shipment(
+                cursor, MANIFEST_UNIT_COLUMNS, shipment_ids,
+                "AND (part_number ILIKE %s OR serial_number ILIKE %s OR original_serial_number ILIKE %s OR model_type ILIKE %s)",
+                [like_term] * 4
             )
-            unit_params = [shipment['id']]
-
-            if search_term:
-                like_term = f"%{search_term}%"
-                # First, try to filter units by the search term
-                filtered_unit_query = unit_query + " AND (part_number ILIKE %s OR serial_number ILIKE %s OR original_serial_number ILIKE %s OR model_type ILIKE %s) ORDER BY model_type, part_number"
-                cursor.execute(filtered_unit_query, tuple(unit_params + [like_term] * 4))
-                units_list = cursor.fetchall()
-
-                # If no units match, it could be because the search term matched a shipment-level field (job or customer).
-                # In that case, we should show all units for that shipment.
-                if not units_list:
-                    # Check if the shipment itself matched
-                    if (search_term.lower() in str(shipment.get('job_number') or '').lower() or 
-                        search_term.lower() in str(shipment.get('customer_name') or '').lower()):
-                        
-                        # Fetch all units for the shipment
-                        all_units_query = unit_query + " ORDER BY model_type, part_number"
-                        cursor.execute(all_units_query, tuple(unit_params))
-                        units_list = cursor.fetchall()
-            else:
-                # No search term, so fetch all units
-                all_units_query = unit_query + " ORDER BY model_type, part_number"
-                cursor.execute(all_units_query, tuple(unit_params))
-                units_list = cursor.fetchall()
+            # Shipments with no matching units matched on job number or customer; show all their units.
+            needle = search_term.lower()
+            whole_shipment_ids = [
+                shipment['id'] for shipment in shipments
+                if shipment['id'] not in units_by_shipment and (
+                    needle in str(shipment.get('job_number') or '').lower() or
+                    needle in str(shipment.get('customer_name') or '').lower()
+                )
+            ]
+            units_by_shipment.update(fetch_units_by_shipment(cursor, MANIFEST_UNIT_COLUMNS, whole_shipment_ids))
+        else:
+            units_by_shipment = fetch_units_by_shipment(cursor, MANIFEST_UNIT_COLUMNS, shipment_ids)
 
+        for shipment in shipments:
+            units_list = units_by_shipment.get(shipment['id'], [])
             shipment['units'] = units_list
             
             # Now, use the correct local variable 'units_list' for calculations
@@ -819,13 +1085,14 @@ def get_weekly_shipments():
         )
         shipments = cursor.fetchall()
         
-        # For each shipment, fetch its units and also calculate summaries
+        units_by_shipment = fetch_units_by_shipment(
+            cursor, "model_type, part_number, serial_number, original_serial_number",
+            [shipment['id'] for shipment in shipments]
+        )
+
+        # Attach each shipment's units and calculate summaries
         for shipment in shipments:
-            cursor.execute(
-                "SELECT model_type, part_number, serial_number, original_serial_number FROM shipped_units WHERE shipment_id = %s ORDER BY model_type, part_number", 
-                (shipment['id'],)
-            )
-            units = cursor.fetchall()
+            units = units_by_shipment.get(shipment['id'], [])
             shipment['units'] = units # Keep the full list for any future detail view
             
             # --- ADD THIS LOGIC (copied from manifest endpoint) ---
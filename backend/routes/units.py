@@ -1,10 +1,13 @@
+import logging
 from psycopg import errors
 from flask import Blueprint, request, jsonify
 from db import get_db_connection
+import response_cache
 # --- IMPORT FROM THE NEW DECORATORS FILE ---
 from routes.auth_decorators import editor_access_required, jwt_required
 
 units_bp = Blueprint('units', __name__)
+logger = logging.getLogger('quality.units')
 
 @units_bp.route('', methods=['POST'])
 @units_bp.route('/', methods=['POST'])
@@ -30,17 +33,30 @@ def add_unit():
         return jsonify({'error': 'Database connection failed'}), 500
     cursor = conn.cursor()
     try:
-        print(f"DEBUG: Inserting unit: shipment_id={shipment_id}, model_type={model_type}, part_number={part_number}, serial_number={serial_number}, original_serial_number={original_serial_number}, first_test_pass={first_test_pass}, failed_equipment={failed_equipment}, retest_reason={retest_reason}")
+        logger.debug("inserting unit", extra={'fields': {
+            'shipment_id': shipment_id, 'model_type': model_type, 'part_number': part_number,
+            'serial_number': serial_number, 'original_serial_number': original_serial_number,
+            'first_test_pass': first_test_pass, 'failed_equipment': failed_equipment,
+            'retest_reason': retest_reason,
+        }})
+        # The unit takes its shipment's shipping_date (the partition key).
         cursor.execute(
             """
-            INSERT INTO shipped_units (shipment_id, model_type, part_number, serial_number, original_serial_number, first_test_pass, failed_equipment, retest_reason)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            INSERT INTO shipped_units (shipment_id, shipping_date, model_type, part_number, serial_number, original_serial_number, first_test_pass, failed_equipment, retest_reason)
+            SELECT s.id, s.shipping_date, %s, %s, %s, %s, %s, %s, %s
+            FROM shipments s
+            WHERE s.id = %s
             RETURNING unit_id
             """,
-            (shipment_id, model_type, part_number, serial_number, original_serial_number, first_test_pass, failed_equipment, retest_reason)
+            (model_type, part_number, serial_number, original_serial_number, first_test_pass, failed_equipment, retest_reason, shipment_id)
         )
-        new_id = cursor.fetchone()[0]
+        row = cursor.fetchone()
+        if row is None:
+            conn.rollback()
+            return jsonify({'error': 'Shipment not found'}), 404
+        new_id = row[0]
         conn.commit()
+        response_cache.invalidate()
         return jsonify({'message': 'Unit added successfully', 'id': new_id}), 201
     except errors.UniqueViolation as err:
         conn.rollback()
@@ -105,6 +121,7 @@ def update__unit(unit_id):
             )
         )
         conn.commit()
+        response_cache.invalidate()
         if cursor.rowcount == 0:
             return jsonify({'error': 'Unit not found'}), 404
         return jsonify({'message': 'Unit updated successfully'}), 200
@@ -133,6 +150,7 @@ def delete_unit(unit_id):
     try:
         cursor.execute("DELETE FROM shipped_units WHERE unit_id = %s", (unit_id,))
         conn.commit()
+        response_cache.invalidate()
         if cursor.rowcount == 0:
             return jsonify({'error': 'Unit not found'}), 404
         return jsonify({'message': 'Unit deleted successfully'}), 200
@@ -1,8 +1,9 @@
 from psycopg import errors
 from flask import Blueprint, request, jsonify
-from werkzeug.security import generate_password_hash
+import passwords
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from db import get_db_connection, get_dict_cursor
+import user_status
 # Import the decorator from our new shared file
 from routes.auth_decorators import admin_required
 
@@ -43,7 +44,10 @@ def create_user():
     if role not in ['admin', 'user', 'viewer', 'QC']:
         return jsonify({"msg": "Invalid role specified. Must be 'admin', 'user', 'viewer', or 'QC'."}), 400
     
-    password_hash = generate_password_hash(password)
+    try:
+        password_hash = passwords.hash_password(password)
+    except passwords.HashingBusy:
+        return passwords.busy_response()
     conn = get_db_connection()
     if conn is None:
         return jsonify({"error": "Database connection failed"}), 500
@@ -86,6 +90,7 @@ def update_user(user_id):
     try:
         cursor.execute("UPDATE users SET username = %s, role = %s WHERE id = %s", (username, role, user_id))
         conn.commit()
+        user_status.invalidate()
         if cursor.rowcount == 0:
             return jsonify({"msg": "User not found"}), 404
         return jsonify({"msg": "User updated successfully"}), 200
@@ -110,6 +115,7 @@ def delete_user(user_id):
     try:
         cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
         conn.commit()
+        user_status.invalidate()
         if cursor.rowcount == 0:
             return jsonify({"msg": "User not found"}), 404
         return jsonify({"msg": "User deleted successfully"}), 200
@@ -131,6 +137,7 @@ def toggle_user_active_status(user_id):
     try:
         cursor.execute("UPDATE users SET is_active = NOT is_active WHERE id = %s", (user_id,))
         conn.commit()
+        user_status.invalidate()
     except Exception as err:
         conn.rollback()
         return jsonify({"error": str(err)}), 500
@@ -148,7 +155,10 @@ def admin_reset_password(user_id):
     if not new_password:
         return jsonify({"msg": "New password is required"}), 400
 
-    password_hash = generate_password_hash(new_password)
+    try:
+        password_hash = passwords.hash_password(new_password)
+    except passwords.HashingBusy:
+        return passwords.busy_response()
     conn = get_db_connection()
     if conn is None:
         return jsonify({"error": "Database connection failed"}), 500
@@ -177,7 +187,10 @@ def change_password():
     if not new_password:
         return jsonify({"msg": "New password is required"}), 400
 
-    password_hash = generate_password_hash(new_password)
+    try:
+        password_hash = passwords.hash_password(new_password)
+    except passwords.HashingBusy:
+        return passwords.busy_response()
     conn = get_db_connection()
     if conn is None:
         return jsonify({"error": "Database connection failed"}), 500
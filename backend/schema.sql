@@ -82,3 +82,249 @@ SELECT setval(
     COALESCE((SELECT MAX(item_id) FROM checklist_master_items), 0),
     TRUE
 );
+
+-- Pre-aggregated failure-analysis cube: one row per (month, grouping set) over
+-- part number, model type, failed equipment, retest reason and customer.
+-- grouping_mask is GROUPING() over those five dimensions (1 bits = rolled up).
+CREATE TABLE IF NOT EXISTS failure_cube (
+    period DATE NOT NULL,
+    grouping_mask INTEGER NOT NULL,
+    part_number VARCHAR(128),
+    model_type VARCHAR(255),
+    failed_equipment TEXT,
+    retest_reason TEXT,
+    customer_name VARCHAR(255),
+    total_units INTEGER NOT NULL,
+    failed_units INTEGER NOT NULL,
+    reason_mentions INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_failure_cube_mask_period ON failure_cube (grouping_mask, period);
+
+-- Months whose cube rows are out of date. Filled by triggers, drained by the refresh.
+-- marked_at is when the month first went stale; the drill-down reports the oldest.
+CREATE TABLE IF NOT EXISTS failure_cube_dirty (
+    period DATE PRIMARY KEY,
+    marked_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE OR REPLACE FUNCTION mark_failure_cube_dirty_from_unit() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO failure_cube_dirty (period)
+        SELECT date_trunc('month', shipping_date)::date FROM shipments WHERE id = OLD.shipment_id
+        ON CONFLICT DO NOTHING;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO failure_cube_dirty (period)
+        SELECT date_trunc('month', shipping_date)::date FROM shipments WHERE id = NEW.shipment_id
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION mark_failure_cube_dirty_from_shipment() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO failure_cube_dirty (period)
+    VALUES (date_trunc('month', OLD.shipping_date)::date)
+    ON CONFLICT DO NOTHING;
+    IF TG_OP = 'UPDATE' THEN
+        INSERT INTO failure_cube_dirty (period)
+        VALUES (date_trunc('month', NEW.shipping_date)::date)
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER trg_shipped_units_failure_cube
+    AFTER INSERT OR UPDATE OR DELETE ON shipped_units
+    FOR EACH ROW EXECUTE FUNCTION mark_failure_cube_dirty_from_unit();
+
+CREATE OR REPLACE TRIGGER trg_shipments_failure_cube
+    AFTER UPDATE OF shipping_date, customer_name OR DELETE ON shipments
+    FOR EACH ROW EXECUTE FUNCTION mark_failure_cube_dirty_from_shipment();
+
+-- Row versioning for the change feed (/api/changes). Every insert or update
+-- stamps the row with the next value of change_seq and the writing
+-- transaction id; deletes leave a tombstone stamped the same way.
+CREATE SEQUENCE IF NOT EXISTS change_seq;
+
+-- nextval() is volatile, so adding row_version with it as the default would
+-- rewrite each table under ACCESS EXCLUSIVE. The column is added bare,
+-- backfilled, and only then given its default (migration 0009). The other
+-- defaults are stable and need no rewrite.
+ALTER TABLE shipments ADD COLUMN IF NOT EXISTS row_version BIGINT;
+UPDATE shipments SET row_version = nextval('change_seq') WHERE row_version IS NULL;
+ALTER TABLE shipments ALTER COLUMN row_version SET DEFAULT nextval('change_seq');
+ALTER TABLE shipments ALTER COLUMN row_version SET NOT NULL;
+
+ALTER TABLE shipped_units ADD COLUMN IF NOT EXISTS row_version BIGINT;
+UPDATE shipped_units SET row_version = nextval('change_seq') WHERE row_version IS NULL;
+ALTER TABLE shipped_units ALTER COLUMN row_version SET DEFAULT nextval('change_seq');
+ALTER TABLE shipped_units ALTER COLUMN row_version SET NOT NULL;
+
+ALTER TABLE shipment_checklist_responses ADD COLUMN IF NOT EXISTS row_version BIGINT;
+UPDATE shipment_checklist_responses SET row_version = nextval('change_seq') WHERE row_version IS NULL;
+ALTER TABLE shipment_checklist_responses ALTER COLUMN row_version SET DEFAULT nextval('change_seq');
+ALTER TABLE shipment_checklist_responses ALTER COLUMN row_version SET NOT NULL;
+
+ALTER TABLE model_numbers ADD COLUMN IF NOT EXISTS row_version BIGINT;
+UPDATE model_numbers SET row_version = nextval('change_seq') WHERE row_version IS NULL;
+ALTER TABLE model_numbers ALTER COLUMN row_version SET DEFAULT nextval('change_seq');
+ALTER TABLE model_numbers ALTER COLUMN row_version SET NOT NULL;
+
+ALTER TABLE shipments ADD COLUMN IF NOT EXISTS row_xid XID8 NOT NULL DEFAULT pg_current_xact_id();
+ALTER TABLE shipments ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE shipped_units ADD COLUMN IF NOT EXISTS row_xid XID8 NOT NULL DEFAULT pg_current_xact_id();
+ALTER TABLE shipped_units ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE shipment_checklist_responses ADD COLUMN IF NOT EXISTS row_xid XID8 NOT NULL DEFAULT pg_current_xact_id();
+ALTER TABLE shipment_checklist_responses ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE model_numbers ADD COLUMN IF NOT EXISTS row_xid XID8 NOT NULL DEFAULT pg_current_xact_id();
+ALTER TABLE model_numbers ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS ix_shipments_row_version ON shipments (row_version);
+CREATE INDEX IF NOT EXISTS ix_shipments_row_xid ON shipments (row_xid);
+CREATE INDEX IF NOT EXISTS ix_shipped_units_row_version ON shipped_units (row_version);
+CREATE INDEX IF NOT EXISTS ix_shipped_units_row_xid ON shipped_units (row_xid);
+CREATE INDEX IF NOT EXISTS ix_checklist_responses_row_version ON shipment_checklist_responses (row_version);
+CREATE INDEX IF NOT EXISTS ix_checklist_responses_row_xid ON shipment_checklist_responses (row_xid);
+CREATE INDEX IF NOT EXISTS ix_model_numbers_row_version ON model_numbers (row_version);
+CREATE INDEX IF NOT EXISTS ix_model_numbers_row_xid ON model_numbers (row_xid);
+
+CREATE TABLE IF NOT EXISTS change_tombstones (
+    row_version BIGINT NOT NULL DEFAULT nextval('change_seq') PRIMARY KEY,
+    row_xid XID8 NOT NULL DEFAULT pg_current_xact_id(),
+    table_name TEXT NOT NULL,
+    row_id INTEGER NOT NULL,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_change_tombstones_row_xid ON change_tombstones (row_xid);
+CREATE INDEX IF NOT EXISTS ix_change_tombstones_deleted_at ON change_tombstones (deleted_at);
+
+-- pruned_through is the highest tombstone version removed by retention
+-- (routes/changes.py); a change-feed token below it must reload everything.
+CREATE TABLE IF NOT EXISTS change_feed_state (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    pruned_through BIGINT NOT NULL DEFAULT 0
+);
+INSERT INTO change_feed_state DEFAULT VALUES ON CONFLICT DO NOTHING;
+
+CREATE OR REPLACE FUNCTION stamp_row_version() RETURNS trigger AS $$
+BEGIN
+    NEW.row_version := nextval('change_seq');
+    NEW.row_xid := pg_current_xact_id();
+    NEW.updated_at := CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Name of the table a trigger was declared on. Triggers on a partitioned
+-- table fire on the partition, so TG_TABLE_NAME would be e.g. shipments_y2025.
+CREATE OR REPLACE FUNCTION root_table_name(rel OID) RETURNS TEXT AS $$
+    SELECT relname::text FROM pg_class WHERE oid = COALESCE(pg_partition_root(rel), rel);
+$$ LANGUAGE sql STABLE;
+
+-- TG_ARGV[0] names the primary key column of the table being tracked.
+-- On a partitioned table, a row that still exists once the statement is done
+-- moved to another partition (its shipping year changed); it was not deleted.
+CREATE OR REPLACE FUNCTION record_change_tombstone() RETURNS trigger AS $$
+DECLARE
+    root_table TEXT := root_table_name(TG_RELID);
+    deleted_id INTEGER := (to_jsonb(OLD) ->> TG_ARGV[0])::integer;
+    moved BOOLEAN := FALSE;
+BEGIN
+    IF root_table <> TG_TABLE_NAME THEN
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE %I = $1)', root_table, TG_ARGV[0])
+            INTO moved USING deleted_id;
+    END IF;
+    IF NOT moved THEN
+        INSERT INTO change_tombstones (table_name, row_id) VALUES (root_table, deleted_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER trg_shipments_row_version
+    BEFORE INSERT OR UPDATE ON shipments
+    FOR EACH ROW EXECUTE FUNCTION stamp_row_version();
+CREATE OR REPLACE TRIGGER trg_shipped_units_row_version
+    BEFORE INSERT OR UPDATE ON shipped_units
+    FOR EACH ROW EXECUTE FUNCTION stamp_row_version();
+CREATE OR REPLACE TRIGGER trg_checklist_responses_row_version
+    BEFORE INSERT OR UPDATE ON shipment_checklist_responses
+    FOR EACH ROW EXECUTE FUNCTION stamp_row_version();
+CREATE OR REPLACE TRIGGER trg_model_numbers_row_version
+    BEFORE INSERT OR UPDATE ON model_numbers
+    FOR EACH ROW EXECUTE FUNCTION stamp_row_version();
+
+CREATE OR REPLACE TRIGGER trg_shipments_tombstone
+    AFTER DELETE ON shipments
+    FOR EACH ROW EXECUTE FUNCTION record_change_tombstone('id');
+CREATE OR REPLACE TRIGGER trg_shipped_units_tombstone
+    AFTER DELETE ON shipped_units
+    FOR EACH ROW EXECUTE FUNCTION record_change_tombstone('unit_id');
+CREATE OR REPLACE TRIGGER trg_checklist_responses_tombstone
+    AFTER DELETE ON shipment_checklist_responses
+    FOR EACH ROW EXECUTE FUNCTION record_change_tombstone('response_id');
+CREATE OR REPLACE TRIGGER trg_model_numbers_tombstone
+    AFTER DELETE ON model_numbers
+    FOR EACH ROW EXECUTE FUNCTION record_change_tombstone('model_id');
+
+-- Live update notifications for the SSE stream (/api/events/stream).
+-- Payload: {"table": ..., "op": ..., "shipment_id": ..., "id": ...}
+CREATE OR REPLACE FUNCTION notify_quality_event() RETURNS trigger AS $$
+DECLARE
+    row_data JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := to_jsonb(OLD);
+    ELSE
+        row_data := to_jsonb(NEW);
+    END IF;
+    PERFORM pg_notify('quality_events', json_build_object(
+        'table', root_table_name(TG_RELID),
+        'op', TG_OP,
+        'shipment_id', COALESCE(row_data ->> 'shipment_id', row_data ->> 'id')::integer,
+        'id', (row_data ->> TG_ARGV[0])::integer
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER trg_shipments_notify
+    AFTER INSERT OR UPDATE OR DELETE ON shipments
+    FOR EACH ROW EXECUTE FUNCTION notify_quality_event('id');
+CREATE OR REPLACE TRIGGER trg_shipped_units_notify
+    AFTER INSERT OR UPDATE OR DELETE ON shipped_units
+    FOR EACH ROW EXECUTE FUNCTION notify_quality_event('unit_id');
+CREATE OR REPLACE TRIGGER trg_checklist_responses_notify
+    AFTER INSERT OR UPDATE OR DELETE ON shipment_checklist_responses
+    FOR EACH ROW EXECUTE FUNCTION notify_quality_event('response_id');
+
+-- Account changes for the per-process user status cache (user_status.py).
+-- Payload: {"op": ..., "id": ..., "is_active": ..., "role": ...}
+CREATE OR REPLACE FUNCTION notify_user_change() RETURNS trigger AS $$
+DECLARE
+    row_data users;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := OLD;
+    ELSE
+        row_data := NEW;
+    END IF;
+    PERFORM pg_notify('user_changes', json_build_object(
+        'op', TG_OP,
+        'id', row_data.id,
+        'is_active', row_data.is_active IS TRUE,
+        'role', row_data.role
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER trg_users_notify
+    AFTER INSERT OR DELETE OR UPDATE OF is_active, role ON users
+    FOR EACH ROW EXECUTE FUNCTION notify_user_change();
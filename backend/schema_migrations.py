@@ -0,0 +1,151 @@
+"""
+Versioned schema migrations, applied with ``flask db-upgrade``.
+
+Migrations are the .sql files in migrations/. They are applied in file-name
+order (``NNNN_description.sql``), and each one is recorded in the
+schema_migrations table together with a checksum.
+A file whose first line is ``-- migrate: no-transaction`` runs outside a
+transaction, one statement at a time, as CREATE INDEX CONCURRENTLY requires.
+If such a migration is interrupted, it can leave an INVALID index. That
+index is dropped before the migration is retried.
+Transactional migrations run with lock_timeout MIGRATION_LOCK_TIMEOUT
+(default 10s), so a blocked ALTER fails instead of stalling live traffic.
+Runners are serialized with an advisory lock.
+"""
+
+import hashlib
+import os
+import re
+import time
+from collections import namedtuple
+
+from db import get_db_connection
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+NO_TRANSACTION_MARKER = '-- migrate: no-transaction'
+LOCK_TIMEOUT = os.getenv('MIGRATION_LOCK_TIMEOUT', '10s')
+MIGRATION_LOCK_ID = 29030
+FILE_PATTERN = re.compile(r'^(\d{4})_([\w-]+)\.sql$')
+CONCURRENT_INDEX = re.compile(r'INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)', re.IGNORECASE)
+
+Migration = namedtuple('Migration', 'version name sql checksum transactional')
+
+
+def discover(directory=MIGRATIONS_DIR):
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = FILE_PATTERN.match(filename)
+        if not match:
+            continue
+        with open(os.path.join(directory, filename), encoding='utf-8') as f:
+            sql_text = f.read()
+        migrations.append(Migration(
+            version=match.group(1),
+            name=match.group(2),
+            sql=sql_text,
+            checksum=hashlib.sha256(sql_text.encode('utf-8')).hexdigest(),
+            transactional=not sql_text.lstrip().startswith(NO_TRANSACTION_MARKER),
+        ))
+    versions = [migration.version for migration in migrations]
+    duplicates = sorted({version for version in versions if versions.count(version) > 1})
+    if duplicates:
+        raise RuntimeError(f"Duplicate migration versions: {', '.join(duplicates)}")
+    return migrations
+
+
+def split_statements(sql_text):
+    """Split a no-transaction migration into statements. Such files must not use $$ bodies."""
+    lines = [line for line in sql_text.splitlines() if not line.strip().startswith('--')]
+    return [statement.strip() for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+
+def ensure_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            duration_ms INTEGER NOT NULL
+        )
+    """)
+
+
+def applied_versions(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT version, checksum FROM schema_migrations")
+        return dict(cursor.fetchall())
+
+
+def _drop_invalid_indexes(conn, migration, log):
+    names = CONCURRENT_INDEX.findall(migration.sql)
+    if not names:
+        return
+    with conn.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE NOT i.indisvalid AND c.relname = ANY(%s)
+            """,
+            (names,)
+        )
+        invalid = [row[0] for row in cursor.fetchall()]
+    for name in invalid:
+        log(f"  dropping invalid index {name} left by an interrupted build")
+        conn.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+
+def apply(conn, migration, log=print):
+    started = time.perf_counter()
+    if migration.transactional:
+        with conn.transaction():
+            conn.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+            conn.execute(migration.sql)
+            _record(conn, migration, started)
+    else:
+        _drop_invalid_indexes(conn, migration, log)
+        for statement in split_statements(migration.sql):
+            conn.execute(statement)
+        _record(conn, migration, started)
+    return time.perf_counter() - started
+
+
+def _record(conn, migration, started):
+    conn.execute(
+        "INSERT INTO schema_migrations (version, name, checksum, duration_ms) VALUES (%s, %s, %s, %s)",
+        (migration.version, migration.name, migration.checksum, int((time.perf_counter() - started) * 1000))
+    )
+
+
+def upgrade(dry_run=False, log=print):
+    """
+    Apply every pending migration in order. Returns the applied (or, with
+    ``dry_run``, pending) migrations. Stops at the first failure.
+    """
+    migrations = discover()
+    conn = get_db_connection()
+    if conn is None:
+        raise RuntimeError("Unable to connect to the database.")
+    conn.autocommit = True
+    try:
+        conn.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+        ensure_table(conn)
+        applied = applied_versions(conn)
+        for migration in migrations:
+            if migration.version in applied and applied[migration.version] != migration.checksum:
+                log(f"warning: migration {migration.version}_{migration.name} changed after it was applied")
+        pending = [migration for migration in migrations if migration.version not in applied]
+        if dry_run:
+            return pending
+        for migration in pending:
+            mode = '' if migration.transactional else ' (no transaction)'
+            log(f"Applying {migration.version}_{migration.name}{mode}...")
+            seconds = apply(conn, migration, log)
+            log(f"  done in {seconds:.2f}s")
+        return pending
+    finally:
+        if not conn.closed:
+            conn.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+            conn.close()
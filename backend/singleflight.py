@@ -0,0 +1,133 @@
+"""
+Request coalescing ("single-flight") for expensive read endpoints.
+
+When several identical requests arrive while one is already being computed,
+the followers wait for the leader and reuse its response instead of running
+the same aggregation again. Nothing is kept once the leader finishes; this
+is not a cache.
+"""
+
+import threading
+from collections import defaultdict
+from functools import wraps
+
+from flask import Response, g, make_response, request
+
+import admission
+
+
+class FlightTimeout(Exception):
+    """A follower gave up waiting for its leader."""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = defaultdict(lambda: {'executions': 0, 'coalesced': 0})
+
+    def do(self, key, fn, label=None, timeout=None):
+        """
+        Run ``fn`` once per concurrent ``key``; every caller gets the same result.
+        Followers wait at most ``timeout`` seconds and then raise FlightTimeout.
+        """
+        label = label or str(key)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats[label]['executions'] += 1
+            else:
+                self._stats[label]['coalesced'] += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise FlightTimeout(label)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            return {
+                label: dict(values, in_flight=sum(1 for key in self._calls if key[0] == label))
+                for label, values in self._stats.items()
+            }
+
+
+flights = SingleFlight()
+
+
+def normalized_query_key():
+    """
+    Endpoint plus query params, with parameter order ignored. Values are kept
+    as sent: views read raw ``request.args``, so ``search=%20`` and no search
+    can give different responses.
+    """
+    params = tuple(sorted(request.args.items(multi=True)))
+    return (request.endpoint, tuple(sorted((request.view_args or {}).items())), params)
+
+
+def bypasses_sharing():
+    """
+    True for requests that must run the view themselves: profiled ones (see
+    profiling.py) and batched reads on a shared snapshot (see routes/batch.py).
+    """
+    return g.get('profiler') is not None or g.get('connection_lender') is not None
+
+
+def _follower_timeout(endpoint_class):
+    """Long enough for the leader to get its slot and hit its statement_timeout."""
+    if endpoint_class is None or not endpoint_class.statement_timeout_ms:
+        return None
+    return endpoint_class.queue_timeout + endpoint_class.statement_timeout_ms / 1000.0
+
+
+def coalesce_requests(view):
+    """
+    Share one execution of ``view`` between identical concurrent requests.
+    Only use on views whose response does not depend on who is asking.
+    Only the leader takes an admission slot. A follower whose leader has not
+    finished within the class's queue and statement timeouts gets 503.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if bypasses_sharing():
+            with admission.slot():
+                return view(*args, **kwargs)
+
+        def run():
+            with admission.slot():
+                response = make_response(view(*args, **kwargs))
+            return response.get_data(), response.status_code, list(response.headers.items())
+
+        key = normalized_query_key()
+        endpoint_class = g.get('admission_deferred')
+        try:
+            body, status, headers = flights.do(key, run, label=key[0], timeout=_follower_timeout(endpoint_class))
+        except FlightTimeout:
+            raise admission.Busy(endpoint_class)
+        # Every caller gets its own Response so after_request hooks never share state.
+        return Response(body, status=status, headers=headers)
+    wrapper.defers_admission = True
+    return wrapper
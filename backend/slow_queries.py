@@ -0,0 +1,178 @@
+"""
+Slow-query log.
+
+The instrumented cursor in db.py reports every statement slower than
+SLOW_QUERY_MS (default 500). Each one is written as a JSON line to a rotating
+log file (SLOW_QUERY_LOG, default logs/slow_queries.log) and aggregated by
+normalized SQL for /api/admin/slow-queries.
+Set SLOW_QUERY_REDACT_PARAMS=1 to keep parameter values out of the log.
+Set SLOW_QUERY_EXPLAIN=1 to capture an EXPLAIN (ANALYZE, BUFFERS) plan for
+read-only SELECT and WITH statements. ANALYZE runs the statement again, so
+the plan runs on a separate thread and connection, in a READ ONLY
+transaction that is always rolled back and bounded by the slow request's
+statement_timeout (outside a request, SLOW_QUERY_EXPLAIN_TIMEOUT_MS, default
+10000). It never delays the request that was slow. Statements that write,
+lock, change sequences or read session temp tables are never explained.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import g, has_request_context, request
+
+import app_logging
+
+THRESHOLD_SECONDS = float(os.getenv('SLOW_QUERY_MS', '500')) / 1000.0
+REDACT_PARAMS = os.getenv('SLOW_QUERY_REDACT_PARAMS', '0') == '1'
+CAPTURE_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', '0') == '1'
+LOG_PATH = os.getenv(
+    'SLOW_QUERY_LOG',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'slow_queries.log')
+)
+EXPLAIN_THREAD_PREFIX = 'slow-query-explain'
+EXPLAIN_TIMEOUT_MS = int(os.getenv('SLOW_QUERY_EXPLAIN_TIMEOUT_MS', '10000'))
+EXPLAINABLE = re.compile(r'^\s*(SELECT|WITH)\b', re.IGNORECASE)
+# Data-modifying CTEs, row locks, advisory locks and sequence changes (setval is
+# not undone by a rollback), and the per-connection temp table of dashboard searches.
+NOT_EXPLAINABLE = re.compile(
+    r'\b(INSERT|UPDATE|DELETE|MERGE|FOR\s+(NO\s+KEY\s+)?UPDATE|FOR\s+(KEY\s+)?SHARE|'
+    r'pg_(try_)?advisory\w*|setval|nextval|dashboard_hits)\b',
+    re.IGNORECASE
+)
+
+_lock = threading.Lock()
+_offenders = {}
+_explain_pending = set()
+_explain_executor = None
+_logger = None
+
+
+def _get_logger():
+    global _logger
+    if _logger is None:
+        logger = logging.getLogger('quality.slow_queries')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        # Written by the logging listener thread, never by the slow request itself.
+        file_handler = app_logging.rotating_file_handler(LOG_PATH, logging.Formatter('%(message)s'))
+        logger.addHandler(app_logging.queued_handler(file_handler))
+        _logger = logger
+    return _logger
+
+
+def normalize_sql(sql_text):
+    return re.sub(r'\s+', ' ', sql_text).strip()
+
+
+def _sql_text(cursor, query):
+    if isinstance(query, (bytes, bytearray)):
+        return query.decode('utf-8', 'replace')
+    if isinstance(query, str):
+        return query
+    try:
+        return query.as_string(cursor.connection)
+    except Exception:
+        return str(query)
+
+
+def _redact(params):
+    if params is None or not REDACT_PARAMS:
+        return params
+    if isinstance(params, dict):
+        return {key: '?' for key in params}
+    return ['?'] * len(params)
+
+
+def record(cursor, query, params, seconds, rows, many=False):
+    """Log one slow statement. Called only for statements over the threshold."""
+    if threading.current_thread().name.startswith(EXPLAIN_THREAD_PREFIX):
+        return
+    sql_text = normalize_sql(_sql_text(cursor, query))
+    route = request.endpoint if has_request_context() else None
+    logged_params = f"<{len(params)} parameter sets>" if many else _redact(params)
+
+    _get_logger().info(json.dumps({
+        'ts': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'duration_ms': round(seconds * 1000, 1),
+        'rows': rows,
+        'route': route,
+        'request_id': g.get('request_id') if has_request_context() else None,
+        'sql': sql_text,
+        'params': logged_params,
+    }, default=str))
+
+    with _lock:
+        entry = _offenders.get(sql_text)
+        if entry is None:
+            entry = {'sql': sql_text, 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'routes': set(), 'plan': None}
+            _offenders[sql_text] = entry
+        entry['count'] += 1
+        entry['total_ms'] += seconds * 1000
+        entry['max_ms'] = max(entry['max_ms'], seconds * 1000)
+        if route:
+            entry['routes'].add(route)
+        entry['last_rows'] = rows
+        entry['last_seen'] = time.time()
+        want_plan = CAPTURE_EXPLAIN and not many and entry['plan'] is None and sql_text not in _explain_pending
+        if want_plan and EXPLAINABLE.match(sql_text) and not NOT_EXPLAINABLE.search(sql_text):
+            _explain_pending.add(sql_text)
+        else:
+            want_plan = False
+
+    if want_plan:
+        timeout_ms = (g.get('statement_timeout_ms') if has_request_context() else None) or EXPLAIN_TIMEOUT_MS
+        _schedule_explain(sql_text, _sql_text(cursor, query), params, timeout_ms)
+
+
+def _schedule_explain(key, sql_text, params, timeout_ms):
+    global _explain_executor
+    with _lock:
+        if _explain_executor is None:
+            _explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=EXPLAIN_THREAD_PREFIX)
+    _explain_executor.submit(_capture_explain, key, sql_text, params, timeout_ms)
+
+
+def _capture_explain(key, sql_text, params, timeout_ms):
+    from db import open_connection
+
+    plan = None
+    conn = open_connection()
+    try:
+        if conn is not None:
+            with conn.cursor() as cursor:
+                cursor.execute("SET TRANSACTION READ ONLY")
+                cursor.execute(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+                cursor.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT TEXT) " + sql_text, params)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+    except Exception as err:
+        plan = f"EXPLAIN failed: {err}"
+    finally:
+        if conn is not None:
+            conn.rollback()
+            conn.close()
+        with _lock:
+            _explain_pending.discard(key)
+            if key in _offenders:
+                _offenders[key]['plan'] = plan
+    _get_logger().info(json.dumps({'ts': time.strftime('%Y-%m-%dT%H:%M:%S'), 'sql': key, 'plan': plan}))
+
+
+def top_offenders(limit=20, order_by='total_ms'):
+    with _lock:
+        entries = [dict(entry, routes=sorted(entry['routes'])) for entry in _offenders.values()]
+    entries.sort(key=lambda entry: entry.get(order_by, 0), reverse=True)
+    for entry in entries:
+        entry['avg_ms'] = round(entry['total_ms'] / entry['count'], 1)
+        entry['total_ms'] = round(entry['total_ms'], 1)
+        entry['max_ms'] = round(entry['max_ms'], 1)
+    return entries[:limit]
+
+
+def reset():
+    with _lock:
+        _offenders.clear()
@@ -0,0 +1,98 @@
+"""
+Statistical process control helpers for first-pass yield.
+
+Everything here works on (parts x buckets) count matrices so all part
+numbers are charted in one pass of NumPy array operations.
+"""
+
+import numpy as np
+
+SIGMA_LIMIT = 3.0
+WILSON_Z = 1.96
+
+# Western Electric rules as (rule id, window length, points required, sigma threshold).
+# Rule 1 is a single point beyond the control limits; rule 4 is a run on one side of the centre line.
+WESTERN_ELECTRIC_RULES = (
+    (1, 1, 1, 3.0),
+    (2, 3, 2, 2.0),
+    (3, 5, 4, 1.0),
+    (4, 8, 8, 0.0),
+)
+
+
+def _window_counts(flags, window):
+    """Count True flags in each trailing window; positions without a full window get 0."""
+    counts = np.zeros(flags.shape, dtype=int)
+    if flags.shape[1] < window:
+        return counts
+    windows = np.lib.stride_tricks.sliding_window_view(flags, window, axis=1)
+    counts[:, window - 1:] = windows.sum(axis=2)
+    return counts
+
+
+def western_electric_violations(z_scores):
+    """
+    Evaluate the Western Electric rules on a matrix of standardized points.
+    NaN entries (empty buckets) never count towards a rule.
+    Returns a boolean array of shape (rules, parts, buckets) flagging the
+    point that completes each violation.
+    """
+    valid = ~np.isnan(z_scores)
+    z = np.where(valid, z_scores, 0.0)
+    results = np.zeros((len(WESTERN_ELECTRIC_RULES),) + z.shape, dtype=bool)
+    for index, (_rule, window, required, threshold) in enumerate(WESTERN_ELECTRIC_RULES):
+        if threshold:
+            above = valid & (z > threshold)
+            below = valid & (z < -threshold)
+        else:
+            above = valid & (z > 0)
+            below = valid & (z < 0)
+        hits = (_window_counts(above, window) >= required) | (_window_counts(below, window) >= required)
+        results[index] = hits & valid
+    return results
+
+
+def p_chart(total_units, first_pass_units):
+    """
+    Build p-charts for every row of the count matrices at once.
+    ``total_units`` and ``first_pass_units`` are (parts x buckets) arrays.
+    Returns a dict of arrays; proportions are fractions in [0, 1] and empty
+    buckets are NaN.
+    """
+    n = np.asarray(total_units, dtype=float)
+    x = np.asarray(first_pass_units, dtype=float)
+    has_units = n > 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = np.where(has_units, x / n, np.nan)
+        totals = n.sum(axis=1)
+        center = np.where(totals > 0, x.sum(axis=1) / totals, np.nan)[:, None]
+        sigma = np.where(has_units, np.sqrt(center * (1 - center) / n), np.nan)
+        ucl = np.minimum(1.0, center + SIGMA_LIMIT * sigma)
+        lcl = np.maximum(0.0, center - SIGMA_LIMIT * sigma)
+
+        z2 = WILSON_Z ** 2
+        denominator = 1 + z2 / n
+        midpoint = (p + z2 / (2 * n)) / denominator
+        half_width = WILSON_Z * np.sqrt(p * (1 - p) / n + z2 / (4 * n ** 2)) / denominator
+        ci_low = np.where(has_units, midpoint - half_width, np.nan)
+        ci_high = np.where(has_units, midpoint + half_width, np.nan)
+
+        # A process with a 0% or 100% centre line has zero sigma; treat it as in control.
+        z_scores = np.where(sigma > 0, (p - center) / sigma, np.where(has_units, 0.0, np.nan))
+
+    return {
+        'center': center[:, 0],
+        'p': p,
+        'ucl': ucl,
+        'lcl': lcl,
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'violations': western_electric_violations(z_scores),
+    }
+
+
+def to_percent_list(values):
+    """Convert a fraction array to a JSON-friendly list of percentages (NaN -> None)."""
+    percents = np.round(np.asarray(values, dtype=float) * 100, 2)
+    return [None if np.isnan(value) else float(value) for value in percents.tolist()]
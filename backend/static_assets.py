@@ -0,0 +1,184 @@
+"""
+Serving of the React production build (backend/build).
+
+The build directory is indexed once at startup. For every file, the index
+keeps its content type, ETag, cache policy and any precompressed variants.
+Files up to MEMORY_LIMIT_BYTES are held in memory, so a request is a
+dictionary lookup with no filesystem calls.
+
+- Brotli (.br) and gzip (.gz) files written by ``flask compress-static`` are
+  served to clients that accept them. Compressible files without a .gz file
+  are gzipped in memory while indexing.
+- Content-hashed files (main.9b768ba2.js) are cached for a year as
+  immutable. index.html is ``no-cache``, so a deploy shows up on the next page
+  load. Other files are cached for an hour. Every response carries an ETag,
+  and If-None-Match is answered with 304.
+- Unknown /api/ paths get a JSON 404, and missing files under /static/ a
+  plain 404. Every other path gets index.html for client-side routing.
+
+A rebuilt frontend is picked up on restart (or ``kill -HUP`` under flask serve).
+"""
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+
+from flask import Response, jsonify, request, send_file
+
+try:
+    import brotli
+except ImportError:  # optional: without it only .gz variants are written
+    brotli = None
+
+logger = logging.getLogger('quality.static')
+
+MEMORY_LIMIT_BYTES = 2 * 1024 * 1024
+# Smaller files gain nothing from compression.
+MIN_COMPRESS_BYTES = 1024
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+DEFAULT_CACHE = 'public, max-age=3600'
+# react-scripts puts an 8+ hex digit content hash in bundle names: main.9b768ba2.js
+HASHED_NAME = re.compile(r'\.[0-9a-f]{8,}\.')
+# Explicit types: on Windows, mimetypes reads the registry, which can map .js to text/plain.
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.json': 'application/json',
+    '.map': 'application/json',
+    '.txt': 'text/plain; charset=utf-8',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon',
+    '.png': 'image/png',
+    '.webmanifest': 'application/manifest+json',
+}
+COMPRESSIBLE_EXTENSIONS = {'.html', '.js', '.css', '.json', '.map', '.txt', '.svg', '.ico', '.webmanifest'}
+# Preferred first.
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+class Asset:
+    __slots__ = ('content_type', 'cache_control', 'variants')
+
+    def __init__(self, content_type, cache_control):
+        self.content_type = content_type
+        self.cache_control = cache_control
+        # encoding (None for identity) -> (in-memory body or None, file path or None, etag)
+        self.variants = {}
+
+
+_index = {}
+
+
+def _content_type(path):
+    ext = os.path.splitext(path)[1].lower()
+    return CONTENT_TYPES.get(ext) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def _cache_control(relative_path):
+    if relative_path == 'index.html':
+        return 'no-cache'
+    if HASHED_NAME.search(os.path.basename(relative_path)):
+        return IMMUTABLE_CACHE
+    return DEFAULT_CACHE
+
+
+def _variant(data, path, tag):
+    etag = hashlib.blake2b(data, digest_size=12).hexdigest() + tag
+    return (data if len(data) <= MEMORY_LIMIT_BYTES else None, path, etag)
+
+
+def _compressible(path, size):
+    return os.path.splitext(path)[1].lower() in COMPRESSIBLE_EXTENSIONS and size >= MIN_COMPRESS_BYTES
+
+
+def build_index(folder):
+    """Map every file under ``folder`` (by URL path) to an Asset."""
+    index = {}
+    variant_suffixes = tuple(suffix for _encoding, suffix in ENCODINGS)
+    for root, _dirs, files in os.walk(folder):
+        for name in files:
+            if name.endswith(variant_suffixes):
+                continue
+            path = os.path.join(root, name)
+            relative_path = os.path.relpath(path, folder).replace(os.sep, '/')
+            with open(path, 'rb') as f:
+                data = f.read()
+            asset = Asset(_content_type(path), _cache_control(relative_path))
+            asset.variants[None] = _variant(data, path, '')
+            for encoding, suffix in ENCODINGS:
+                if os.path.exists(path + suffix) and os.path.getmtime(path + suffix) >= os.path.getmtime(path):
+                    with open(path + suffix, 'rb') as f:
+                        asset.variants[encoding] = _variant(f.read(), path + suffix, '-' + encoding)
+            if 'gzip' not in asset.variants and _compressible(path, len(data)):
+                compressed = gzip.compress(data, compresslevel=6, mtime=0)
+                if len(compressed) < len(data):
+                    asset.variants['gzip'] = _variant(compressed, None, '-gzip')
+            index[relative_path] = asset
+    return index
+
+
+def compress(folder):
+    """Write .gz (and, with the brotli package, .br) next to every compressible file. Returns the files written."""
+    written = []
+    for root, _dirs, files in os.walk(folder):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith(('.gz', '.br')) or not _compressible(path, os.path.getsize(path)):
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            encoders = [('.gz', lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                encoders.append(('.br', lambda raw: brotli.compress(raw, quality=11)))
+            for suffix, encode in encoders:
+                target = path + suffix
+                if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+                    continue
+                with open(target, 'wb') as f:
+                    f.write(encode(data))
+                written.append(target)
+    return written
+
+
+def _respond(asset):
+    encoding = next((encoding for encoding, _suffix in ENCODINGS
+                     if encoding in asset.variants and request.accept_encodings[encoding]), None)
+    body, path, etag = asset.variants[encoding]
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    elif body is not None:
+        response = Response(body, content_type=asset.content_type)
+    else:
+        response = send_file(path, mimetype=asset.content_type, conditional=False, etag=False)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = asset.cache_control
+    if len(asset.variants) > 1:
+        response.vary.add('Accept-Encoding')
+    if encoding and response.status_code == 200:
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def serve(path):
+    asset = _index.get(path)
+    if asset is not None:
+        return _respond(asset)
+    if path == 'api' or path.startswith('api/'):
+        return jsonify({'error': 'Not found'}), 404
+    if path.startswith('static/') or 'index.html' not in _index:
+        return Response('Not found', status=404, mimetype='text/plain')
+    return _respond(_index['index.html'])
+
+
+def init_app(app, folder):
+    _index.clear()
+    if os.path.isdir(folder):
+        _index.update(build_index(folder))
+    if 'index.html' not in _index:
+        logger.warning("frontend build not found in %s; only the API is served", folder)
+    app.add_url_rule('/', 'serve', serve, defaults={'path': ''})
+    app.add_url_rule('/<path:path>', 'serve', serve)
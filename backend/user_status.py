@@ -0,0 +1,156 @@
+"""
+Process-local cache of every user's active flag and role.
+
+Tokens are valid for 8 hours, so deactivating, deleting or demoting a user
+would otherwise only take effect at their next login. Every JWT check asks
+this cache instead. Tokens of inactive or deleted users are rejected as
+revoked, and role checks use the current role rather than the one in the
+token. No query is needed per request.
+
+The whole users table is loaded the first time it is needed and kept
+current through the user_changes NOTIFY channel. It is reloaded after a
+listener reconnect (RESYNC), when a writer in this process calls
+``invalidate()``, and every MAX_AGE_SECONDS as a safety net. If the
+database is unreachable, checks fall back to the token's own claims.
+"""
+
+import logging
+import threading
+import time
+
+from flask import g
+from flask_jwt_extended import get_jwt_identity
+
+from db import get_db_connection
+from notifications import listener
+
+logger = logging.getLogger('quality.user_status')
+
+USER_CHANGES_CHANNEL = 'user_changes'
+MAX_AGE_SECONDS = 300
+# An unknown user id triggers a reload at most this often (deleted users' tokens keep arriving).
+MISS_RELOAD_SECONDS = 5
+
+
+class UserStatusCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = None
+        self._loaded_at = 0.0
+        self._attempted_at = None
+        # Bumped by every change notification; a load that overlapped one is discarded.
+        self._generation = 0
+        self._listening = False
+
+    def _ensure_listening(self):
+        with self._lock:
+            if self._listening:
+                return
+            self._listening = True
+        listener.add_handler(USER_CHANGES_CHANNEL, self._on_change)
+
+    def _load(self):
+        with self._lock:
+            self._attempted_at = time.monotonic()
+            generation = self._generation
+        conn = get_db_connection()
+        if conn is None:
+            return
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT id, is_active IS TRUE, role FROM users")
+                users = {user_id: (is_active, role) for user_id, is_active, role in cursor.fetchall()}
+            conn.commit()
+        except Exception as err:
+            conn.rollback()
+            logger.warning("could not load user status: %s", err)
+            return
+        finally:
+            conn.close()
+        with self._lock:
+            if generation != self._generation:
+                self._attempted_at = None
+                return
+            self._users = users
+            self._loaded_at = time.monotonic()
+
+    def status(self, user_id):
+        """(is_active, role) for ``user_id`` ((False, None) once deleted), or None if the cache cannot be loaded."""
+        self._ensure_listening()
+        now = time.monotonic()
+        with self._lock:
+            users, age, attempted_at = self._users, now - self._loaded_at, self._attempted_at
+        stale = users is None or age > MAX_AGE_SECONDS or user_id not in users
+        # Failed loads and unknown ids retry at most every MISS_RELOAD_SECONDS.
+        if stale and (attempted_at is None or now - attempted_at > MISS_RELOAD_SECONDS):
+            self._load()
+            with self._lock:
+                users = self._users
+        if users is None:
+            return None
+        return users.get(user_id, (False, None))
+
+    def invalidate(self):
+        with self._lock:
+            self._users = None
+            self._attempted_at = None
+            self._generation += 1
+
+    def _on_change(self, payload):
+        if payload.get('op') == 'RESYNC':
+            self.invalidate()
+            return
+        with self._lock:
+            self._generation += 1
+            if self._users is None:
+                return
+            if payload.get('op') == 'DELETE':
+                self._users.pop(payload.get('id'), None)
+            else:
+                self._users[payload.get('id')] = (payload.get('is_active') is True, payload.get('role'))
+
+
+cache = UserStatusCache()
+
+
+def invalidate():
+    cache.invalidate()
+
+
+def _user_id(identity):
+    return identity.get('id') if isinstance(identity, dict) else None
+
+
+def is_revoked(identity):
+    """True when the token's user has been deactivated or deleted."""
+    user_id = _user_id(identity)
+    if user_id is None:
+        return False
+    status = cache.status(user_id)
+    return status is not None and not status[0]
+
+
+def current_role(identity=None):
+    """The current role of the token's user (the current request's by default)."""
+    if identity is None:
+        identity = get_jwt_identity()
+    if not identity:
+        return None
+    user_id = _user_id(identity)
+    status = cache.status(user_id) if user_id is not None else None
+    if status is None:
+        return identity.get('role')
+    is_active, role = status
+    return role if is_active else None
+
+
+def init_app(app):
+    jwt = app.extensions['flask-jwt-extended']
+
+    @jwt.token_in_blocklist_loader
+    def token_revoked(_jwt_header, jwt_payload):
+        # A batch's sub-requests reuse the token the batch already checked.
+        verified = g.get('verified_token')
+        if verified is not None and jwt_payload.get('jti') == verified[1].get('jti'):
+            return False
+        return is_revoked(jwt_payload.get(app.config['JWT_IDENTITY_CLAIM']))
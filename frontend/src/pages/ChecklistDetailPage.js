@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useCallback } from 'react';
 import { useParams, Link, useNavigate } from 'react-router-dom';
-import { getShipmentDetails, updateShipmentStatus, deleteShipment } from '../services/apiService';
+import { getShipmentDetails, updateShipmentStatus, deleteShipment, subscribeToEvents } from '../services/apiService';
 import { useAuth } from '../contexts/AuthContext';
 import ChecklistTable from '../components/checklist/ChecklistTable';
 import ShippedUnitsSection from '../components/units/ShippedUnitsSection';
@@ -36,6 +36,13 @@ const ChecklistDetailPage = () => {
         fetchShipmentDetails();
     }, [fetchShipmentDetails]);
 
+    // Pick up edits made from other stations to this shipment only.
+    useEffect(() => subscribeToEvents((type, payload) => {
+        if (type === 'resync' || String(payload.shipment_id) === String(id)) {
+            fetchShipmentDetails();
+        }
+    }), [id, fetchShipmentDetails]);
+
     const handleLocalUpdate = (updatedData) => {
         setShipment(prevShipment => ({
             ...prevShipment,
@@ -9,14 +9,13 @@ import {
     Tooltip,
     Legend,
 } from 'chart.js';
-import { getWeeklyFPYStats, getOverallFPYStats } from '../services/apiService';
+import { getWeeklyFPYStats, getOverallFPYStats, getFPYSeries } from '../services/apiService';
 import './FPYStatsPage.css';
 
 ChartJS.register(CategoryScale, LinearScale, BarElement, Title, Tooltip, Legend);
 
 const todayISO = () => new Date().toISOString().split('T')[0];
 const AVERAGE_TOTAL_KEY = '__TOTAL__';
-const WEEK_IN_MS = 7 * 24 * 60 * 60 * 1000;
 
 const safeDate = (value) => {
     if (!value) {
@@ -28,28 +27,6 @@ const safeDate = (value) => {
 
 const toISODate = (date) => (date ? date.toISOString().split('T')[0] : '');
 
-const getSundayStart = (date) => {
-    const base = safeDate(date);
-    if (!base) {
-        return null;
-    }
-    const sunday = new Date(base.getTime());
-    const day = sunday.getUTCDay();
-    sunday.setUTCHours(0, 0, 0, 0);
-    sunday.setUTCDate(sunday.getUTCDate() - day);
-    return sunday;
-};
-
-const computeWeeksNeeded = (quarterStart, anchorStart) => {
-    if (!quarterStart || !anchorStart) {
-        return 13;
-    }
-    const diff = Math.max(anchorStart.getTime() - quarterStart.getTime(), 0);
-    const diffWeeks = Math.ceil(diff / WEEK_IN_MS);
-    const weeksWindow = diffWeeks + 1;
-    return Math.min(Math.max(weeksWindow, 4), 26);
-};
-
 const getQuarterDetails = (isoDate) => {
     const base = safeDate(isoDate || todayISO());
     if (!base) {
@@ -61,7 +38,6 @@ const getQuarterDetails = (isoDate) => {
     const endDate = new Date(Date.UTC(year, quarterIndex * 3 + 3, 0));
     startDate.setUTCHours(0, 0, 0, 0);
     endDate.setUTCHours(0, 0, 0, 0);
-    const anchorStart = getSundayStart(endDate);
     return {
         index: quarterIndex + 1,
         label: `Q${quarterIndex + 1} ${year}`,
@@ -69,9 +45,6 @@ const getQuarterDetails = (isoDate) => {
         endDate,
         startISO: toISODate(startDate),
         endISO: toISODate(endDate),
-        anchorStart,
-        anchorDateISO: toISODate(endDate),
-        weeksToFetch: computeWeeksNeeded(startDate, anchorStart),
     };
 };
 
@@ -201,11 +174,21 @@ const FPYStatsPage = () => {
             setQuarterLoading(true);
             setQuarterError('');
             try {
-                const { data } = await getWeeklyFPYStats({
-                    anchor_date: quarterMeta.anchorDateISO,
-                    weeks: quarterMeta.weeksToFetch,
+                const { data } = await getFPYSeries({
+                    granularity: 'week',
+                    start_date: quarterMeta.startISO,
+                    end_date: quarterMeta.endISO,
                 });
-                const weeks = data.weeks || [];
+                const series = (data.series || [])[0] || {};
+                const weeks = (data.buckets || []).map((start, index) => ({
+                    start,
+                    end: data.bucket_ends[index],
+                    totals: {
+                        total_units: series.total_units?.[index] ?? 0,
+                        first_pass_units: series.first_pass_units?.[index] ?? 0,
+                        first_pass_yield: series.first_pass_yield?.[index] ?? 0,
+                    },
+                }));
                 const filteredWeeks = weeks.filter((week) => {
                     const weekStart = safeDate(week?.start);
                     const weekEnd = safeDate(week?.end);
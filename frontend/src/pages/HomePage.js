@@ -1,6 +1,6 @@
-import React, { useState, useEffect, useCallback, useMemo } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { Link, useNavigate } from 'react-router-dom';
-import { getShipments, createShipment, getDashboardStats, getTimeSeriesStats } from '../services/apiService';
+import { createShipment, getDashboard, subscribeToEvents } from '../services/apiService';
 import { Doughnut, Bar } from 'react-chartjs-2';
 import { Chart as ChartJS, ArcElement, Tooltip, Legend, CategoryScale, LinearScale, BarElement, PointElement, LineElement, Title, LineController, BarController } from 'chart.js';
 import { useAuth } from '../contexts/AuthContext';
@@ -38,30 +38,25 @@ const HomePage = () => {
 
     const debouncedSearchTerm = useDebounce(searchTerm, 500);
 
+    const filterParams = useMemo(() => ({
+        search: debouncedSearchTerm,
+        status: statusFilter === 'All' ? '' : statusFilter,
+        start_date: startDate,
+        end_date: endDate,
+    }), [debouncedSearchTerm, statusFilter, startDate, endDate]);
+
     const fetchData = useCallback(async () => {
         setIsLoading(true);
         try {
-            const filterParams = {
-                search: debouncedSearchTerm,
-                status: statusFilter === 'All' ? '' : statusFilter,
-                start_date: startDate,
-                end_date: endDate,
-            };
-            
-            const shipmentListParams = { ...filterParams, page: currentPage, limit: (debouncedSearchTerm || statusFilter === 'In Progress') ? 1000 : 100 };
-            
-            const timeSeriesFilterParams = { search: debouncedSearchTerm };
+            const dashboardParams = { ...filterParams, page: currentPage, limit: (debouncedSearchTerm || statusFilter === 'In Progress') ? 1000 : 100 };
 
-            const [statsResponse, timeSeriesResponse, shipmentsResponse] = await Promise.all([
-                getDashboardStats(filterParams),
-                getTimeSeriesStats(timeSeriesFilterParams), // Use separate params for this chart
-                getShipments(shipmentListParams)
-            ]);
-            
-            setStats(statsResponse.data);
-            setTimeSeriesData(timeSeriesResponse.data);
-            setShipments(shipmentsResponse.data.shipments);
-            setTotalPages(shipmentsResponse.data.total_pages);
+            // Stats, the 12-month chart and the shipment list come from one snapshot.
+            const { data } = await getDashboard(dashboardParams);
+
+            setStats(data.stats);
+            setTimeSeriesData(data.over_time);
+            setShipments(data.shipments.shipments);
+            setTotalPages(data.shipments.total_pages);
             setError('');
         } catch (err) {
             setError('Failed to fetch dashboard data. Please try again later.');
@@ -69,12 +64,92 @@ const HomePage = () => {
         } finally {
             setIsLoading(false);
         }
-    }, [currentPage, debouncedSearchTerm, startDate, endDate, statusFilter]);
+    }, [filterParams, currentPage, debouncedSearchTerm, statusFilter]);
 
     useEffect(() => {
         fetchData();
     }, [fetchData]);
 
+    const shipmentsRef = useRef(shipments);
+    useEffect(() => {
+        shipmentsRef.current = shipments;
+    }, [shipments]);
+
+    // Applies one burst of events. A resync reloads everything. A change that
+    // can move a shipment into or out of the list reloads the list; any other
+    // change re-reads only the visible rows it touched. The KPIs are re-read
+    // on their own.
+    const applyEvents = useCallback(async ({ resync, reloadList, shipmentIds }) => {
+        if (resync) {
+            fetchData();
+            return;
+        }
+        try {
+            const kpis = getDashboard({ ...filterParams, sections: 'stats,over_time' });
+            const visibleIds = new Set(shipmentsRef.current.map((shipment) => shipment.id));
+            const changedIds = [...shipmentIds].filter((id) => visibleIds.has(id));
+            let rows = null;
+            if (reloadList) {
+                const limit = (debouncedSearchTerm || statusFilter === 'In Progress') ? 1000 : 100;
+                rows = getDashboard({ ...filterParams, sections: 'shipments', page: currentPage, limit });
+            } else if (changedIds.length) {
+                rows = getDashboard({ sections: 'shipments', shipment_ids: changedIds.join(',') });
+            }
+            const { data } = await kpis;
+            setStats(data.stats);
+            setTimeSeriesData(data.over_time);
+            if (rows) {
+                const { data: { shipments: section } } = await rows;
+                if (reloadList) {
+                    setShipments(section.shipments);
+                    setTotalPages(section.total_pages);
+                } else {
+                    const fresh = new Map(section.shipments.map((shipment) => [shipment.id, shipment]));
+                    setShipments((previous) => previous
+                        .filter((shipment) => !changedIds.includes(shipment.id) || fresh.has(shipment.id))
+                        .map((shipment) => fresh.get(shipment.id) || shipment));
+                }
+            }
+            setError('');
+        } catch (err) {
+            setError('Failed to fetch dashboard data. Please try again later.');
+            console.error(err);
+        }
+    }, [fetchData, filterParams, currentPage, debouncedSearchTerm, statusFilter]);
+
+    // Other stations' edits change the KPIs and list; checklist saves do not.
+    // Bursts (e.g. scanning a batch of units) are coalesced into one refresh.
+    useEffect(() => {
+        let timer = null;
+        let pending = { resync: false, reloadList: false, shipmentIds: new Set() };
+        const filtered = Boolean(filterParams.search || filterParams.status || filterParams.start_date || filterParams.end_date);
+        const unsubscribe = subscribeToEvents((type, payload) => {
+            if (type === 'checklist') {
+                return;
+            }
+            if (type === 'resync') {
+                pending.resync = true;
+            } else if (type === 'shipment' && (payload.op !== 'UPDATE' || filtered)) {
+                pending.reloadList = true;
+            } else if (type === 'unit' && filterParams.search) {
+                // Searches match serial numbers.
+                pending.reloadList = true;
+            } else if (payload.shipment_id != null) {
+                pending.shipmentIds.add(payload.shipment_id);
+            }
+            clearTimeout(timer);
+            timer = setTimeout(() => {
+                const batch = pending;
+                pending = { resync: false, reloadList: false, shipmentIds: new Set() };
+                applyEvents(batch);
+            }, 1000);
+        });
+        return () => {
+            clearTimeout(timer);
+            unsubscribe();
+        };
+    }, [applyEvents, filterParams]);
+
     useEffect(() => {
         // Reset to the first page whenever filters change
         setCurrentPage(1);
@@ -1,9 +1,15 @@
-import React, { useState, useEffect, useCallback } from 'react';
-import { getModels, addModel, updateModel, checkPartNumber } from '../services/apiService';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
+import { getChanges, addModel, updateModel, checkPartNumber } from '../services/apiService';
 import useDebounce from '../hooks/useDebounce';
 import { useAuth } from '../contexts/AuthContext';
 import './ModelManagementPage.css';
 
+// The list follows /api/changes: one full load, then only changed models.
+const MODEL_POLL_MS = 15000;
+
+const sortModels = (list) => [...list].sort((a, b) =>
+    a.model_type.localeCompare(b.model_type) || a.part_number.localeCompare(b.part_number));
+
 const ModelManagementPage = () => {
     const { user } = useAuth();
     const canManageModels = user && (user.role === 'admin' || user.role === 'user');
@@ -22,23 +28,55 @@ const ModelManagementPage = () => {
     const [partNumberError, setPartNumberError] = useState('');
 
     const debouncedPartNumber = useDebounce(newPartNumber, 500);
+    const changeToken = useRef(null);
+    const syncing = useRef(false);
+    const syncAgain = useRef(false);
 
+    // Applies the model changes since the last sync. Without a token (first
+    // load, or after a 410 because the token expired) it replaces the list.
     const fetchModels = useCallback(async () => {
+        if (syncing.current) {
+            syncAgain.current = true;
+            return;
+        }
+        syncing.current = true;
         try {
-            setIsLoading(true);
-            const response = await getModels();
-            setModels(response.data.all_models);
-            setError('');
-        } catch (err) {
-            setError('Failed to fetch models. Please try again later.');
-            console.error(err);
+            do {
+                syncAgain.current = false;
+                const since = changeToken.current;
+                try {
+                    const response = await getChanges(since, 'model_numbers');
+                    const { upserted, deleted } = response.data.changes.model_numbers;
+                    setModels((previous) => {
+                        const byId = new Map((since ? previous : []).map((model) => [model.model_id, model]));
+                        deleted.forEach((id) => byId.delete(id));
+                        upserted.forEach((model) => byId.set(model.model_id, model));
+                        return sortModels(byId.values());
+                    });
+                    changeToken.current = response.data.next;
+                    setError('');
+                } catch (err) {
+                    if (err.response?.status === 410 && since) {
+                        changeToken.current = null;
+                        syncAgain.current = true;
+                    } else {
+                        setError('Failed to fetch models. Please try again later.');
+                        console.error(err);
+                    }
+                }
+            } while (syncAgain.current);
         } finally {
+            syncing.current = false;
             setIsLoading(false);
         }
     }, []);
 
     useEffect(() => {
         fetchModels();
+        const timer = setInterval(() => {
+            if (!document.hidden) fetchModels();
+        }, MODEL_POLL_MS);
+        return () => clearInterval(timer);
     }, [fetchModels]);
 
     useEffect(() => {
@@ -61,6 +61,7 @@ export const getShipmentDetails = (id) => api.get(`/shipments/${id}`);
 export const updateShipmentStatus = (id, status) => api.put(`/shipments/${id}/status`, { status });
 export const getDashboardStats = (params) => api.get('/shipments/stats', { params });
 export const getTimeSeriesStats = (params) => api.get('/shipments/stats/over-time', { params });
+export const getDashboard = (params) => api.get('/dashboard', { params });
 export const getManifestData = (params) => api.get('shipments/manifest', { params });
 export const deleteShipment = (id) => api.delete(`/shipments/${id}`);
 
@@ -70,6 +71,15 @@ export const addModel = (modelData) => api.post('/models', modelData);
 export const updateModel = (id, modelData) => api.put(`/models/${id}`, modelData);
 export const checkPartNumber = (partNumber) => api.get('/models/check_part_number', { params: { part_number: partNumber } });
 
+// Incremental refresh: pass the previous response's `next` token as `since`
+// (none for a full load) and the same comma-separated `tables` each time.
+export const getChanges = (since, tables) => {
+    const params = {};
+    if (since) params.since = since;
+    if (tables) params.tables = tables;
+    return api.get('/changes', { params });
+};
+
 // Shipped Units API calls
 export const addUnit = (unitData) => api.post('/units', unitData);
 export const updateUnit = (id, unitData) => api.put(`/units/${id}`, unitData);
@@ -100,3 +110,148 @@ export const getWeeklyFPYStats = ({ anchor_date, weeks } = {}) => {
 };
 
 export const getOverallFPYStats = () => api.get('/shipments/fpy/overall');
+
+export const getFPYSeries = (params) => api.get('/shipments/fpy/series', { params });
+
+// Live updates over Server-Sent Events. `onEvent(type, payload)` receives
+// 'shipment', 'unit', 'checklist' or 'resync'. Returns an unsubscribe function.
+//
+// Each open stream holds a server thread, so a browser opens only one: the
+// tab holding the EVENTS_LOCK web lock runs it and forwards every event to
+// the other tabs over a BroadcastChannel. When the server refuses the stream
+// (503 when the stream share is full, or a network error), it is retried
+// with backoff, and meanwhile 'resync' is sent every STREAM_FALLBACK_REFRESH_MS
+// so pages fall back to periodic refresh. Another 'resync' follows the
+// reconnect.
+const EVENT_TYPES = ['shipment', 'unit', 'checklist', 'resync'];
+const EVENTS_CHANNEL = 'quality-events';
+const EVENTS_LOCK = 'quality-events-stream';
+const STREAM_RETRY_MIN_MS = 1000;
+const STREAM_RETRY_MAX_MS = 60000;
+const STREAM_FALLBACK_REFRESH_MS = 30000;
+// Keeps the stream open while one page replaces another.
+const STREAM_IDLE_CLOSE_MS = 5000;
+
+const eventListeners = new Set();
+let stopEventHub = null;
+let idleTimer = null;
+
+const notifyListeners = (type, payload) => {
+    eventListeners.forEach((listener) => listener(type, payload));
+};
+
+// Opens the stream and keeps it open until the returned function is called.
+const runEventStream = (emit) => {
+    let source = null;
+    let retryTimer = null;
+    let fallbackTimer = null;
+    let retryDelay = STREAM_RETRY_MIN_MS;
+    let stopped = false;
+
+    const startFallback = () => {
+        if (!fallbackTimer) {
+            fallbackTimer = setInterval(() => emit('resync', {}), STREAM_FALLBACK_REFRESH_MS);
+        }
+    };
+
+    const connect = () => {
+        const token = localStorage.getItem('accessToken');
+        if (stopped || !token) {
+            return;
+        }
+        source = new EventSource(`${API_URL}/events/stream?token=${encodeURIComponent(token)}`);
+        source.onopen = () => {
+            retryDelay = STREAM_RETRY_MIN_MS;
+            if (fallbackTimer) {
+                clearInterval(fallbackTimer);
+                fallbackTimer = null;
+                emit('resync', {});
+            }
+        };
+        source.onerror = () => {
+            startFallback();
+            // The browser retries a dropped connection by itself, but gives up after a non-200 answer.
+            if (source.readyState !== EventSource.CLOSED) {
+                return;
+            }
+            source.close();
+            retryTimer = setTimeout(connect, retryDelay + Math.random() * STREAM_RETRY_MIN_MS);
+            retryDelay = Math.min(retryDelay * 2, STREAM_RETRY_MAX_MS);
+        };
+        EVENT_TYPES.forEach((type) => {
+            source.addEventListener(type, (event) => {
+                let payload = {};
+                try {
+                    payload = JSON.parse(event.data);
+                } catch (err) {
+                    console.error(err);
+                }
+                emit(type, payload);
+            });
+        });
+    };
+
+    connect();
+    return () => {
+        stopped = true;
+        clearTimeout(retryTimer);
+        clearInterval(fallbackTimer);
+        if (source) {
+            source.close();
+        }
+    };
+};
+
+const startEventHub = () => {
+    const locks = typeof navigator !== 'undefined' ? navigator.locks : undefined;
+    if (typeof BroadcastChannel === 'undefined' || !locks) {
+        // No way to share a stream between tabs: this tab keeps its own.
+        return runEventStream(notifyListeners);
+    }
+    const channel = new BroadcastChannel(EVENTS_CHANNEL);
+    channel.onmessage = (message) => notifyListeners(message.data.type, message.data.payload);
+    const waiting = new AbortController();
+    let release = null;
+    locks.request(EVENTS_LOCK, { signal: waiting.signal }, () => new Promise((resolve) => {
+        const stopStream = runEventStream((type, payload) => {
+            notifyListeners(type, payload);
+            channel.postMessage({ type, payload });
+        });
+        release = () => {
+            stopStream();
+            resolve();
+        };
+    })).catch(() => {
+        // Aborted while another tab held the stream.
+    });
+    return () => {
+        waiting.abort();
+        if (release) {
+            release();
+        }
+        channel.close();
+    };
+};
+
+export const subscribeToEvents = (onEvent) => {
+    if (typeof EventSource === 'undefined') {
+        return () => {};
+    }
+    eventListeners.add(onEvent);
+    clearTimeout(idleTimer);
+    if (!stopEventHub) {
+        stopEventHub = startEventHub();
+    }
+    return () => {
+        eventListeners.delete(onEvent);
+        if (eventListeners.size === 0) {
+            clearTimeout(idleTimer);
+            idleTimer = setTimeout(() => {
+                if (eventListeners.size === 0 && stopEventHub) {
+                    stopEventHub();
+                    stopEventHub = null;
+                }
+            }, STREAM_IDLE_CLOSE_MS);
+        }
+    };
+};
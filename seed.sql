@@ -1,687 +1,4 @@
-2025-09-18 08:39:20.025 [info] [main] Log level: Info
-2025-09-18 08:39:20.025 [info] [main] Validating found git in: "C:\Program Files\Git\cmd\git.exe"
-2025-09-18 08:39:20.025 [info] [main] Validating found git in: "C:\Program Files (x86)\Git\cmd\git.exe"
-2025-09-18 08:39:20.025 [info] [main] Validating found git in: "C:\Program Files\Git\cmd\git.exe"
-2025-09-18 08:39:20.025 [info] [main] Validating found git in: "C:\Users\tom.nguyen\AppData\Local\Programs\Git\cmd\git.exe"
-2025-09-18 08:39:20.077 [info] [main] Using git "2.51.0.windows.1" from "C:\Users\tom.nguyen\AppData\Local\Programs\Git\cmd\git.exe"
-2025-09-18 08:39:20.077 [info] [Model][doInitialScan] Initial repository scan started
-2025-09-18 08:39:21.550 [info] > git rev-parse --show-toplevel [1455ms]
-2025-09-18 08:39:21.744 [info] > git rev-parse --git-dir --git-common-dir --show-superproject-working-tree [105ms]
-2025-09-18 08:39:21.754 [info] [Model][openRepository] Opened repository (path): c:\Apps\quality-v2
-2025-09-18 08:39:21.754 [info] [Model][openRepository] Opened repository (real path): c:\Apps\quality-v2
-2025-09-18 08:39:21.754 [info] [Model][openRepository] Opened repository (kind): repository
-2025-09-18 08:39:21.864 [info] > git config --get commit.template [98ms]
-2025-09-18 08:39:21.867 [info] > git rev-parse --show-toplevel [91ms]
-2025-09-18 08:39:21.887 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [98ms]
-2025-09-18 08:39:21.896 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:39:21.967 [info] > git rev-parse --show-toplevel [83ms]
-2025-09-18 08:39:21.985 [info] > git rev-parse refs/remotes/origin/main [88ms]
-2025-09-18 08:39:22.103 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [94ms]
-2025-09-18 08:39:22.120 [info] > git rev-parse --git-dir --git-common-dir --show-superproject-working-tree [142ms]
-2025-09-18 08:39:22.125 [info] [Model][openRepository] Opened repository (path): c:\Apps\quality-v2\frontend
-2025-09-18 08:39:22.125 [info] [Model][openRepository] Opened repository (real path): c:\Apps\quality-v2\frontend
-2025-09-18 08:39:22.125 [info] [Model][openRepository] Opened repository (kind): submodule
-2025-09-18 08:39:22.130 [info] [Model][doInitialScan] Initial repository scan completed - repositories (2), closed repositories (0), parent repositories (0), unsafe repositories (0)
-2025-09-18 08:39:22.223 [info] > git show --textconv :seed.sql [83ms]
-2025-09-18 08:39:22.231 [info] > git ls-files --stage -- seed.sql [81ms]
-2025-09-18 08:39:22.253 [info] > git config --get commit.template [79ms]
-2025-09-18 08:39:22.274 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [79ms]
-2025-09-18 08:39:22.312 [info] > git cat-file -s 97a384968f6f7a2cc9985624011606e0a9181847 [72ms]
-2025-09-18 08:39:22.366 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [73ms]
-2025-09-18 08:39:22.377 [info] > git status -z -uall [93ms]
-2025-09-18 08:39:22.495 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [104ms]
-2025-09-18 08:39:22.513 [info] > git config --get commit.template [109ms]
-2025-09-18 08:39:22.513 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [100ms]
-2025-09-18 08:39:22.593 [info] > git config --get --local branch.master.vscode-merge-base [86ms]
-2025-09-18 08:39:22.625 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [86ms]
-2025-09-18 08:39:22.635 [info] > git status -z -uall [108ms]
-2025-09-18 08:39:22.661 [info] > git status -z -uall [665ms]
-2025-09-18 08:39:22.761 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/origin/master refs/remotes/origin/master [158ms]
-2025-09-18 08:39:23.186 [info] > git check-ignore -v -z --stdin [449ms]
-2025-09-18 08:39:23.196 [info] > git merge-base refs/heads/master refs/remotes/origin/master [410ms]
-2025-09-18 08:39:23.210 [info] > git merge-base refs/heads/master refs/remotes/origin/master [436ms]
-2025-09-18 08:39:23.221 [info] > git config --get commit.template [463ms]
-2025-09-18 08:39:23.221 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [495ms]
-2025-09-18 08:39:23.233 [info] > git check-ignore -v -z --stdin [485ms]
-2025-09-18 08:39:23.418 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [171ms]
-2025-09-18 08:39:23.418 [info] > git config --get --local branch.main.vscode-merge-base [187ms]
-2025-09-18 08:39:23.427 [info] > git diff --name-status -z --diff-filter=ADMR 2724df7f6a12dcbdeec54fe1cf5278be57027167...refs/remotes/origin/master [206ms]
-2025-09-18 08:39:23.428 [info] > git diff --name-status -z --diff-filter=ADMR 2724df7f6a12dcbdeec54fe1cf5278be57027167...refs/remotes/origin/master [218ms]
-2025-09-18 08:39:23.438 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:39:23.504 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/origin/main refs/remotes/origin/main [77ms]
-2025-09-18 08:39:23.517 [info] > git rev-parse refs/remotes/origin/main [79ms]
-2025-09-18 08:39:23.594 [info] > git merge-base refs/heads/main refs/remotes/origin/main [78ms]
-2025-09-18 08:39:23.614 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-18 08:39:23.673 [info] > git diff --name-status -z --diff-filter=ADMR 918660eab75f1c862ce447ae892940ec6edb484a...refs/remotes/origin/main [69ms]
-2025-09-18 08:39:24.101 [info] > git status -z -uall [573ms]
-2025-09-18 08:42:14.554 [info] > git config --get commit.template [91ms]
-2025-09-18 08:42:14.561 [info] > git config --get commit.template [86ms]
-2025-09-18 08:42:14.574 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [84ms]
-2025-09-18 08:42:14.583 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:42:14.585 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [83ms]
-2025-09-18 08:42:14.653 [info] > git rev-parse refs/remotes/origin/main [70ms]
-2025-09-18 08:42:14.678 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [73ms]
-2025-09-18 08:42:14.688 [info] > git status -z -uall [93ms]
-2025-09-18 08:42:14.746 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [74ms]
-2025-09-18 08:42:15.198 [info] > git status -z -uall [535ms]
-2025-09-18 08:43:03.049 [info] > git config --get commit.template [88ms]
-2025-09-18 08:43:03.050 [info] > git config --get commit.template [81ms]
-2025-09-18 08:43:03.061 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [82ms]
-2025-09-18 08:43:03.069 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:43:03.085 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [95ms]
-2025-09-18 08:43:03.141 [info] > git rev-parse refs/remotes/origin/main [72ms]
-2025-09-18 08:43:03.182 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [78ms]
-2025-09-18 08:43:03.200 [info] > git status -z -uall [106ms]
-2025-09-18 08:43:03.246 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [86ms]
-2025-09-18 08:43:03.731 [info] > git status -z -uall [580ms]
-2025-09-18 08:43:58.728 [info] > git config --get commit.template [76ms]
-2025-09-18 08:43:58.742 [info] > git config --get commit.template [80ms]
-2025-09-18 08:43:58.757 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [85ms]
-2025-09-18 08:43:58.776 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [94ms]
-2025-09-18 08:43:58.785 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:43:58.845 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-18 08:43:58.853 [info] > git rev-parse refs/remotes/origin/main [68ms]
-2025-09-18 08:43:58.870 [info] > git status -z -uall [104ms]
-2025-09-18 08:43:58.940 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-18 08:43:59.400 [info] > git status -z -uall [539ms]
-2025-09-18 08:44:04.009 [info] > git config --get commit.template [92ms]
-2025-09-18 08:44:04.027 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [89ms]
-2025-09-18 08:44:04.110 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [66ms]
-2025-09-18 08:44:04.120 [info] > git status -z -uall [84ms]
-2025-09-18 08:44:04.565 [info] > git config --get commit.template [86ms]
-2025-09-18 08:44:04.578 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [78ms]
-2025-09-18 08:44:04.586 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:44:04.650 [info] > git rev-parse refs/remotes/origin/main [63ms]
-2025-09-18 08:44:04.734 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [67ms]
-2025-09-18 08:44:05.187 [info] > git status -z -uall [529ms]
-2025-09-18 08:45:33.647 [info] > git config --get commit.template [81ms]
-2025-09-18 08:45:33.657 [info] > git config --get commit.template [80ms]
-2025-09-18 08:45:33.670 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [84ms]
-2025-09-18 08:45:33.679 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:45:33.680 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [84ms]
-2025-09-18 08:45:33.751 [info] > git rev-parse refs/remotes/origin/main [72ms]
-2025-09-18 08:45:33.773 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [75ms]
-2025-09-18 08:45:33.781 [info] > git status -z -uall [92ms]
-2025-09-18 08:45:33.840 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-18 08:45:34.285 [info] > git status -z -uall [525ms]
-2025-09-18 08:45:39.456 [info] > git config --get commit.template [85ms]
-2025-09-18 08:45:39.467 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [77ms]
-2025-09-18 08:45:39.475 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:45:39.541 [info] > git rev-parse refs/remotes/origin/main [66ms]
-2025-09-18 08:45:39.624 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [67ms]
-2025-09-18 08:45:40.075 [info] > git status -z -uall [525ms]
-2025-09-18 08:46:01.117 [info] > git config --get commit.template [71ms]
-2025-09-18 08:46:01.129 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [73ms]
-2025-09-18 08:46:01.139 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:46:01.202 [info] > git rev-parse refs/remotes/origin/main [64ms]
-2025-09-18 08:46:01.289 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-18 08:46:01.732 [info] > git status -z -uall [522ms]
-2025-09-18 08:46:06.994 [info] > git config --get commit.template [81ms]
-2025-09-18 08:46:07.007 [info] > git config --get commit.template [84ms]
-2025-09-18 08:46:07.018 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [84ms]
-2025-09-18 08:46:07.027 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:46:07.030 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [86ms]
-2025-09-18 08:46:07.101 [info] > git rev-parse refs/remotes/origin/main [74ms]
-2025-09-18 08:46:07.124 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-18 08:46:07.138 [info] > git status -z -uall [99ms]
-2025-09-18 08:46:07.194 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [75ms]
-2025-09-18 08:46:07.660 [info] > git status -z -uall [551ms]
-2025-09-18 08:46:12.242 [info] > git config --get commit.template [86ms]
-2025-09-18 08:46:12.258 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [91ms]
-2025-09-18 08:46:12.354 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-18 08:46:12.361 [info] > git status -z -uall [94ms]
-2025-09-18 08:46:12.799 [info] > git config --get commit.template [80ms]
-2025-09-18 08:46:12.809 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [80ms]
-2025-09-18 08:46:12.818 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:46:12.890 [info] > git rev-parse refs/remotes/origin/main [71ms]
-2025-09-18 08:46:12.986 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-18 08:46:13.449 [info] > git status -z -uall [550ms]
-2025-09-18 08:47:37.503 [info] > git config --get commit.template [79ms]
-2025-09-18 08:47:37.511 [info] > git config --get commit.template [78ms]
-2025-09-18 08:47:37.528 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [85ms]
-2025-09-18 08:47:37.536 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:47:37.538 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [85ms]
-2025-09-18 08:47:37.609 [info] > git rev-parse refs/remotes/origin/main [73ms]
-2025-09-18 08:47:37.638 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [80ms]
-2025-09-18 08:47:37.649 [info] > git status -z -uall [103ms]
-2025-09-18 08:47:37.705 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [78ms]
-2025-09-18 08:47:38.173 [info] > git status -z -uall [555ms]
-2025-09-18 08:47:42.754 [info] > git config --get commit.template [77ms]
-2025-09-18 08:47:42.768 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [80ms]
-2025-09-18 08:47:42.870 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [80ms]
-2025-09-18 08:47:42.879 [info] > git status -z -uall [100ms]
-2025-09-18 08:47:43.318 [info] > git config --get commit.template [82ms]
-2025-09-18 08:47:43.333 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [86ms]
-2025-09-18 08:47:43.342 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:47:43.410 [info] > git rev-parse refs/remotes/origin/main [69ms]
-2025-09-18 08:47:43.501 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-18 08:47:43.966 [info] > git status -z -uall [547ms]
-2025-09-18 08:48:08.179 [info] > git config --get commit.template [82ms]
-2025-09-18 08:48:08.186 [info] > git config --get commit.template [80ms]
-2025-09-18 08:48:08.201 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [85ms]
-2025-09-18 08:48:08.210 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:48:08.211 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [83ms]
-2025-09-18 08:48:08.284 [info] > git rev-parse refs/remotes/origin/main [73ms]
-2025-09-18 08:48:08.302 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [73ms]
-2025-09-18 08:48:08.311 [info] > git status -z -uall [92ms]
-2025-09-18 08:48:08.371 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [69ms]
-2025-09-18 08:48:08.826 [info] > git status -z -uall [534ms]
-2025-09-18 08:48:31.738 [info] > git config --get commit.template [90ms]
-2025-09-18 08:48:31.747 [info] > git config --get commit.template [88ms]
-2025-09-18 08:48:31.760 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [90ms]
-2025-09-18 08:48:31.771 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:48:31.772 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [90ms]
-2025-09-18 08:48:31.850 [info] > git rev-parse refs/remotes/origin/main [79ms]
-2025-09-18 08:48:31.875 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [82ms]
-2025-09-18 08:48:31.891 [info] > git status -z -uall [109ms]
-2025-09-18 08:48:31.950 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [79ms]
-2025-09-18 08:48:32.436 [info] > git status -z -uall [576ms]
-2025-09-18 08:48:36.998 [info] > git config --get commit.template [79ms]
-2025-09-18 08:48:37.016 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [87ms]
-2025-09-18 08:48:37.117 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [80ms]
-2025-09-18 08:48:37.129 [info] > git status -z -uall [104ms]
-2025-09-18 08:48:37.594 [info] > git config --get commit.template [80ms]
-2025-09-18 08:48:37.607 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [83ms]
-2025-09-18 08:48:37.616 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:48:37.689 [info] > git rev-parse refs/remotes/origin/main [73ms]
-2025-09-18 08:48:37.786 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [77ms]
-2025-09-18 08:48:38.284 [info] > git status -z -uall [585ms]
-2025-09-18 08:48:42.228 [info] > git config --get commit.template [71ms]
-2025-09-18 08:48:42.242 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [76ms]
-2025-09-18 08:48:42.328 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [69ms]
-2025-09-18 08:48:42.338 [info] > git status -z -uall [87ms]
-2025-09-18 08:48:43.466 [info] > git config --get commit.template [86ms]
-2025-09-18 08:48:43.478 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [78ms]
-2025-09-18 08:48:43.487 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:48:43.551 [info] > git rev-parse refs/remotes/origin/main [65ms]
-2025-09-18 08:48:43.636 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [68ms]
-2025-09-18 08:48:44.086 [info] > git status -z -uall [526ms]
-2025-09-18 08:50:59.037 [info] > git config --get commit.template [86ms]
-2025-09-18 08:50:59.050 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [84ms]
-2025-09-18 08:50:59.060 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-18 08:50:59.130 [info] > git rev-parse refs/remotes/origin/main [70ms]
-2025-09-18 08:50:59.221 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-18 08:50:59.682 [info] > git status -z -uall [542ms]
-2025-09-19 16:49:15.426 [info] > git config --get commit.template [92ms]
-2025-09-19 16:49:15.440 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [94ms]
-2025-09-19 16:49:15.449 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 16:49:15.520 [info] > git rev-parse refs/remotes/origin/main [71ms]
-2025-09-19 16:49:15.614 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [75ms]
-2025-09-19 16:49:16.173 [info] > git status -z -uall [644ms]
-2025-09-19 16:49:21.376 [info] > git config --get commit.template [88ms]
-2025-09-19 16:49:21.384 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [75ms]
-2025-09-19 16:49:21.392 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 16:49:21.458 [info] > git rev-parse refs/remotes/origin/main [65ms]
-2025-09-19 16:49:21.544 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [69ms]
-2025-09-19 16:49:22.002 [info] > git status -z -uall [535ms]
-2025-09-19 16:50:39.096 [info] > git config --get commit.template [99ms]
-2025-09-19 16:50:39.104 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [94ms]
-2025-09-19 16:50:39.113 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 16:50:39.187 [info] > git rev-parse refs/remotes/origin/main [75ms]
-2025-09-19 16:50:39.278 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-19 16:50:39.753 [info] > git status -z -uall [557ms]
-2025-09-19 16:53:46.237 [info] > git config --get commit.template [82ms]
-2025-09-19 16:53:46.246 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [77ms]
-2025-09-19 16:53:46.255 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 16:53:46.322 [info] > git rev-parse refs/remotes/origin/main [67ms]
-2025-09-19 16:53:46.410 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [71ms]
-2025-09-19 16:53:46.868 [info] > git status -z -uall [538ms]
-2025-09-19 17:00:03.848 [info] > git config --get commit.template [75ms]
-2025-09-19 17:00:03.860 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [74ms]
-2025-09-19 17:00:03.868 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:00:03.932 [info] > git rev-parse refs/remotes/origin/main [64ms]
-2025-09-19 17:00:04.020 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [71ms]
-2025-09-19 17:00:04.472 [info] > git status -z -uall [532ms]
-2025-09-19 17:00:09.624 [info] > git config --get commit.template [75ms]
-2025-09-19 17:00:09.632 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [73ms]
-2025-09-19 17:00:09.640 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:00:09.703 [info] > git rev-parse refs/remotes/origin/main [63ms]
-2025-09-19 17:00:09.791 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-19 17:00:10.258 [info] > git status -z -uall [547ms]
-2025-09-19 17:03:23.515 [info] > git log --format=%H%n%aN%n%aE%n%at%n%ct%n%P%n%D%n%B -z --shortstat --diff-merges=first-parent -n50 --skip=0 --topo-order --decorate=full --stdin [469ms]
-2025-09-19 17:03:23.986 [info] > git check-ignore -v -z --stdin [101ms]
-2025-09-19 17:03:23.994 [info] > git check-ignore -v -z --stdin [85ms]
-2025-09-19 17:03:36.031 [info] > git config --get commit.template [86ms]
-2025-09-19 17:03:36.047 [info] > git config --get commit.template [92ms]
-2025-09-19 17:03:36.061 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [93ms]
-2025-09-19 17:03:36.080 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [103ms]
-2025-09-19 17:03:36.090 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:03:36.162 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [82ms]
-2025-09-19 17:03:36.171 [info] > git rev-parse refs/remotes/origin/main [81ms]
-2025-09-19 17:03:36.190 [info] > git status -z -uall [120ms]
-2025-09-19 17:03:36.264 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [74ms]
-2025-09-19 17:03:36.730 [info] > git status -z -uall [550ms]
-2025-09-19 17:04:10.486 [info] > git config --get commit.template [109ms]
-2025-09-19 17:04:10.490 [info] > git config --get commit.template [101ms]
-2025-09-19 17:04:10.506 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [105ms]
-2025-09-19 17:04:10.515 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:04:10.518 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [105ms]
-2025-09-19 17:04:10.593 [info] > git rev-parse refs/remotes/origin/main [78ms]
-2025-09-19 17:04:10.614 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-19 17:04:10.627 [info] > git status -z -uall [100ms]
-2025-09-19 17:04:10.689 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [78ms]
-2025-09-19 17:04:11.184 [info] > git status -z -uall [581ms]
-2025-09-19 17:04:38.269 [info] > git config --get commit.template [86ms]
-2025-09-19 17:04:38.274 [info] > git config --get commit.template [79ms]
-2025-09-19 17:04:38.289 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [83ms]
-2025-09-19 17:04:38.308 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [92ms]
-2025-09-19 17:04:38.318 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:04:38.379 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-19 17:04:38.387 [info] > git rev-parse refs/remotes/origin/main [70ms]
-2025-09-19 17:04:38.405 [info] > git status -z -uall [107ms]
-2025-09-19 17:04:38.473 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [69ms]
-2025-09-19 17:04:38.924 [info] > git status -z -uall [529ms]
-2025-09-19 17:04:43.550 [info] > git config --get commit.template [90ms]
-2025-09-19 17:04:43.565 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [83ms]
-2025-09-19 17:04:43.650 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [68ms]
-2025-09-19 17:04:43.659 [info] > git status -z -uall [85ms]
-2025-09-19 17:04:44.095 [info] > git config --get commit.template [86ms]
-2025-09-19 17:04:44.108 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [81ms]
-2025-09-19 17:04:44.116 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:04:44.180 [info] > git rev-parse refs/remotes/origin/main [63ms]
-2025-09-19 17:04:44.263 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [66ms]
-2025-09-19 17:04:44.702 [info] > git status -z -uall [514ms]
-2025-09-19 17:05:43.159 [info] > git config --get commit.template [74ms]
-2025-09-19 17:05:43.167 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [73ms]
-2025-09-19 17:05:43.176 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:05:43.240 [info] > git rev-parse refs/remotes/origin/main [64ms]
-2025-09-19 17:05:43.330 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-19 17:05:43.803 [info] > git status -z -uall [554ms]
-2025-09-19 17:06:21.328 [info] > git config --get commit.template [83ms]
-2025-09-19 17:06:21.335 [info] > git config --get commit.template [80ms]
-2025-09-19 17:06:21.350 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [83ms]
-2025-09-19 17:06:21.359 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:06:21.362 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [84ms]
-2025-09-19 17:06:21.430 [info] > git rev-parse refs/remotes/origin/main [72ms]
-2025-09-19 17:06:21.456 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [75ms]
-2025-09-19 17:06:21.465 [info] > git status -z -uall [93ms]
-2025-09-19 17:06:21.523 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [73ms]
-2025-09-19 17:06:21.986 [info] > git status -z -uall [545ms]
-2025-09-19 17:06:27.003 [info] > git config --get commit.template [75ms]
-2025-09-19 17:06:27.019 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [80ms]
-2025-09-19 17:06:27.118 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [82ms]
-2025-09-19 17:06:27.130 [info] > git status -z -uall [103ms]
-2025-09-19 17:06:27.136 [info] > git config --get commit.template [89ms]
-2025-09-19 17:06:27.143 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [86ms]
-2025-09-19 17:06:27.152 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:06:27.219 [info] > git rev-parse refs/remotes/origin/main [67ms]
-2025-09-19 17:06:27.311 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-19 17:06:27.777 [info] > git status -z -uall [549ms]
-2025-09-19 17:08:10.638 [info] > git config --get commit.template [86ms]
-2025-09-19 17:08:10.646 [info] > git config --get commit.template [84ms]
-2025-09-19 17:08:10.658 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [83ms]
-2025-09-19 17:08:10.667 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:08:10.670 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [85ms]
-2025-09-19 17:08:10.741 [info] > git rev-parse refs/remotes/origin/main [74ms]
-2025-09-19 17:08:10.766 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-19 17:08:10.775 [info] > git status -z -uall [95ms]
-2025-09-19 17:08:10.831 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-19 17:08:11.305 [info] > git status -z -uall [556ms]
-2025-09-19 17:08:26.543 [info] > git config --get commit.template [82ms]
-2025-09-19 17:08:26.553 [info] > git config --get commit.template [82ms]
-2025-09-19 17:08:26.566 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [85ms]
-2025-09-19 17:08:26.575 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:08:26.576 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [84ms]
-2025-09-19 17:08:26.657 [info] > git rev-parse refs/remotes/origin/main [82ms]
-2025-09-19 17:08:26.684 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [90ms]
-2025-09-19 17:08:26.692 [info] > git status -z -uall [107ms]
-2025-09-19 17:08:26.758 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [82ms]
-2025-09-19 17:08:27.249 [info] > git status -z -uall [582ms]
-2025-09-19 17:08:47.687 [info] > git config --get commit.template [84ms]
-2025-09-19 17:08:47.691 [info] > git config --get commit.template [77ms]
-2025-09-19 17:08:47.708 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [82ms]
-2025-09-19 17:08:47.726 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [91ms]
-2025-09-19 17:08:47.735 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:08:47.797 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-19 17:08:47.807 [info] > git rev-parse refs/remotes/origin/main [72ms]
-2025-09-19 17:08:47.828 [info] > git status -z -uall [112ms]
-2025-09-19 17:08:47.896 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [68ms]
-2025-09-19 17:08:48.347 [info] > git status -z -uall [531ms]
-2025-09-19 17:08:53.536 [info] > git config --get commit.template [101ms]
-2025-09-19 17:08:53.549 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [87ms]
-2025-09-19 17:08:53.558 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:08:53.620 [info] > git rev-parse refs/remotes/origin/main [62ms]
-2025-09-19 17:08:53.704 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [67ms]
-2025-09-19 17:08:54.145 [info] > git status -z -uall [518ms]
-2025-09-19 17:09:10.010 [info] > git config --get commit.template [84ms]
-2025-09-19 17:09:10.023 [info] > git config --get commit.template [88ms]
-2025-09-19 17:09:10.035 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [89ms]
-2025-09-19 17:09:10.053 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [97ms]
-2025-09-19 17:09:10.063 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:09:10.125 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-19 17:09:10.133 [info] > git rev-parse refs/remotes/origin/main [70ms]
-2025-09-19 17:09:10.152 [info] > git status -z -uall [108ms]
-2025-09-19 17:09:10.228 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [77ms]
-2025-09-19 17:09:10.722 [info] > git status -z -uall [580ms]
-2025-09-19 17:09:15.257 [info] > git config --get commit.template [84ms]
-2025-09-19 17:09:15.271 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [87ms]
-2025-09-19 17:09:15.367 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [77ms]
-2025-09-19 17:09:15.378 [info] > git status -z -uall [97ms]
-2025-09-19 17:09:15.852 [info] > git config --get commit.template [78ms]
-2025-09-19 17:09:15.864 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [79ms]
-2025-09-19 17:09:15.874 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:09:15.946 [info] > git rev-parse refs/remotes/origin/main [72ms]
-2025-09-19 17:09:16.043 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [79ms]
-2025-09-19 17:09:16.516 [info] > git status -z -uall [561ms]
-2025-09-19 17:09:37.911 [info] > git config --get commit.template [86ms]
-2025-09-19 17:09:37.924 [info] > git config --get commit.template [88ms]
-2025-09-19 17:09:37.936 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [88ms]
-2025-09-19 17:09:37.945 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:09:37.946 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [88ms]
-2025-09-19 17:09:38.018 [info] > git rev-parse refs/remotes/origin/main [74ms]
-2025-09-19 17:09:38.041 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [75ms]
-2025-09-19 17:09:38.051 [info] > git status -z -uall [96ms]
-2025-09-19 17:09:38.110 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [73ms]
-2025-09-19 17:09:38.565 [info] > git status -z -uall [538ms]
-2025-09-19 17:09:49.453 [info] > git config --get commit.template [91ms]
-2025-09-19 17:09:49.463 [info] > git config --get commit.template [90ms]
-2025-09-19 17:09:49.473 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [89ms]
-2025-09-19 17:09:49.482 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:09:49.486 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [91ms]
-2025-09-19 17:09:49.561 [info] > git rev-parse refs/remotes/origin/main [78ms]
-2025-09-19 17:09:49.588 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [83ms]
-2025-09-19 17:09:49.595 [info] > git status -z -uall [101ms]
-2025-09-19 17:09:49.654 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [74ms]
-2025-09-19 17:09:50.130 [info] > git status -z -uall [559ms]
-2025-09-19 17:09:54.689 [info] > git config --get commit.template [79ms]
-2025-09-19 17:09:54.706 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [84ms]
-2025-09-19 17:09:54.804 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-19 17:09:54.812 [info] > git status -z -uall [94ms]
-2025-09-19 17:09:55.273 [info] > git config --get commit.template [80ms]
-2025-09-19 17:09:55.290 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [87ms]
-2025-09-19 17:09:55.300 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:09:55.375 [info] > git rev-parse refs/remotes/origin/main [76ms]
-2025-09-19 17:09:55.479 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [86ms]
-2025-09-19 17:09:55.991 [info] > git status -z -uall [607ms]
-2025-09-19 17:10:00.183 [info] > git config --get commit.template [83ms]
-2025-09-19 17:10:00.197 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [79ms]
-2025-09-19 17:10:00.285 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-19 17:10:00.293 [info] > git status -z -uall [87ms]
-2025-09-19 17:10:01.201 [info] > git config --get commit.template [82ms]
-2025-09-19 17:10:01.214 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [81ms]
-2025-09-19 17:10:01.223 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-19 17:10:01.288 [info] > git rev-parse refs/remotes/origin/main [65ms]
-2025-09-19 17:10:01.373 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [68ms]
-2025-09-19 17:10:01.820 [info] > git status -z -uall [524ms]
-2025-09-22 08:37:59.893 [info] > git config --get commit.template [80ms]
-2025-09-22 08:37:59.901 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [75ms]
-2025-09-22 08:37:59.910 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 08:37:59.975 [info] > git rev-parse refs/remotes/origin/main [66ms]
-2025-09-22 08:38:00.067 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [74ms]
-2025-09-22 08:38:00.544 [info] > git status -z -uall [560ms]
-2025-09-22 08:40:29.931 [info] > git config --get commit.template [80ms]
-2025-09-22 08:40:29.939 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [77ms]
-2025-09-22 08:40:29.948 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 08:40:30.016 [info] > git rev-parse refs/remotes/origin/main [69ms]
-2025-09-22 08:40:30.107 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [73ms]
-2025-09-22 08:40:30.565 [info] > git status -z -uall [540ms]
-2025-09-22 09:39:44.559 [info] > git config --get commit.template [80ms]
-2025-09-22 09:39:44.570 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [77ms]
-2025-09-22 09:39:44.578 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 09:39:44.649 [info] > git rev-parse refs/remotes/origin/main [71ms]
-2025-09-22 09:39:44.741 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [71ms]
-2025-09-22 09:39:45.229 [info] > git status -z -uall [570ms]
-2025-09-22 10:08:12.575 [info] > git config --get commit.template [85ms]
-2025-09-22 10:08:12.586 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [82ms]
-2025-09-22 10:08:12.595 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:08:12.665 [info] > git rev-parse refs/remotes/origin/main [70ms]
-2025-09-22 10:08:12.758 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [74ms]
-2025-09-22 10:08:13.240 [info] > git status -z -uall [566ms]
-2025-09-22 10:17:17.062 [info] > git config --get commit.template [99ms]
-2025-09-22 10:17:17.072 [info] > git config --get commit.template [98ms]
-2025-09-22 10:17:17.081 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [93ms]
-2025-09-22 10:17:17.091 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:17:17.096 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [95ms]
-2025-09-22 10:17:17.170 [info] > git rev-parse refs/remotes/origin/main [79ms]
-2025-09-22 10:17:17.194 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [78ms]
-2025-09-22 10:17:17.204 [info] > git status -z -uall [98ms]
-2025-09-22 10:17:17.260 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [71ms]
-2025-09-22 10:17:17.726 [info] > git status -z -uall [546ms]
-2025-09-22 10:17:22.342 [info] > git config --get commit.template [90ms]
-2025-09-22 10:17:22.354 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [80ms]
-2025-09-22 10:17:22.440 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [69ms]
-2025-09-22 10:17:22.449 [info] > git status -z -uall [87ms]
-2025-09-22 10:17:22.888 [info] > git config --get commit.template [78ms]
-2025-09-22 10:17:22.901 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [73ms]
-2025-09-22 10:17:22.909 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:17:22.973 [info] > git rev-parse refs/remotes/origin/main [63ms]
-2025-09-22 10:17:23.057 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [68ms]
-2025-09-22 10:17:23.503 [info] > git status -z -uall [523ms]
-2025-09-22 10:18:23.134 [info] > git config --get commit.template [75ms]
-2025-09-22 10:18:23.147 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [71ms]
-2025-09-22 10:18:23.155 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:18:23.221 [info] > git rev-parse refs/remotes/origin/main [65ms]
-2025-09-22 10:18:23.308 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-22 10:18:23.751 [info] > git status -z -uall [523ms]
-2025-09-22 10:23:43.326 [info] > git config --get commit.template [119ms]
-2025-09-22 10:23:43.333 [info] > git config --get commit.template [115ms]
-2025-09-22 10:23:43.354 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [122ms]
-2025-09-22 10:23:43.371 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:23:43.372 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [128ms]
-2025-09-22 10:23:43.465 [info] > git rev-parse refs/remotes/origin/main [94ms]
-2025-09-22 10:23:43.484 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [86ms]
-2025-09-22 10:23:43.496 [info] > git status -z -uall [110ms]
-2025-09-22 10:23:43.558 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [75ms]
-2025-09-22 10:23:44.050 [info] > git status -z -uall [577ms]
-2025-09-22 10:23:48.597 [info] > git config --get commit.template [77ms]
-2025-09-22 10:23:48.614 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [82ms]
-2025-09-22 10:23:48.706 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [73ms]
-2025-09-22 10:23:48.714 [info] > git status -z -uall [91ms]
-2025-09-22 10:23:49.205 [info] > git config --get commit.template [75ms]
-2025-09-22 10:23:49.217 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [74ms]
-2025-09-22 10:23:49.225 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:23:49.292 [info] > git rev-parse refs/remotes/origin/main [67ms]
-2025-09-22 10:23:49.379 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [68ms]
-2025-09-22 10:23:49.868 [info] > git status -z -uall [567ms]
-2025-09-22 10:25:00.948 [info] > git config --get commit.template [86ms]
-2025-09-22 10:25:00.952 [info] > git config --get commit.template [80ms]
-2025-09-22 10:25:00.966 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [83ms]
-2025-09-22 10:25:00.976 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:25:00.983 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [89ms]
-2025-09-22 10:25:01.054 [info] > git rev-parse refs/remotes/origin/main [78ms]
-2025-09-22 10:25:01.080 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [78ms]
-2025-09-22 10:25:01.088 [info] > git status -z -uall [95ms]
-2025-09-22 10:25:01.145 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-22 10:25:01.626 [info] > git status -z -uall [563ms]
-2025-09-22 10:25:06.200 [info] > git config --get commit.template [87ms]
-2025-09-22 10:25:06.213 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [88ms]
-2025-09-22 10:25:06.311 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [77ms]
-2025-09-22 10:25:06.319 [info] > git status -z -uall [97ms]
-2025-09-22 10:25:06.774 [info] > git config --get commit.template [83ms]
-2025-09-22 10:25:06.777 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [76ms]
-2025-09-22 10:25:06.786 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:25:06.859 [info] > git rev-parse refs/remotes/origin/main [73ms]
-2025-09-22 10:25:06.965 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [84ms]
-2025-09-22 10:25:07.465 [info] > git status -z -uall [596ms]
-2025-09-22 10:26:47.805 [info] > git config --get commit.template [95ms]
-2025-09-22 10:26:47.811 [info] > git config --get commit.template [89ms]
-2025-09-22 10:26:47.820 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [87ms]
-2025-09-22 10:26:47.829 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:26:47.832 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [87ms]
-2025-09-22 10:26:47.927 [info] > git rev-parse refs/remotes/origin/main [99ms]
-2025-09-22 10:26:47.954 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [99ms]
-2025-09-22 10:26:47.960 [info] > git status -z -uall [118ms]
-2025-09-22 10:26:48.026 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [78ms]
-2025-09-22 10:26:48.520 [info] > git status -z -uall [582ms]
-2025-09-22 10:56:16.191 [info] > git config --get commit.template [112ms]
-2025-09-22 10:56:16.195 [info] > git config --get commit.template [100ms]
-2025-09-22 10:56:16.213 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [100ms]
-2025-09-22 10:56:16.233 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [108ms]
-2025-09-22 10:56:16.245 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:56:16.316 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [83ms]
-2025-09-22 10:56:16.318 [info] > git rev-parse refs/remotes/origin/main [74ms]
-2025-09-22 10:56:16.337 [info] > git status -z -uall [114ms]
-2025-09-22 10:56:16.410 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [74ms]
-2025-09-22 10:56:16.886 [info] > git status -z -uall [559ms]
-2025-09-22 10:56:21.513 [info] > git config --get commit.template [81ms]
-2025-09-22 10:56:21.523 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [82ms]
-2025-09-22 10:56:21.619 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-22 10:56:21.627 [info] > git status -z -uall [94ms]
-2025-09-22 10:56:22.042 [info] > git config --get commit.template [81ms]
-2025-09-22 10:56:22.056 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [83ms]
-2025-09-22 10:56:22.065 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:56:22.135 [info] > git rev-parse refs/remotes/origin/main [70ms]
-2025-09-22 10:56:22.228 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-22 10:56:22.745 [info] > git status -z -uall [602ms]
-2025-09-22 10:56:26.737 [info] > git config --get commit.template [86ms]
-2025-09-22 10:56:26.747 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [86ms]
-2025-09-22 10:56:26.843 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [75ms]
-2025-09-22 10:56:26.851 [info] > git status -z -uall [94ms]
-2025-09-22 10:56:27.899 [info] > git config --get commit.template [81ms]
-2025-09-22 10:56:27.915 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [86ms]
-2025-09-22 10:56:27.924 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:56:27.995 [info] > git rev-parse refs/remotes/origin/main [71ms]
-2025-09-22 10:56:28.094 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [80ms]
-2025-09-22 10:56:28.566 [info] > git status -z -uall [561ms]
-2025-09-22 10:58:20.232 [info] > git config --get commit.template [93ms]
-2025-09-22 10:58:20.245 [info] > git config --get commit.template [92ms]
-2025-09-22 10:58:20.262 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [96ms]
-2025-09-22 10:58:20.272 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:58:20.272 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [95ms]
-2025-09-22 10:58:20.347 [info] > git rev-parse refs/remotes/origin/main [76ms]
-2025-09-22 10:58:20.369 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-22 10:58:20.381 [info] > git status -z -uall [99ms]
-2025-09-22 10:58:20.437 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [71ms]
-2025-09-22 10:58:20.960 [info] > git status -z -uall [603ms]
-2025-09-22 10:58:34.292 [info] > git config --get commit.template [93ms]
-2025-09-22 10:58:34.302 [info] > git config --get commit.template [93ms]
-2025-09-22 10:58:34.319 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [99ms]
-2025-09-22 10:58:34.328 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:58:34.328 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [97ms]
-2025-09-22 10:58:34.407 [info] > git rev-parse refs/remotes/origin/main [80ms]
-2025-09-22 10:58:34.430 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [81ms]
-2025-09-22 10:58:34.437 [info] > git status -z -uall [99ms]
-2025-09-22 10:58:34.506 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [80ms]
-2025-09-22 10:58:35.024 [info] > git status -z -uall [608ms]
-2025-09-22 10:58:39.533 [info] > git config --get commit.template [77ms]
-2025-09-22 10:58:39.547 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [80ms]
-2025-09-22 10:58:39.642 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [77ms]
-2025-09-22 10:58:39.651 [info] > git status -z -uall [95ms]
-2025-09-22 10:58:40.164 [info] > git config --get commit.template [84ms]
-2025-09-22 10:58:40.179 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [87ms]
-2025-09-22 10:58:40.189 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:58:40.258 [info] > git rev-parse refs/remotes/origin/main [69ms]
-2025-09-22 10:58:40.360 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [81ms]
-2025-09-22 10:58:40.833 [info] > git status -z -uall [565ms]
-2025-09-22 10:58:44.856 [info] > git config --get commit.template [80ms]
-2025-09-22 10:58:44.868 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [80ms]
-2025-09-22 10:58:44.957 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-22 10:58:44.964 [info] > git status -z -uall [88ms]
-2025-09-22 10:58:45.973 [info] > git config --get commit.template [72ms]
-2025-09-22 10:58:45.985 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [73ms]
-2025-09-22 10:58:45.994 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 10:58:46.060 [info] > git rev-parse refs/remotes/origin/main [65ms]
-2025-09-22 10:58:46.145 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [68ms]
-2025-09-22 10:58:46.592 [info] > git status -z -uall [524ms]
-2025-09-22 11:01:38.309 [info] > git config --get commit.template [74ms]
-2025-09-22 11:01:38.322 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [75ms]
-2025-09-22 11:01:38.331 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 11:01:38.395 [info] > git rev-parse refs/remotes/origin/main [64ms]
-2025-09-22 11:01:38.483 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-22 11:01:38.952 [info] > git status -z -uall [549ms]
-2025-09-22 11:01:44.142 [info] > git config --get commit.template [87ms]
-2025-09-22 11:01:44.157 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [77ms]
-2025-09-22 11:01:44.165 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 11:01:44.229 [info] > git rev-parse refs/remotes/origin/main [63ms]
-2025-09-22 11:01:44.314 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [67ms]
-2025-09-22 11:01:44.772 [info] > git status -z -uall [534ms]
-2025-09-22 11:02:52.712 [info] > git config --get commit.template [84ms]
-2025-09-22 11:02:52.723 [info] > git config --get commit.template [84ms]
-2025-09-22 11:02:52.736 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [87ms]
-2025-09-22 11:02:52.745 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 11:02:52.747 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [86ms]
-2025-09-22 11:02:52.817 [info] > git rev-parse refs/remotes/origin/main [72ms]
-2025-09-22 11:02:52.843 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [78ms]
-2025-09-22 11:02:52.852 [info] > git status -z -uall [95ms]
-2025-09-22 11:02:52.913 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [76ms]
-2025-09-22 11:02:53.388 [info] > git status -z -uall [562ms]
-2025-09-22 11:18:25.516 [info] > git config --get commit.template [86ms]
-2025-09-22 11:18:25.526 [info] > git config --get commit.template [85ms]
-2025-09-22 11:18:25.548 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [95ms]
-2025-09-22 11:18:25.558 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 11:18:25.558 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [94ms]
-2025-09-22 11:18:25.637 [info] > git rev-parse refs/remotes/origin/main [79ms]
-2025-09-22 11:18:25.660 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [80ms]
-2025-09-22 11:18:25.669 [info] > git status -z -uall [99ms]
-2025-09-22 11:18:25.751 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [96ms]
-2025-09-22 11:18:26.213 [info] > git status -z -uall [567ms]
-2025-09-22 11:18:48.083 [info] > git config --get commit.template [84ms]
-2025-09-22 11:18:48.094 [info] > git config --get commit.template [85ms]
-2025-09-22 11:18:48.107 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [87ms]
-2025-09-22 11:18:48.116 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 11:18:48.117 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [87ms]
-2025-09-22 11:18:48.190 [info] > git rev-parse refs/remotes/origin/main [74ms]
-2025-09-22 11:18:48.212 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [75ms]
-2025-09-22 11:18:48.222 [info] > git status -z -uall [96ms]
-2025-09-22 11:18:48.282 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [72ms]
-2025-09-22 11:18:48.749 [info] > git status -z -uall [551ms]
-2025-09-22 11:23:06.187 [info] > git config --get commit.template [90ms]
-2025-09-22 11:23:06.193 [info] > git config --get commit.template [85ms]
-2025-09-22 11:23:06.206 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [87ms]
-2025-09-22 11:23:06.215 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 11:23:06.225 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [94ms]
-2025-09-22 11:23:06.299 [info] > git rev-parse refs/remotes/origin/main [83ms]
-2025-09-22 11:23:06.331 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [87ms]
-2025-09-22 11:23:06.344 [info] > git status -z -uall [111ms]
-2025-09-22 11:23:06.404 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [83ms]
-2025-09-22 11:23:06.917 [info] > git status -z -uall [607ms]
-2025-09-22 11:23:11.451 [info] > git config --get commit.template [87ms]
-2025-09-22 11:23:11.463 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [88ms]
-2025-09-22 11:23:11.567 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [83ms]
-2025-09-22 11:23:11.574 [info] > git status -z -uall [101ms]
-2025-09-22 11:23:12.069 [info] > git config --get commit.template [80ms]
-2025-09-22 11:23:12.078 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [78ms]
-2025-09-22 11:23:12.087 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 11:23:12.161 [info] > git rev-parse refs/remotes/origin/main [74ms]
-2025-09-22 11:23:12.257 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [78ms]
-2025-09-22 11:23:12.772 [info] > git status -z -uall [603ms]
-2025-09-22 11:26:05.961 [info] > git config --get commit.template [85ms]
-2025-09-22 11:26:05.966 [info] > git config --get commit.template [80ms]
-2025-09-22 11:26:05.981 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/master refs/remotes/master [84ms]
-2025-09-22 11:26:06.000 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [92ms]
-2025-09-22 11:26:06.009 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 11:26:06.071 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [71ms]
-2025-09-22 11:26:06.081 [info] > git status -z -uall [91ms]
-2025-09-22 11:26:06.085 [info] > git rev-parse refs/remotes/origin/main [76ms]
-2025-09-22 11:26:06.172 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [69ms]
-2025-09-22 11:26:06.635 [info] > git status -z -uall [541ms]
-2025-09-22 12:57:04.954 [info] > git config --get commit.template [78ms]
-2025-09-22 12:57:04.965 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [72ms]
-2025-09-22 12:57:04.973 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 12:57:05.038 [info] > git rev-parse refs/remotes/origin/main [65ms]
-2025-09-22 12:57:05.127 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [71ms]
-2025-09-22 12:57:05.585 [info] > git status -z -uall [538ms]
-2025-09-22 12:57:08.237 [info] > git log --format=%H%n%aN%n%aE%n%at%n%ct%n%P%n%D%n%B -z --shortstat --diff-merges=first-parent -n50 --skip=0 --topo-order --decorate=full --stdin [436ms]
-2025-09-22 12:57:10.730 [info] > git config --get commit.template [76ms]
-2025-09-22 12:57:10.739 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [75ms]
-2025-09-22 12:57:10.748 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 12:57:10.815 [info] > git rev-parse refs/remotes/origin/main [68ms]
-2025-09-22 12:57:10.904 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [71ms]
-2025-09-22 12:57:11.360 [info] > git status -z -uall [536ms]
-2025-09-22 12:57:19.646 [info] > git -c user.useConfigOnly=true commit --quiet --allow-empty-message --file - [93ms]
-2025-09-22 12:57:19.646 [info] Author identity unknown
-
-*** Please tell me who you are.
-
-Run
-
-  git config --global user.email "you@example.com"
-  git config --global user.name "Your Name"
-
-to set your account's default identity.
-Omit --global to set the identity only in this repository.
-
-fatal: no email was given and auto-detection is disabled
-2025-09-22 12:57:19.723 [info] > git config --get-all user.name [67ms]
-2025-09-22 12:57:19.797 [info] > git config --get commit.template [66ms]
-2025-09-22 12:57:19.810 [info] > git for-each-ref --format=%(refname)%00%(upstream:short)%00%(objectname)%00%(upstream:track)%00%(upstream:remotename)%00%(upstream:remoteref) --ignore-case refs/heads/main refs/remotes/main [70ms]
-2025-09-22 12:57:19.819 [warning] [Git][revParse] Unable to read file: ENOENT: no such file or directory, open 'c:\Apps\quality-v2\.git\refs\remotes\origin\main'
-2025-09-22 12:57:19.886 [info] > git rev-parse refs/remotes/origin/main [67ms]
-2025-09-22 12:57:19.974 [info] > git for-each-ref --sort -committerdate --format %(refname)%00%(objectname)%00%(*objectname) [70ms]
-2025-09-22 12:57:20.438 [info] > git status -z -uall [544ms]
-2025-09-22 12:57:25.962 [info] > git ls-files --stage -- seed.sql [71ms]
-2025-09-22 12:57:26.053 [info] > git cat-file -s 97a384968f6f7a2cc9985624011606e0a9181847 [80ms]
-2025-09-22 12:57:26.172 [info] > git show --textconv :seed.sql [83ms]-- Use your database
+-- Use your database
 -- USE quality;
 
 -- Clear existing data (optional, but good for a clean seed)
@@ -697,25 +14,28 @@ INSERT INTO model_numbers (model_type, part_number, description, is_active) VALU
 ('Microphone', 'X-MIC-PRO', 'Studio Quality Condenser Microphone', TRUE),
 ('Power Supply', 'PSU-12V-5A', '12 Volt, 5 Amp Power Supply Unit', FALSE);
 
--- Seed a shipment
-INSERT INTO shipments (customer_name, job_number, shipping_date, qc_name, status) VALUES
-('Global Tech Inc.', 'GT-9501-A', '2025-07-20', 'John Doe', 'Completed');
-
--- Get the ID of the shipment we just created
-SET @last_shipment_id = LAST_INSERT_ID();
-
--- Seed some units for that shipment
-INSERT INTO shipped_units (shipment_id, model_type, part_number, serial_number, first_test_pass, retest_reason) VALUES
-(@last_shipment_id, 'Scanner', 'SCN-2024-A', 'SN-SCN-001', TRUE, NULL),
-(@last_shipment_id, 'Scanner', 'SCN-2024-A', 'SN-SCN-002', TRUE, NULL),
-(@last_shipment_id, 'Camera', 'CAM-HD-PRO-V2', 'SN-CAM-101', FALSE, 'tuning'),
-(@last_shipment_id, 'Camera', 'CAM-HD-PRO-V2', 'SN-CAM-102', TRUE, NULL);
+-- Seed a shipment and its units. Units carry their shipment's shipping_date
+-- (the partition key, NOT NULL since migration 0005).
+WITH shipment AS (
+    INSERT INTO shipments (customer_name, job_number, shipping_date, qc_name, status) VALUES
+    ('Global Tech Inc.', 'GT-9501-A', '2025-07-20', 'John Doe', 'Completed')
+    RETURNING id, shipping_date
+)
+INSERT INTO shipped_units (shipment_id, shipping_date, model_type, part_number, serial_number, first_test_pass, retest_reason)
+SELECT shipment.id, shipment.shipping_date, unit.model_type, unit.part_number, unit.serial_number, unit.first_test_pass, unit.retest_reason
+FROM shipment CROSS JOIN (VALUES
+    ('Scanner', 'SCN-2024-A', 'SN-SCN-001', TRUE, NULL),
+    ('Scanner', 'SCN-2024-A', 'SN-SCN-002', TRUE, NULL),
+    ('Camera', 'CAM-HD-PRO-V2', 'SN-CAM-101', FALSE, 'tuning'),
+    ('Camera', 'CAM-HD-PRO-V2', 'SN-CAM-102', TRUE, NULL)
+) AS unit (model_type, part_number, serial_number, first_test_pass, retest_reason);
 
 -- Seed another shipment
-INSERT INTO shipments (customer_name, job_number, shipping_date, qc_name, status) VALUES
-('Innovate Solutions', 'IS-2025-03', CURDATE(), 'Jane Smith', 'In Progress');
-
-SET @last_shipment_id = LAST_INSERT_ID();
-
-INSERT INTO shipped_units (shipment_id, model_type, part_number, serial_number, first_test_pass, retest_reason) VALUES
-(@last_shipment_id, 'Microphone', 'X-MIC-PRO', 'SN-MIC-550', TRUE, NULL);
\ No newline at end of file
+WITH shipment AS (
+    INSERT INTO shipments (customer_name, job_number, shipping_date, qc_name, status) VALUES
+    ('Innovate Solutions', 'IS-2025-03', CURRENT_DATE, 'Jane Smith', 'In Progress')
+    RETURNING id, shipping_date
+)
+INSERT INTO shipped_units (shipment_id, shipping_date, model_type, part_number, serial_number, first_test_pass, retest_reason)
+SELECT shipment.id, shipment.shipping_date, 'Microphone', 'X-MIC-PRO', 'SN-MIC-550', TRUE, NULL
+FROM shipment;
@@ -5,4 +5,9 @@ cd /d c:\Apps\quality-v3\backend
 echo Activating virtual environment...
 call .\venv\Scripts\activate.bat
 echo Starting server on http://10.0.10.84:5000
-waitress-serve --host 10.0.10.84 --port 5000 run:app
+rem Admission limits are sized from the same thread count.
+rem Each browser holds one live-update stream (one thread), however many tabs
+rem it has open: keep ADMISSION_STREAM_LIMIT at or above the number of stations.
+set ADMISSION_THREADS=24
+set ADMISSION_STREAM_LIMIT=8
+waitress-serve --host 10.0.10.84 --port 5000 --threads %ADMISSION_THREADS% run:app